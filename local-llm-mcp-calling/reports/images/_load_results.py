@@ -1,16 +1,17 @@
 """
 Shared data loader for benchmark graph scripts.
 
-Loads result JSON files from v1_singleshot and v2_agentic runs,
-builds a unified data structure for the graph generators.
+Loads result files from v1_singleshot and v2_agentic runs through the
+results warehouse (scripts/_warehouse.py), builds a unified data structure
+for the graph generators.
 
 Usage:
     from _load_results import load_results
     data = load_results()       # uses latest run
     data = load_results("20250224_120000")  # specific run
+    m    = build_matrices(data)             # NumPy arrays for the graph scripts
 """
 
-import json
 import os
 import re
 import sys
@@ -20,6 +21,10 @@ from pathlib import Path
 # Relative path from reports/images/ to results/
 RESULTS_BASE = Path(__file__).parent / ".." / ".." / "results"
 
+# Result files are read through the warehouse in scripts/
+sys.path.insert(0, str(Path(__file__).parent / ".." / ".." / "scripts"))
+from _warehouse import Warehouse
+
 METHODOLOGY_DIRS = {
     "ss": "v1_singleshot",
     "ag": "v2_agentic",
@@ -135,7 +140,8 @@ def load_results(run_timestamp: str = None) -> dict | None:
                     'label': str,           # formatted label for bar charts
                     'short_label': str,      # formatted label for scatter plots
                     'ss': {                  # single-shot methodology
-                        0: {'pass_rate': float, 'avg_score': float, 'total': int, 'passed': int},
+                        0: {'pass_rate': float, 'avg_score': float, 'total': int, 'passed': int,
+                            'task_scores': {task_id: float}},
                         1: {...},
                         2: {...},
                     },
@@ -157,8 +163,7 @@ def load_results(run_timestamp: str = None) -> dict | None:
         print(f"Error: Results directory not found: {results_base}", file=sys.stderr)
         return None
 
-    models = {}
-
+    run_dirs = {}
     for method_key, dir_name in METHODOLOGY_DIRS.items():
         method_dir = results_base / dir_name
         if not method_dir.is_dir():
@@ -167,24 +172,19 @@ def load_results(run_timestamp: str = None) -> dict | None:
         run_dir = _find_run_dir(method_dir, run_timestamp)
         if run_dir is None:
             continue
+        run_dirs[method_key] = run_dir
 
-        # Load all JSON files from this run
-        json_files = sorted(run_dir.glob("*.json"))
-        for jf in json_files:
-            try:
-                with open(jf) as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Warning: Failed to load {jf}: {e}", file=sys.stderr)
-                continue
-
-            model_name = data.get("model", "")
-            level = data.get("level")
-            tool_trained = data.get("tool_trained", True)
-            summary = data.get("summary", {})
+    models = {}
+    by_file = {}   # file id -> its level entry, to attach task scores
+    warehouse = Warehouse()
+    warehouse.ingest(list(run_dirs.values()))
 
-            if not model_name or level is None:
-                continue
+    for method_key, run_dir in run_dirs.items():
+        # All result files from this run, in file name order
+        for f in warehouse.files([run_dir]):
+            model_name = f["model"]
+            level = f["level"]
+            tool_trained = bool(f["tool_trained"])
 
             if model_name not in models:
                 models[model_name] = {
@@ -197,12 +197,16 @@ def load_results(run_timestamp: str = None) -> dict | None:
                     "ag_overall": 0.0,
                 }
 
-            models[model_name][method_key][level] = {
-                "pass_rate": summary.get("pass_rate", 0.0),
-                "avg_score": summary.get("avg_score", 0.0),
-                "total": summary.get("total", 0),
-                "passed": summary.get("passed", 0),
+            models[model_name][method_key][level] = by_file[f["id"]] = {
+                "pass_rate": f["pass_rate"] or 0.0,
+                "avg_score": f["avg_score"] or 0.0,
+                "total": f["total"] or 0,
+                "passed": f["passed"] or 0,
+                "task_scores": {},
             }
+    for row in warehouse.task_results(list(by_file)):
+        by_file[row["file_id"]]["task_scores"][row["task_id"]] = row["score"]
+    warehouse.close()
 
     if not models:
         print("Error: No result JSON files found in any run directory.", file=sys.stderr)
@@ -228,6 +232,46 @@ def load_results(run_timestamp: str = None) -> dict | None:
     }
 
 
+def build_matrices(data: dict) -> dict:
+    """
+    NumPy views of load_results() output, rows in sorted_models order.
+
+    Returns:
+        Dictionary with keys:
+            'keys':         [model_name, ...]     # sorted_models
+            'labels':       [str, ...]            # bar-chart label per model
+            'tool_trained': bool array (n,)
+            'avg_score':    float array (n, 2, 3) # model × methodology (ss, ag) × level, in %
+            'pass_rate':    float array (n, 2, 3) # same layout; 0 where a level is missing
+            'overall':      float array (n, 2)    # ss_overall, ag_overall
+    """
+    import numpy as np
+
+    models  = data["models"]
+    methods = list(METHODOLOGY_DIRS)
+    n       = len(data["sorted_models"])
+
+    avg_score = np.zeros((n, len(methods), 3))
+    pass_rate = np.zeros((n, len(methods), 3))
+    overall   = np.zeros((n, len(methods)))
+    for i, m in enumerate(data["sorted_models"]):
+        md = models[m]
+        for k, method in enumerate(methods):
+            for level, stats in md[method].items():
+                avg_score[i, k, level] = stats["avg_score"]
+                pass_rate[i, k, level] = stats["pass_rate"]
+            overall[i, k] = md[f"{method}_overall"]
+
+    return {
+        "keys":         list(data["sorted_models"]),
+        "labels":       [models[m]["label"] for m in data["sorted_models"]],
+        "tool_trained": np.array([models[m]["tool_trained"] for m in data["sorted_models"]], dtype=bool),
+        "avg_score":    avg_score * 100,
+        "pass_rate":    pass_rate * 100,
+        "overall":      overall,
+    }
+
+
 def parse_run_arg() -> str | None:
     """Parse --run TIMESTAMP from sys.argv."""
     args = sys.argv[1:]
@@ -0,0 +1,61 @@
+"""
+Render all five report graphs in one process.
+
+Results are loaded from the warehouse once and turned into NumPy matrices
+(model × methodology × level) once; every gen_graph*.py script then draws
+from the same arrays instead of each re-loading the results and re-walking
+the per-model dictionaries. With --jobs N the figures are drawn in a pool of
+N processes, one figure per task.
+
+Usage:
+    python render_all.py                        # latest run, all graphs
+    python render_all.py --run 20250224_120000  # specific run
+    python render_all.py --jobs 5               # one process per figure
+"""
+
+import argparse
+import importlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from _load_results import build_matrices, load_from_cli
+
+OUT_DIR = Path(__file__).parent
+
+GRAPHS = [
+    "gen_graph1_ss_vs_ag",
+    "gen_graph2_level_breakdown",
+    "gen_graph3_control_vs_trained",
+    "gen_graph4_agentic_lift",
+    "gen_graph5_heatmap",
+]
+
+
+def render_one(module: str, mat: dict, out_dir: Path) -> Path:
+    return importlib.import_module(module).render(mat, out_dir)
+
+
+def render_all(mat: dict, out_dir: Path = OUT_DIR, jobs: int = 1) -> list[Path]:
+    """Render every graph from one build_matrices() result; returns the PNG paths."""
+    if jobs <= 1:
+        return [render_one(g, mat, out_dir) for g in GRAPHS]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(GRAPHS))) as pool:
+        return list(pool.map(render_one, GRAPHS, [mat] * len(GRAPHS), [out_dir] * len(GRAPHS)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all report graphs")
+    parser.add_argument("--run", help="Run timestamp (e.g., 20250224_120000). Default: latest.")
+    parser.add_argument("--jobs", type=int, default=1, help="Processes to render with (default: 1)")
+    parser.add_argument("--out-dir", type=Path, default=OUT_DIR, help=f"Output directory (default: {OUT_DIR})")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    mat   = build_matrices(load_from_cli())   # reads --run from sys.argv
+    paths = render_all(mat, args.out_dir, args.jobs)
+    print(f"Rendered {len(paths)} graphs in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,13 +12,18 @@ Usage:
 """
 
 import json
-import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add images/ to path so we can import _load_results
 sys.path.insert(0, str(Path(__file__).parent / "images"))
-from _load_results import load_results, parse_run_arg
+from _load_results import build_matrices, load_results, parse_run_arg
+from _ranking_stats import CONFIDENCE, N_RESAMPLES, SEED, ranking_uncertainty
+
+SS, AG  = 0, 1      # methodology axis of build_matrices() arrays
+LEVELS  = (0, 1, 2)
 
 
 # --- Size tier definitions ---
@@ -115,19 +120,40 @@ def assign_tier(model_key: str, params_string: str) -> str:
     return tier_map.get(model_key, "Unknown")
 
 
-def r1(x: float) -> float:
-    """Round to 1 decimal place."""
-    return round(x, 1)
+def r1(x):
+    """Round to 1 decimal place, exactly like round(x, 1), for a number or an array."""
+    if np.ndim(x) == 0:
+        return round(float(x), 1)
+    x   = np.asarray(x, dtype=float)
+    out = np.round(x, 1)
+    # np.round scales by 10 before rounding, which can land a value just short of
+    # a .x5 tie on it; settle those few with the correctly-rounded round()
+    near_tie = np.abs((x * 10) % 1 - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        out.flat[i] = round(float(x.flat[i]), 1)
+    return out
 
 
-def std_dev(values: list[float]) -> float:
+def mean(values: np.ndarray, axis: int = 0) -> np.ndarray:
+    """
+    Mean along an axis, summed in row order. np.mean sums pairwise, which moves
+    the last bit of the total and flips .x5 ties under r1(); a running sum keeps
+    every published figure identical to adding the rows up one by one.
+    """
+    return np.cumsum(values, axis=axis).take(-1, axis=axis) / values.shape[axis]
+
+
+def std_dev(values: np.ndarray) -> float:
     """Sample standard deviation."""
-    n = len(values)
-    if n < 2:
+    if len(values) < 2:
         return 0.0
-    mean = sum(values) / n
-    variance = sum((x - mean) ** 2 for x in values) / (n - 1)
-    return math.sqrt(variance)
+    squares = (values - mean(values)) ** 2
+    return float(np.sqrt(np.cumsum(squares)[-1] / (len(values) - 1)))
+
+
+def ranks_with_ties(values: np.ndarray) -> np.ndarray:
+    """Competition ranks, highest first: equal values share a rank, the next rank skips (1, 2, 2, 4)."""
+    return (values[None, :] > values[:, None]).sum(axis=1) + 1
 
 
 def load_lmstudio_metadata() -> dict:
@@ -141,260 +167,165 @@ def load_lmstudio_metadata() -> dict:
 
 def compute_all_stats(data: dict, meta: dict) -> dict:
     """Compute every published statistic from raw data."""
-    models = data["models"]
-    sorted_models = data["sorted_models"]
+    mat = build_matrices(data)
+
+    # Rows in agentic ranking order: by rounded ag_overall, ties keep sorted_models order
+    order        = np.argsort(-r1(mat["overall"][:, AG]), kind="stable")
+    keys         = np.array(mat["keys"], dtype=object)[order]
+    tool_trained = mat["tool_trained"][order]
+    score        = r1(mat["avg_score"][order])   # model × (ss, ag) × level, %
+    pass_rate    = mat["pass_rate"][order]       # model × (ss, ag) × level, %, unrounded
+    overall      = r1(mat["overall"][order])     # model × (ss, ag)
+
+    short_names   = [k.split("/")[-1] for k in keys]
+    params_string = [meta.get(k, {}).get("params_string", "") for k in keys]
+    disk_gb       = r1(np.array([meta.get(k, {}).get("size_bytes", 0) for k in keys]) / (1024 ** 3))
 
     stats = {}
 
     # =========================================================================
     # §3.1 / §3.2: Per-model scores and rankings
     # =========================================================================
-    ag_rankings = []
-    ss_rankings = []
-
-    for model_key in sorted_models:
-        m = models[model_key]
-        short = model_key.split("/")[-1] if "/" in model_key else model_key
-
-        ag_l0 = r1(m["ag"].get(0, {}).get("avg_score", 0) * 100)
-        ag_l1 = r1(m["ag"].get(1, {}).get("avg_score", 0) * 100)
-        ag_l2 = r1(m["ag"].get(2, {}).get("avg_score", 0) * 100)
-        ag_overall = r1(m["ag_overall"])
-
-        ss_l0 = r1(m["ss"].get(0, {}).get("avg_score", 0) * 100)
-        ss_l1 = r1(m["ss"].get(1, {}).get("avg_score", 0) * 100)
-        ss_l2 = r1(m["ss"].get(2, {}).get("avg_score", 0) * 100)
-        ss_overall = r1(m["ss_overall"])
-
-        tool_trained = m["tool_trained"]
-
-        # Get metadata
-        model_meta = meta.get(model_key, {})
-        params_string = model_meta.get("params_string", "")
-        size_bytes = model_meta.get("size_bytes", 0)
-        disk_gb = r1(size_bytes / (1024 ** 3))
-
-        ag_rankings.append({
-            "model": model_key,
-            "short_name": short,
-            "params_string": params_string,
-            "disk_gb": disk_gb,
-            "tool_trained": tool_trained,
-            "ag_l0": ag_l0,
-            "ag_l1": ag_l1,
-            "ag_l2": ag_l2,
-            "ag_overall": ag_overall,
-            "ss_l0": ss_l0,
-            "ss_l1": ss_l1,
-            "ss_l2": ss_l2,
-            "ss_overall": ss_overall,
-        })
-
-    # Sort by ag_overall descending for rankings
-    ag_rankings.sort(key=lambda x: x["ag_overall"], reverse=True)
-
-    # Assign ranks with ties
-    rank = 1
-    for i, entry in enumerate(ag_rankings):
-        if i > 0 and ag_rankings[i - 1]["ag_overall"] != entry["ag_overall"]:
-            rank = i + 1
-        entry["ag_rank"] = rank
-
-    # Sort by ss_overall for SS rankings
-    ss_sorted = sorted(ag_rankings, key=lambda x: x["ss_overall"], reverse=True)
-    rank = 1
-    for i, entry in enumerate(ss_sorted):
-        if i > 0 and ss_sorted[i - 1]["ss_overall"] != entry["ss_overall"]:
-            rank = i + 1
-        entry["ss_rank"] = rank
-
-    stats["model_rankings"] = ag_rankings
+    ag_rank = ranks_with_ties(overall[:, AG])
+    ss_rank = ranks_with_ties(overall[:, SS])
+
+    stats["model_rankings"] = [
+        {
+            "model": keys[i],
+            "short_name": short_names[i],
+            "params_string": params_string[i],
+            "disk_gb": float(disk_gb[i]),
+            "tool_trained": bool(tool_trained[i]),
+            **{f"ag_l{level}": float(score[i, AG, level]) for level in LEVELS},
+            "ag_overall": float(overall[i, AG]),
+            **{f"ss_l{level}": float(score[i, SS, level]) for level in LEVELS},
+            "ss_overall": float(overall[i, SS]),
+            "ag_rank": int(ag_rank[i]),
+            "ss_rank": int(ss_rank[i]),
+        }
+        for i in range(len(keys))
+    ]
 
     # =========================================================================
     # §3.3: SS vs AG comparison - level means and lifts
     # =========================================================================
-    all_ag_l0 = [e["ag_l0"] for e in ag_rankings]
-    all_ag_l1 = [e["ag_l1"] for e in ag_rankings]
-    all_ag_l2 = [e["ag_l2"] for e in ag_rankings]
-    all_ss_l0 = [e["ss_l0"] for e in ag_rankings]
-    all_ss_l1 = [e["ss_l1"] for e in ag_rankings]
-    all_ss_l2 = [e["ss_l2"] for e in ag_rankings]
-    all_ag_overall = [e["ag_overall"] for e in ag_rankings]
-    all_ss_overall = [e["ss_overall"] for e in ag_rankings]
-
-    # Pass rates
-    all_ag_l0_pr = [models[e["model"]]["ag"].get(0, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-    all_ag_l1_pr = [models[e["model"]]["ag"].get(1, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-    all_ag_l2_pr = [models[e["model"]]["ag"].get(2, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-    all_ss_l0_pr = [models[e["model"]]["ss"].get(0, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-    all_ss_l1_pr = [models[e["model"]]["ss"].get(1, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-    all_ss_l2_pr = [models[e["model"]]["ss"].get(2, {}).get("pass_rate", 0) * 100 for e in ag_rankings]
-
-    level_comparison = {
-        "L0": {
-            "ss_score_mean": r1(sum(all_ss_l0) / len(all_ss_l0)),
-            "ag_score_mean": r1(sum(all_ag_l0) / len(all_ag_l0)),
-            "lift": r1(sum(all_ag_l0) / len(all_ag_l0) - sum(all_ss_l0) / len(all_ss_l0)),
-            "ss_pass_rate_mean": r1(sum(all_ss_l0_pr) / len(all_ss_l0_pr)),
-            "ag_pass_rate_mean": r1(sum(all_ag_l0_pr) / len(all_ag_l0_pr)),
-        },
-        "L1": {
-            "ss_score_mean": r1(sum(all_ss_l1) / len(all_ss_l1)),
-            "ag_score_mean": r1(sum(all_ag_l1) / len(all_ag_l1)),
-            "lift": r1(sum(all_ag_l1) / len(all_ag_l1) - sum(all_ss_l1) / len(all_ss_l1)),
-            "ss_pass_rate_mean": r1(sum(all_ss_l1_pr) / len(all_ss_l1_pr)),
-            "ag_pass_rate_mean": r1(sum(all_ag_l1_pr) / len(all_ag_l1_pr)),
-        },
-        "L2": {
-            "ss_score_mean": r1(sum(all_ss_l2) / len(all_ss_l2)),
-            "ag_score_mean": r1(sum(all_ag_l2) / len(all_ag_l2)),
-            "lift": r1(sum(all_ag_l2) / len(all_ag_l2) - sum(all_ss_l2) / len(all_ss_l2)),
-            "ss_pass_rate_mean": r1(sum(all_ss_l2_pr) / len(all_ss_l2_pr)),
-            "ag_pass_rate_mean": r1(sum(all_ag_l2_pr) / len(all_ag_l2_pr)),
-        },
+    score_mean = mean(score)       # (ss, ag) × level
+    pr_mean    = mean(pass_rate)
+    stats["level_comparison"] = {
+        f"L{level}": {
+            "ss_score_mean": r1(score_mean[SS, level]),
+            "ag_score_mean": r1(score_mean[AG, level]),
+            "lift": r1(score_mean[AG, level] - score_mean[SS, level]),
+            "ss_pass_rate_mean": r1(pr_mean[SS, level]),
+            "ag_pass_rate_mean": r1(pr_mean[AG, level]),
+        }
+        for level in LEVELS
     }
-    stats["level_comparison"] = level_comparison
 
     # Overall lift stats
-    lifts = [e["ag_overall"] - e["ss_overall"] for e in ag_rankings]
-    lifts_sorted = sorted(lifts)
-    n = len(lifts)
-    median_lift = lifts_sorted[n // 2] if n % 2 == 1 else (lifts_sorted[n // 2 - 1] + lifts_sorted[n // 2]) / 2
-
+    lifts = overall[:, AG] - overall[:, SS]
     stats["overall_lift"] = {
-        "mean": r1(sum(lifts) / len(lifts)),
-        "median": r1(median_lift),
+        "mean": r1(mean(lifts)),
+        "median": r1(np.median(lifts)),
     }
 
     # Per-model lift table (sorted by magnitude descending)
-    per_model_lift = []
-    for e in ag_rankings:
-        lift = r1(e["ag_overall"] - e["ss_overall"])
-        per_model_lift.append({
-            "model": e["model"],
-            "short_name": e["short_name"],
-            "ss_overall": e["ss_overall"],
-            "ag_overall": e["ag_overall"],
-            "lift": lift,
-        })
-    per_model_lift.sort(key=lambda x: x["lift"], reverse=True)
-    stats["per_model_lift"] = per_model_lift
+    lift_r1 = r1(lifts)
+    stats["per_model_lift"] = [
+        {
+            "model": keys[i],
+            "short_name": short_names[i],
+            "ss_overall": float(overall[i, SS]),
+            "ag_overall": float(overall[i, AG]),
+            "lift": float(lift_r1[i]),
+        }
+        for i in np.argsort(-lift_r1, kind="stable")
+    ]
 
     # =========================================================================
     # §3.4: Per-level analysis
     # =========================================================================
-    ag_l0_100_count = sum(1 for x in all_ag_l0 if x == 100.0)
-    ag_l1_100_count = sum(1 for x in all_ag_l1 if x == 100.0)
-
-    ag_l1_sorted = sorted(all_ag_l1)
-    ag_l2_sorted = sorted(all_ag_l2)
-    ag_l1_median = ag_l1_sorted[n // 2] if n % 2 == 1 else (ag_l1_sorted[n // 2 - 1] + ag_l1_sorted[n // 2]) / 2
-    ag_l2_median = ag_l2_sorted[n // 2] if n % 2 == 1 else (ag_l2_sorted[n // 2 - 1] + ag_l2_sorted[n // 2]) / 2
-
-    ag_l2_range = r1(max(all_ag_l2) - min(all_ag_l2))
-    ag_l2_above_85 = sum(1 for x in all_ag_l2 if x > 85.0)
-
-    # L2 SS pass rate
-    l2_ss_pass_rate_mean = r1(sum(all_ss_l2_pr) / len(all_ss_l2_pr))
-
-    # Which models pass any L2 in single-shot?
-    l2_ss_passers = []
-    for e in ag_rankings:
-        m = models[e["model"]]
-        ss_l2_pr = m["ss"].get(2, {}).get("pass_rate", 0) * 100
-        if ss_l2_pr > 0:
-            l2_ss_passers.append({
-                "model": e["model"],
-                "short_name": e["short_name"],
-                "ss_l2_pass_rate": r1(ss_l2_pr),
-            })
-
+    ag_l2    = score[:, AG, 2]
+    ss_l2_pr = pass_rate[:, SS, 2]
     stats["per_level_analysis"] = {
-        "ag_l0_100_count": ag_l0_100_count,
-        "ag_l1_100_count": ag_l1_100_count,
-        "ag_l1_median": r1(ag_l1_median),
-        "ag_l2_median": r1(ag_l2_median),
-        "ag_l2_range_pp": ag_l2_range,
-        "ag_l2_above_85_count": ag_l2_above_85,
-        "l2_ss_pass_rate_mean": l2_ss_pass_rate_mean,
-        "l2_ss_passers": l2_ss_passers,
+        "ag_l0_100_count": int((score[:, AG, 0] == 100.0).sum()),
+        "ag_l1_100_count": int((score[:, AG, 1] == 100.0).sum()),
+        "ag_l1_median": r1(np.median(score[:, AG, 1])),
+        "ag_l2_median": r1(np.median(ag_l2)),
+        "ag_l2_range_pp": r1(np.ptp(ag_l2)),
+        "ag_l2_above_85_count": int((ag_l2 > 85.0).sum()),
+        "l2_ss_pass_rate_mean": r1(pr_mean[SS, 2]),
+        # Which models pass any L2 in single-shot?
+        "l2_ss_passers": [
+            {
+                "model": keys[i],
+                "short_name": short_names[i],
+                "ss_l2_pass_rate": r1(ss_l2_pr[i]),
+            }
+            for i in np.flatnonzero(ss_l2_pr > 0)
+        ],
     }
 
     # =========================================================================
     # §3.5 / §4.3: Tool-trained vs control group
     # =========================================================================
-    tool_trained_ag = [e["ag_overall"] for e in ag_rankings if e["tool_trained"]]
-    control_ag = [e["ag_overall"] for e in ag_rankings if not e["tool_trained"]]
-    tool_trained_ss = [e["ss_overall"] for e in ag_rankings if e["tool_trained"]]
-    control_ss = [e["ss_overall"] for e in ag_rankings if not e["tool_trained"]]
+    def group(mask):
+        ag, ss = overall[mask, AG], overall[mask, SS]
+        return {
+            "n": int(mask.sum()),
+            "ag_mean": r1(mean(ag)),
+            "ag_range_min": r1(ag.min()),
+            "ag_range_max": r1(ag.max()),
+            "ag_std_dev": r1(std_dev(ag)),
+            "ss_mean": r1(mean(ss)),
+        }
 
+    group_mean = np.array([mean(overall[tool_trained]), mean(overall[~tool_trained])])
     stats["tool_trained_vs_control"] = {
-        "tool_trained": {
-            "n": len(tool_trained_ag),
-            "ag_mean": r1(sum(tool_trained_ag) / len(tool_trained_ag)),
-            "ag_range_min": r1(min(tool_trained_ag)),
-            "ag_range_max": r1(max(tool_trained_ag)),
-            "ag_std_dev": r1(std_dev(tool_trained_ag)),
-            "ss_mean": r1(sum(tool_trained_ss) / len(tool_trained_ss)),
-        },
-        "control": {
-            "n": len(control_ag),
-            "ag_mean": r1(sum(control_ag) / len(control_ag)),
-            "ag_range_min": r1(min(control_ag)),
-            "ag_range_max": r1(max(control_ag)),
-            "ag_std_dev": r1(std_dev(control_ag)),
-            "ss_mean": r1(sum(control_ss) / len(control_ss)),
-        },
-        "ag_delta": r1(sum(tool_trained_ag) / len(tool_trained_ag) - sum(control_ag) / len(control_ag)),
-        "ss_delta": r1(sum(tool_trained_ss) / len(tool_trained_ss) - sum(control_ss) / len(control_ss)),
+        "tool_trained": group(tool_trained),
+        "control": group(~tool_trained),
+        "ag_delta": r1(group_mean[0, AG] - group_mean[1, AG]),
+        "ss_delta": r1(group_mean[0, SS] - group_mean[1, SS]),
     }
 
     # =========================================================================
     # §3.6: Size tiers
     # =========================================================================
-    tiers = {}
-    for e in ag_rankings:
-        tier = assign_tier(e["model"], e.get("params_string", ""))
-        if tier not in tiers:
-            tiers[tier] = []
-        tiers[tier].append(e)
-
+    tiers = np.array([assign_tier(k, p) for k, p in zip(keys, params_string)])
     tier_stats = {}
     tier_order = ["Tiny (3-4B)", "Small (7-9.4B)", "Medium (12-15B)",
                   "Large (20-24B)", "XL (30-36B)", "XXL (80B)"]
     for tier_name in tier_order:
-        entries = tiers.get(tier_name, [])
-        if not entries:
+        mask = tiers == tier_name
+        if not mask.any():
             continue
-        scores = [e["ag_overall"] for e in entries]
+        scores = overall[mask, AG]
         tier_stats[tier_name] = {
-            "n": len(entries),
-            "models": [e["short_name"] for e in entries],
-            "ag_mean": r1(sum(scores) / len(scores)),
-            "ag_range_min": r1(min(scores)),
-            "ag_range_max": r1(max(scores)),
+            "n": int(mask.sum()),
+            "models": [short_names[i] for i in np.flatnonzero(mask)],
+            "ag_mean": r1(mean(scores)),
+            "ag_range_min": r1(scores.min()),
+            "ag_range_max": r1(scores.max()),
         }
     stats["size_tiers"] = tier_stats
 
     # =========================================================================
     # qwen3-4b "outperforms" analysis
     # =========================================================================
-    qwen3_4b_score = None
-    for e in ag_rankings:
-        if "qwen3-4b-thinking" in e["model"]:
-            qwen3_4b_score = e["ag_overall"]
-            break
-
-    if qwen3_4b_score is not None:
-        beaten_models = []
-        for e in ag_rankings:
-            if e["ag_overall"] < qwen3_4b_score and e["model"] != "qwen/qwen3-4b-thinking-2507":
-                beaten_models.append({
-                    "model": e["model"],
-                    "short_name": e["short_name"],
-                    "params_string": e["params_string"],
-                    "ag_overall": e["ag_overall"],
-                })
+    qwen3_4b = next((i for i, k in enumerate(keys) if "qwen3-4b-thinking" in k), None)
+
+    if qwen3_4b is not None:
+        qwen3_4b_score = float(overall[qwen3_4b, AG])
+        beaten = np.flatnonzero((overall[:, AG] < qwen3_4b_score) & (keys != "qwen/qwen3-4b-thinking-2507"))
+        beaten_models = [
+            {
+                "model": keys[i],
+                "short_name": short_names[i],
+                "params_string": params_string[i],
+                "ag_overall": float(overall[i, AG]),
+            }
+            for i in beaten
+        ]
 
         # Compute param ratios for beaten models
         param_ratios = []
@@ -423,31 +354,57 @@ def compute_all_stats(data: dict, meta: dict) -> dict:
     # =========================================================================
     # Disk sizes from size_bytes
     # =========================================================================
-    disk_sizes = {}
-    for e in ag_rankings:
-        model_meta = meta.get(e["model"], {})
-        size_bytes = model_meta.get("size_bytes", 0)
-        disk_sizes[e["model"]] = r1(size_bytes / (1024 ** 3))
-    stats["disk_sizes_gb"] = disk_sizes
+    stats["disk_sizes_gb"] = dict(zip(keys, disk_gb.tolist()))
 
     # =========================================================================
     # Models exceeding 85% overall in agentic
     # =========================================================================
-    above_85_ag = sum(1 for e in ag_rankings if e["ag_overall"] >= 85.0)
-    stats["models_above_85_ag"] = above_85_ag
+    stats["models_above_85_ag"] = int((overall[:, AG] >= 85.0).sum())
 
     # =========================================================================
     # §4.1: Improvement ratio for qwen3-4b-thinking
     # =========================================================================
-    for e in ag_rankings:
-        if "qwen3-4b-thinking" in e["model"]:
-            if e["ss_overall"] > 0:
-                stats["qwen3_4b_improvement_ratio"] = r1(e["ag_overall"] / e["ss_overall"])
-            break
+    if qwen3_4b is not None and overall[qwen3_4b, SS] > 0:
+        stats["qwen3_4b_improvement_ratio"] = r1(overall[qwen3_4b, AG] / overall[qwen3_4b, SS])
+
+    # =========================================================================
+    # Ranking uncertainty: bootstrap CIs over tasks, permutation test vs next rank
+    # =========================================================================
+    ss_order = keys[np.argsort(-overall[:, SS], kind="stable")]
+    stats["ranking_uncertainty"] = {
+        "n_resamples": N_RESAMPLES,
+        "confidence": CONFIDENCE,
+        "seed": SEED,
+        "ag": ranking_intervals(data, list(keys), "ag"),
+        "ss": ranking_intervals(data, list(ss_order), "ss"),
+    }
 
     return stats
 
 
+def ranking_intervals(data: dict, ranked: list[str], method: str) -> list[dict]:
+    """ranking_uncertainty() for one methodology, in percent."""
+    models = data["models"]
+    scores = {m: {level: d["task_scores"] for level, d in models[m][method].items()} for m in ranked}
+
+    def interval(v):
+        return {"score": r1(v[0] * 100), "ci_low": r1(v[1] * 100), "ci_high": r1(v[2] * 100)}
+
+    return [
+        {
+            "model": row["model"],
+            **interval(row["overall"]),
+            "levels": {f"L{level}": interval(v) for level, v in row["levels"].items()},
+            "vs_next": row["vs_next"] and {
+                "model": row["vs_next"]["model"],
+                "delta": r1(row["vs_next"]["delta"] * 100),
+                "p_value": round(row["vs_next"]["p_value"], 4),
+            },
+        }
+        for row in ranking_uncertainty(scores, ranked)
+    ]
+
+
 def print_summary(stats: dict):
     """Print a human-readable summary of all computed statistics."""
     print("=" * 80)
@@ -531,6 +488,14 @@ def print_summary(stats: dict):
     if "qwen3_4b_improvement_ratio" in stats:
         print(f"\n--- §4.1 qwen3-4b improvement ratio (AG/SS): {stats['qwen3_4b_improvement_ratio']}x ---")
 
+    # Ranking uncertainty
+    ru = stats["ranking_uncertainty"]
+    print(f"\n--- Ranking Uncertainty ({ru['confidence']:.0%} bootstrap CI, {ru['n_resamples']} resamples) ---")
+    for e in ru["ag"]:
+        nxt = e["vs_next"]
+        vs = f"  vs next: {nxt['delta']:+.1f}pp, p={nxt['p_value']:.3f}" if nxt else ""
+        print(f"  {e['model'].split('/')[-1]:<40} AG {e['score']:>5.1f}  [{e['ci_low']:>5.1f}, {e['ci_high']:>5.1f}]{vs}")
+
     # Disk sizes
     print("\n--- Disk Sizes (GB) ---")
     for model, gb in stats["disk_sizes_gb"].items():
@@ -0,0 +1,472 @@
+"""
+In-process stand-in for the Workunit MCP server.
+
+Implements the tools the runners declare in TOOLS (plus delete_asset and
+directory, which reset_benchmark_env uses) on top of in-memory tables.
+Responses follow the shapes the real server returns — {"project": {...}},
+{"workunit": {...}}, 32-char hex IDs, {"error": "..."} results for bad input —
+so extract_ids_from_result, seed_l2_fixtures and reset_benchmark_env run
+against it unchanged. With no network or database in the loop, the
+remaining time in a run is the harness and the model.
+
+Usage:
+    from _fake_workunit import FakeWorkunitServer
+    server = FakeWorkunitServer()
+    response = server.handle({"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                              "params": {"name": "ping", "arguments": {}}})
+"""
+
+import json
+import re
+import threading
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+
+
+USER = {
+    "authenticated_via": "fake",
+    "client_id": "fake-workunit",
+    "display_name": "Benchmark",
+    "email": "benchmark@example.com",
+    "scopes": ["read", "write", "mcp:tools"],
+}
+
+# Fields each update_* tool may change through update_mask.paths
+UPDATABLE = {
+    "project":  {"name", "description", "status", "tags", "repo_url", "default_branch", "owner_id"},
+    "workunit": {"name", "description", "problem_statement", "success_criteria", "priority", "status",
+                 "tags", "completion_notes", "archive_reason", "due_date", "owner_id", "project_id"},
+    "task":     {"title", "description", "status", "priority", "tags", "assigned_to", "due_date",
+                 "estimated_hours"},
+    "asset":    {"name", "description", "status", "tags", "category", "lifecycle_stage", "format",
+                 "content", "content_url", "criticality", "location", "asset_subtype",
+                 "availability_status", "workload_percent", "directory_id"},
+}
+
+WORD_RE = re.compile(r"\w+")
+
+
+class ToolError(Exception):
+    """Tool-level failure, returned to the caller as {"error": message}."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _check_id(kind: str, value) -> str:
+    """Validate an ID the way the real server does and return it normalized."""
+    value = value if isinstance(value, str) else ""
+    try:
+        return uuid.UUID(value).hex
+    except ValueError:
+        raise ToolError(f"invalid {kind} ID: invalid UUID format: invalid UUID length: {len(value)}")
+
+
+def _page(rows: list, args: dict, default_size: int = 50, max_size: int = 100) -> tuple[list, dict]:
+    """Slice rows for page_size/page_number and return (page, paging fields)."""
+    size   = min(max(int(args.get("page_size") or default_size), 1), max_size)
+    number = max(int(args.get("page_number") or 1), 1)
+    pages  = (len(rows) + size - 1) // size
+    info   = {
+        "page_number":   number,
+        "page_size":     size,
+        "total_count":   len(rows),
+        "total_pages":   pages,
+        "has_next_page": number < pages,
+        "has_prev_page": number > 1,
+    }
+    return rows[(number - 1) * size: number * size], info
+
+
+class FakeWorkunitServer:
+    """
+    Stateful fake MCP server. Thread-safe; one instance is meant to be shared
+    by every MCPClient in the process, like a real server would be.
+    """
+
+    def __init__(self):
+        self.lock    = threading.Lock()
+        self.org_id  = _new_id()
+        self.user_id = _new_id()
+        self.reset()
+
+    def reset(self):
+        """Drop all data (the org and user IDs stay the same)."""
+        self.projects    = {}
+        self.workunits   = {}
+        self.tasks       = {}
+        self.assets      = {}
+        self.atoms       = {}
+        self.directories = {}
+        # Secondary indexes: parent ID -> {child ID: None} (insertion-ordered sets)
+        self.workunits_by_project = defaultdict(dict)
+        self.tasks_by_workunit    = defaultdict(dict)
+        self.atoms_by_workunit    = defaultdict(dict)
+        self.assets_by_project    = defaultdict(dict)   # project ID -> {asset ID: notes}
+        # Search index: lowercase word -> {(result type, ID)}, and its reverse
+        self.words     = defaultdict(set)
+        self.doc_words = {}
+
+    # ── JSON-RPC ────────────────────────────────────────────────────────────
+
+    def handle(self, request: dict) -> dict:
+        """Answer one JSON-RPC request body with a JSON-RPC response body."""
+        reply  = {"jsonrpc": "2.0", "id": request.get("id")}
+        method = request.get("method")
+        if method == "initialize":
+            reply["result"] = {
+                "protocolVersion": "2024-11-05",
+                "capabilities":    {"tools": {}},
+                "serverInfo":      {"name": "fake-workunit", "version": "1.0"},
+            }
+            return reply
+        if method != "tools/call":
+            reply["error"] = {"code": -32601, "message": f"method not found: {method}"}
+            return reply
+
+        params    = request.get("params", {})
+        name      = params.get("name", "")
+        arguments = params.get("arguments") or {}
+        tool      = getattr(self, f"_tool_{name}", None)
+        if tool is None:
+            reply["error"] = {"code": -32602, "message": f"unknown tool: {name}"}
+            return reply
+        try:
+            with self.lock:
+                result = tool(arguments)
+        except ToolError as e:
+            result = {"error": str(e)}
+        except (TypeError, ValueError, KeyError) as e:
+            result = {"error": f"{name} failed: invalid arguments: {e}"}
+        reply["result"] = {
+            "content": [{"type": "text", "text": json.dumps(result, sort_keys=True, separators=(",", ":"))}],
+            "isError": "error" in result,
+        }
+        return reply
+
+    # ── Table helpers ───────────────────────────────────────────────────────
+
+    def _get(self, table: dict, kind: str, value) -> dict:
+        entity_id = _check_id(kind, value)
+        if entity_id not in table:
+            raise ToolError(f"get {kind} failed: {kind} not found")
+        return table[entity_id]
+
+    def _index(self, result_type: str, row: dict, text_fields: tuple):
+        key   = (result_type, row["id"])
+        words = set(WORD_RE.findall(" ".join(str(row.get(f) or "") for f in text_fields).lower()))
+        self.doc_words[key] = words
+        for word in words:
+            self.words[word].add(key)
+
+    def _unindex(self, result_type: str, entity_id: str):
+        key = (result_type, entity_id)
+        for word in self.doc_words.pop(key, ()):
+            self.words[word].discard(key)
+
+    def _new_row(self, args: dict, fields: set, **extra) -> dict:
+        now = _now()
+        row = {k: args[k] for k in fields if args.get(k) not in (None, "")}
+        row.update({
+            "id":              _new_id(),
+            "organization_id": self.org_id,
+            "created_at":      now,
+            "created_by":      self.user_id,
+            "updated_at":      now,
+            "is_active":       True,
+        })
+        row.update(extra)
+        return row
+
+    def _apply_mask(self, kind: str, row: dict, args: dict):
+        paths = (args.get("update_mask") or {}).get("paths") or []
+        if not paths:
+            raise ToolError(f"update {kind} failed: update_mask.paths is required")
+        unknown = [p for p in paths if p not in UPDATABLE[kind]]
+        if unknown:
+            raise ToolError(f"update {kind} failed: unknown field in update_mask: {unknown[0]}")
+        for p in paths:
+            if p in args:
+                row[p] = args[p]
+        row["updated_at"] = _now()
+
+    def _project_view(self, p: dict) -> dict:
+        return {**p, "workunit_count": len(self.workunits_by_project[p["id"]])}
+
+    def _workunit_view(self, w: dict) -> dict:
+        tasks = [self.tasks[t] for t in self.tasks_by_workunit[w["id"]]]
+        linked = len(self.assets_by_project[w["project_id"]]) if w.get("project_id") else 0
+        return {
+            **w,
+            "total_tasks":         len(tasks),
+            "completed_tasks":     sum(1 for t in tasks if t.get("status") == "done"),
+            "linked_assets_count": linked,
+        }
+
+    def _delete_workunit(self, workunit_id: str):
+        w = self.workunits.pop(workunit_id)
+        self._unindex("workunit", workunit_id)
+        self.workunits_by_project[w.get("project_id", "")].pop(workunit_id, None)
+        for t in self.tasks_by_workunit.pop(workunit_id, {}):
+            self.tasks.pop(t, None)
+            self._unindex("task", t)
+        for a in self.atoms_by_workunit.pop(workunit_id, {}):
+            self.atoms.pop(a, None)
+
+    # ── Tools ───────────────────────────────────────────────────────────────
+
+    def _tool_ping(self, args):
+        return {"message": args.get("message", ""), "status": "pong", "timestamp": _now()}
+
+    def _tool_get_authenticated_user(self, args):
+        return {**USER, "user_id": self.user_id}
+
+    def _tool_create_project(self, args):
+        if not args.get("name"):
+            raise ToolError("create project failed: name is required")
+        row = self._new_row(args, UPDATABLE["project"], owner_id=args.get("owner_id") or self.user_id)
+        row.setdefault("status", "planning")
+        row.setdefault("default_branch", "main")
+        row.pop("is_active")
+        self.projects[row["id"]] = row
+        self._index("project", row, ("name", "description"))
+        return {"project": row}
+
+    def _tool_get_project(self, args):
+        p   = self._get(self.projects, "project", args.get("id"))
+        out = {"project": p}
+        if args.get("include_stats"):
+            out["stats"] = {
+                "asset_count":    len(self.assets_by_project[p["id"]]),
+                "checkin_count":  0,
+                "workunit_count": len(self.workunits_by_project[p["id"]]),
+            }
+        if args.get("include_workunits"):
+            out["workunits"] = [self._workunit_view(self.workunits[w]) for w in self.workunits_by_project[p["id"]]]
+        if args.get("include_assets"):
+            out["assets"] = [self.assets[a] for a in self.assets_by_project[p["id"]]]
+        if args.get("include_checkins"):
+            out["checkins"] = []
+        return out
+
+    def _tool_list_projects(self, args):
+        if _check_id("organization", args.get("organization_id")) != self.org_id:
+            return {"page_number": 1, "page_size": 50, "projects": []}
+        rows = list(self.projects.values())
+        if args.get("status"):
+            rows = [p for p in rows if p.get("status") == args["status"]]
+        if args.get("owner_id"):
+            rows = [p for p in rows if p.get("owner_id") == args["owner_id"]]
+        if args.get("tags"):
+            wanted = set(args["tags"])
+            rows = [p for p in rows if wanted & set(p.get("tags") or [])]
+        sort_by = args.get("sort_by") or "created_at"
+        rows.sort(key=lambda p: str(p.get(sort_by, "")), reverse=(args.get("sort_order") or "desc") == "desc")
+        page, info = _page(rows, args)
+        return {"page_number": info["page_number"], "page_size": info["page_size"],
+                "projects": [self._project_view(p) for p in page]}
+
+    def _tool_update_project(self, args):
+        p = self._get(self.projects, "project", args.get("id"))
+        self._apply_mask("project", p, args)
+        self._unindex("project", p["id"])
+        self._index("project", p, ("name", "description"))
+        return {"project": p}
+
+    def _tool_remove_project(self, args):
+        p      = self._get(self.projects, "project", args.get("id"))
+        action = args.get("action")
+        if action == "archive":
+            p["status"]     = "archived"
+            p["updated_at"] = _now()
+        elif action == "delete":
+            for w in list(self.workunits_by_project.pop(p["id"], {})):
+                self._delete_workunit(w)
+            self.assets_by_project.pop(p["id"], None)
+            self._unindex("project", p["id"])
+            del self.projects[p["id"]]
+        else:
+            raise ToolError(f"remove project failed: invalid action: {action}")
+        return {"action": action, "success": True}
+
+    def _tool_create_workunit(self, args):
+        for field in ("name", "problem_statement", "success_criteria"):
+            if not args.get(field):
+                raise ToolError(f"create workunit failed: {field} is required")
+        if args.get("project_id"):
+            self._get(self.projects, "project", args["project_id"])
+        row = self._new_row(args, UPDATABLE["workunit"], owner_id=args.get("owner_id") or self.user_id)
+        row.setdefault("status", "draft")
+        row.setdefault("priority", "normal")
+        self.workunits[row["id"]] = row
+        self.workunits_by_project[row.get("project_id", "")][row["id"]] = None
+        self._index("workunit", row, ("name", "description", "problem_statement"))
+        return {"workunit": self._workunit_view(row)}
+
+    def _tool_get_workunit(self, args):
+        w   = self._get(self.workunits, "workunit", args.get("id"))
+        out = {"workunit": self._workunit_view(w)}
+        if args.get("include_tasks"):
+            out["tasks"] = [{"task": self.tasks[t]} for t in self.tasks_by_workunit[w["id"]]]
+        if args.get("include_ai_context"):
+            out["ai_context"] = [self.atoms[a] for a in self.atoms_by_workunit[w["id"]]]
+        if args.get("include_assets") and w.get("project_id"):
+            out["assets"] = [self.assets[a] for a in self.assets_by_project[w["project_id"]]]
+        return out
+
+    def _tool_update_workunit(self, args):
+        w   = self._get(self.workunits, "workunit", args.get("id"))
+        old = w.get("project_id", "")
+        if "project_id" in (args.get("update_mask") or {}).get("paths", []) and args.get("project_id"):
+            self._get(self.projects, "project", args["project_id"])
+        self._apply_mask("workunit", w, args)
+        if w.get("project_id", "") != old:
+            self.workunits_by_project[old].pop(w["id"], None)
+            self.workunits_by_project[w.get("project_id", "")][w["id"]] = None
+        self._unindex("workunit", w["id"])
+        self._index("workunit", w, ("name", "description", "problem_statement"))
+        return {"workunit": self._workunit_view(w)}
+
+    def _tool_create_task(self, args):
+        w = self._get(self.workunits, "workunit", args.get("workunit_id"))
+        if not args.get("title"):
+            raise ToolError("create task failed: title is required")
+        row = self._new_row(args, UPDATABLE["task"] | {"depends_on", "position"}, workunit_id=w["id"])
+        row.setdefault("status", "todo")
+        row.setdefault("priority", "normal")
+        self.tasks[row["id"]] = row
+        self.tasks_by_workunit[w["id"]][row["id"]] = None
+        self._index("task", row, ("title", "description"))
+        return {"task": row}
+
+    def _tool_get_task(self, args):
+        t   = self._get(self.tasks, "task", args.get("id"))
+        out = {"task": {**t, "created_by_name": USER["display_name"]}}
+        if args.get("include_comments"):
+            out["comments"] = []
+        if args.get("include_dependencies"):
+            out["dependencies"] = [self.tasks[d] for d in t.get("depends_on") or [] if d in self.tasks]
+        if args.get("include_time_logs"):
+            out["time_logs"] = []
+        return out
+
+    def _tool_update_task(self, args):
+        t      = self._get(self.tasks, "task", args.get("id"))
+        before = t.get("status")
+        self._apply_mask("task", t, args)
+        if t.get("status") != before:
+            if t["status"] == "in_progress":
+                t.setdefault("started_at", t["updated_at"])
+            elif t["status"] == "done":
+                t["completed_at"] = t["updated_at"]
+        self._unindex("task", t["id"])
+        self._index("task", t, ("title", "description"))
+        return {"task": {**t, "created_by_name": USER["display_name"]}}
+
+    def _tool_save_context(self, args):
+        w = self._get(self.workunits, "workunit", args.get("workunit_id"))
+        for field in ("atom_type", "title", "content"):
+            if not args.get(field):
+                raise ToolError(f"save context failed: {field} is required")
+        atom_id = str(uuid.uuid4())
+        self.atoms[atom_id] = {**args, "id": atom_id, "workunit_id": w["id"], "created_at": _now()}
+        self.atoms_by_workunit[w["id"]][atom_id] = None
+        return {"atom_id": atom_id}
+
+    def _tool_search(self, args):
+        if args.get("organization_id"):
+            _check_id("organization", args["organization_id"])
+        types = set(args.get("result_types") or ["workunit", "task", "asset"])
+        words = WORD_RE.findall((args.get("query") or "").lower())
+        if words:
+            hits = set.intersection(*(self.words.get(w, set()) for w in words))
+        else:
+            hits = ({("workunit", i) for i in self.workunits} | {("task", i) for i in self.tasks}
+                    | {("asset", i) for i in self.assets})
+        tables = {"workunit": self.workunits, "task": self.tasks, "asset": self.assets}
+        rows = []
+        for result_type, entity_id in hits:
+            if result_type not in types or entity_id not in tables.get(result_type, {}):
+                continue
+            row = tables[result_type][entity_id]
+            if result_type == "asset":
+                if args.get("directory_id") and row.get("directory_id") != args["directory_id"]:
+                    continue
+                if args.get("root_only") and row.get("directory_id"):
+                    continue
+            rows.append({
+                "id":         entity_id,
+                "type":       result_type,
+                "name":       row.get("name") or row.get("title", ""),
+                "status":     row.get("status", ""),
+                "updated_at": row["updated_at"],
+            })
+        rows.sort(key=lambda r: r["updated_at"], reverse=True)
+        page, info = _page(rows, args, max_size=50)
+        return {**info, "results": page} if page else info
+
+    def _tool_create_asset(self, args):
+        asset_type = (args.get("asset_type") or "").lower()
+        if asset_type not in ("product", "people", "knowledge", "system"):
+            raise ToolError(f"create asset failed: invalid asset_type: {args.get('asset_type')}")
+        if not args.get("name"):
+            raise ToolError("create asset failed: name is required")
+        row = self._new_row(args, UPDATABLE["asset"] | {"user_id", "lead_user_id", "version"},
+                            asset_type=asset_type.upper())
+        row.setdefault("status", "")
+        self.assets[row["id"]] = row
+        self._index("asset", row, ("name", "description"))
+        return {"asset": row}
+
+    def _tool_get_asset(self, args):
+        return {"asset": self._get(self.assets, "asset", args.get("id"))}
+
+    def _tool_update_asset(self, args):
+        a = self._get(self.assets, "asset", args.get("id"))
+        self._apply_mask("asset", a, args)
+        self._unindex("asset", a["id"])
+        self._index("asset", a, ("name", "description"))
+        return {"asset": a}
+
+    def _tool_delete_asset(self, args):
+        a = self._get(self.assets, "asset", args.get("id"))
+        del self.assets[a["id"]]
+        self._unindex("asset", a["id"])
+        for linked in self.assets_by_project.values():
+            linked.pop(a["id"], None)
+        return {"success": True}
+
+    def _tool_project_asset_link(self, args):
+        p      = self._get(self.projects, "project", args.get("project_id"))
+        a      = self._get(self.assets, "asset", args.get("asset_id"))
+        action = args.get("action")
+        if action == "link":
+            self.assets_by_project[p["id"]][a["id"]] = args.get("notes", "")
+        elif action == "unlink":
+            self.assets_by_project[p["id"]].pop(a["id"], None)
+        else:
+            raise ToolError(f"project asset link failed: invalid action: {action}")
+        return {"action": action, "success": True}
+
+    def _tool_directory(self, args):
+        action = args.get("action")
+        if action == "list":
+            return {"directories": list(self.directories.values())}
+        if action == "create":
+            row = self._new_row(args, {"name", "parent_id"})
+            self.directories[row["id"]] = row
+            return {"directory": row}
+        if action == "delete":
+            d = self._get(self.directories, "directory", args.get("id"))
+            del self.directories[d["id"]]
+            for a in self.assets.values():
+                if a.get("directory_id") == d["id"]:
+                    a["directory_id"] = ""
+            return {"success": True}
+        raise ToolError(f"directory failed: invalid action: {action}")
@@ -0,0 +1,58 @@
+"""
+L2 fixtures declared as data rather than in runner code.
+
+The fixtures are declared under "fixtures" in level2_reasoning.json: one
+project, one workunit inside it and a list of tasks. seed_fixtures() creates
+them for every model's L2 run; the between-model org reset removes the
+previous model's copy.
+
+Usage:
+    from _fixtures import load_fixture_spec, seed_fixtures
+    context = seed_fixtures(mcp, load_fixture_spec(TASKS_DIR))
+"""
+
+import json
+from pathlib import Path
+
+
+def load_fixture_spec(tasks_dir: Path) -> dict:
+    """Read the fixture declaration from level2_reasoning.json."""
+    with open(Path(tasks_dir) / "level2_reasoning.json") as f:
+        return json.load(f)["fixtures"]
+
+
+def _entity(raw: str, kind: str) -> dict | None:
+    """Unwrap {"<kind>": {...}} from an MCP result; None on error or missing ID."""
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict) or "error" in data:
+        return None
+    obj = data.get(kind, data)
+    return obj if isinstance(obj, dict) and obj.get("id") else None
+
+
+def seed_fixtures(mcp, spec: dict) -> dict:
+    """
+    Create every declared fixture. Returns a context dict with the created
+    entity IDs: project_id, workunit_id and task_id (the last task, for L0/L1
+    compatibility), each only if it was created.
+    """
+    context = {}
+    project = _entity(mcp.call_tool("create_project", spec["project"]), "project")
+    if project:
+        context["project_id"] = project["id"]
+
+    workunit = _entity(mcp.call_tool("create_workunit",
+                                     {**spec["workunit"], "project_id": context.get("project_id", "")}),
+                       "workunit")
+    if not workunit:
+        return context
+    context["workunit_id"] = workunit["id"]
+
+    for t in spec["tasks"]:
+        task = _entity(mcp.call_tool("create_task", {**t, "workunit_id": workunit["id"]}), "task")
+        if task:
+            context["task_id"] = task["id"]
+    return context
@@ -0,0 +1,297 @@
+"""
+Model-load cost model and load-order planner.
+
+Loading a 30B+ GGUF can take longer than the L0 run that follows it, so the
+runners record what every load and unload cost:
+
+- LoadHistory keeps, per LM Studio host and model, the last few load and
+  unload latencies, the model's resident size and the context length echoed
+  back in load_config. Loads that overlapped other loads (co-load groups,
+  background prefetch) are not timed, as they say little about a load on its
+  own. It lives in load_history.json next to results/ (LOAD_HISTORY to move
+  it) and is only a cache: delete it to start over.
+- LoadHistory.estimate() predicts a model's load/unload time from its own
+  history, or, for a model never loaded on that host, from a seconds-per-GB
+  rate fitted to the models that were.
+- plan_loads() packs models that fit in the VRAM budget together into
+  co-load groups (first-fit decreasing). A model's footprint is its weights
+  plus an estimate of its KV cache at its context length and a fixed runtime
+  reserve (footprint_gb). A group's models are loaded at the same time, run
+  one after another and are unloaded together, so their load times overlap
+  instead of adding up. The order of the groups does not change the total
+  load/unload time; they run cheapest first only so the first results
+  arrive sooner.
+- Prefetcher gets the next group ready while the current one runs its last
+  level: a background load when both fit in the VRAM budget, otherwise a
+  sequential read of its weight files into the OS page cache (LM Studio on
+  this machine, LMSTUDIO_MODELS_DIR to point at its models), so the real load
+  reads from memory instead of disk.
+
+Usage:
+    from _load_planner import LoadHistory, plan_loads
+    history = LoadHistory()
+    groups  = plan_loads(model_list, sizes, history, host, vram_gb=24)
+"""
+
+import json
+import os
+import statistics
+import threading
+from pathlib import Path
+from typing import Callable
+
+BENCHMARK_DIR = Path(__file__).parent.parent
+HISTORY_FILE  = Path(os.environ.get("LOAD_HISTORY", BENCHMARK_DIR / "load_history.json"))
+
+KEEP_SAMPLES     = 5      # latencies kept per model and kind
+DEFAULT_S_PER_GB = 2.0    # load rate assumed before a host has any history
+UNLOAD_S         = 1.0    # unload time assumed before a host has any history
+VRAM_HEADROOM    = 0.9    # share of the budget co-loaded footprints may fill (estimate error)
+KV_GB_PER_1K     = 0.125  # KV cache per 1K tokens of context (fp16, 8B-class GQA model)
+RUNTIME_GB       = 0.5    # compute buffers and other per-model overhead
+
+MODELS_DIR      = Path(os.environ.get("LMSTUDIO_MODELS_DIR", Path.home() / ".lmstudio" / "models"))
+WEIGHT_SUFFIXES = {".gguf", ".safetensors"}
+WARM_CHUNK      = 16 * 1024 * 1024   # bytes per read when warming the page cache
+RAM_HEADROOM    = 0.8                # share of available RAM prefetched weights may fill
+
+
+class LoadHistory:
+    """Per-host record of model load/unload latencies and resident sizes."""
+
+    def __init__(self, path: str | Path = HISTORY_FILE):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        try:
+            self.hosts = json.loads(self.path.read_text()).get("hosts", {})
+        except (OSError, json.JSONDecodeError):
+            self.hosts = {}
+
+    def _entry(self, host: str, model_id: str) -> dict:
+        return self.hosts.setdefault(host, {}).setdefault(model_id, {"load_s": [], "unload_s": []})
+
+    def record_load(self, host: str, model_id: str, seconds: float, size_gb: float | None = None,
+                    load_config: dict | None = None, concurrent: bool = False):
+        """Record a load. A concurrent one (overlapping other loads) keeps its size and config but not its time."""
+        with self.lock:
+            entry = self._entry(host, model_id)
+            if not concurrent:
+                entry["load_s"] = (entry["load_s"] + [round(seconds, 2)])[-KEEP_SAMPLES:]
+            if size_gb:
+                entry["size_gb"] = round(size_gb, 2)
+            if load_config and "context_length" in load_config:
+                entry["context_length"] = load_config["context_length"]
+            self._save()
+
+    def record_unload(self, host: str, model_id: str, seconds: float):
+        with self.lock:
+            entry = self._entry(host, model_id)
+            entry["unload_s"] = (entry["unload_s"] + [round(seconds, 2)])[-KEEP_SAMPLES:]
+            self._save()
+
+    def _save(self):
+        # Write then rename, so an interrupted run never leaves half a file
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"hosts": self.hosts}, indent=2, sort_keys=True))
+        tmp.replace(self.path)
+
+    def size_gb(self, host: str, model_id: str) -> float | None:
+        return self.hosts.get(host, {}).get(model_id, {}).get("size_gb")
+
+    def context_length(self, host: str, model_id: str) -> int | None:
+        return self.hosts.get(host, {}).get(model_id, {}).get("context_length")
+
+    def estimate(self, host: str, model_id: str, size_gb: float = 0.0) -> tuple[float, float]:
+        """Predicted (load_s, unload_s) for a model on a host."""
+        models = self.hosts.get(host, {})
+        entry  = models.get(model_id, {})
+
+        if entry.get("load_s"):
+            load_s = statistics.median(entry["load_s"])
+        else:
+            # Seconds per GB over the models this host has loaded
+            rates = [statistics.median(e["load_s"]) / e["size_gb"]
+                     for e in models.values() if e.get("load_s") and e.get("size_gb")]
+            load_s = size_gb * (statistics.median(rates) if rates else DEFAULT_S_PER_GB)
+
+        if entry.get("unload_s"):
+            unload_s = statistics.median(entry["unload_s"])
+        else:
+            unloads  = [statistics.median(e["unload_s"]) for e in models.values() if e.get("unload_s")]
+            unload_s = statistics.median(unloads) if unloads else UNLOAD_S
+        return load_s, unload_s
+
+    def has_loads(self, host: str, model_id: str) -> bool:
+        """True if a load of this model on this host has been timed."""
+        return bool(self.hosts.get(host, {}).get(model_id, {}).get("load_s"))
+
+    def known(self, host: str) -> int:
+        """Number of models with at least one recorded load on this host."""
+        return sum(1 for e in self.hosts.get(host, {}).values() if e.get("load_s"))
+
+
+def group_cost(group: list[tuple[str, bool]], sizes: dict[str, float], history: LoadHistory,
+               host: str) -> float:
+    """Predicted seconds to load and unload a co-load group: its slowest load plus its slowest unload."""
+    costs = [history.estimate(host, m, sizes.get(m, 0.0)) for m, _ in group]
+    return max(c[0] for c in costs) + max(c[1] for c in costs)
+
+
+def footprint_gb(size_gb: float, context_length: int) -> float:
+    """Predicted VRAM of one loaded model: weights, KV cache at context_length, runtime reserve."""
+    return size_gb + context_length / 1024 * KV_GB_PER_1K + RUNTIME_GB
+
+
+def plan_loads(models: list[tuple[str, bool]], sizes: dict[str, float], history: LoadHistory,
+               host: str, vram_gb: float = 0.0, context_length: int = 0) -> list[list[tuple[str, bool]]]:
+    """
+    Split (model_id, tool_trained) pairs into co-load groups, in run order.
+
+    sizes is each model's size on disk in GB; a size recorded in the history
+    takes precedence. Models are packed by footprint_gb() at the context length
+    the history recorded for them, else at context_length. With no VRAM budget
+    every model is its own group. A model larger than the budget, or of unknown
+    size, always runs alone.
+    """
+    size = {m: history.size_gb(host, m) or sizes.get(m, 0.0) for m, _ in models}
+    need = {m: footprint_gb(size[m], history.context_length(host, m) or context_length) if size[m] else 0.0
+            for m, _ in models}
+    budget = vram_gb * VRAM_HEADROOM
+
+    groups = []
+    for item in sorted(models, key=lambda it: -need[it[0]]):
+        fit = next((g for g in groups
+                    if budget and need[item[0]] > 0 and need[g[0][0]] > 0
+                    and sum(need[m] for m, _ in g) + need[item[0]] <= budget), None)
+        if fit:
+            fit.append(item)
+        else:
+            groups.append([item])
+
+    # Any order costs the same in total; cheapest first gets results back soonest
+    return sorted(groups, key=lambda g: group_cost(g, size, history, host))
+
+
+def weight_files(listing: dict, models_dir: Path = MODELS_DIR) -> list[Path]:
+    """
+    Weight files of one /api/v1/models entry, under LM Studio's models directory.
+
+    Uses the entry's path when it has one, else the <publisher>/<repo>
+    directories named after the model key, preferring files of the entry's
+    quantization. Empty when the files are not on this machine.
+    """
+    if listing.get("path"):
+        p = models_dir / listing["path"]
+        if p.is_file():
+            return [p]
+        return sorted(f for f in p.glob("*") if f.suffix in WEIGHT_SUFFIXES) if p.is_dir() else []
+
+    name = listing.get("key", "").split("/")[-1].lower()
+    if not name or not models_dir.is_dir():
+        return []
+    files = sorted(f for d in models_dir.glob("*/*") if d.is_dir() and name in d.name.lower()
+                   for f in d.iterdir() if f.suffix in WEIGHT_SUFFIXES)
+    quant = listing.get("quantization") or ""
+    quant = (quant.get("name") or "" if isinstance(quant, dict) else quant).lower()
+    if quant:
+        files = [f for f in files if quant in f.name.lower()] or files
+    return files
+
+
+def available_ram_gb() -> float:
+    """Memory the page cache can take without swapping, in GiB; 0 if unknown."""
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) / 1024 ** 2
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024 ** 3
+    except (ValueError, OSError, AttributeError):
+        return 0.0
+
+
+def warm_page_cache(files: list[Path], stop: threading.Event) -> int:
+    """Read files start to end so their pages are cached when LM Studio loads them; returns bytes read."""
+    buf, done = bytearray(WARM_CHUNK), 0
+    for f in files:
+        try:
+            with open(f, "rb", buffering=0) as fh:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while not stop.is_set() and (n := fh.readinto(buf)):
+                    done += n
+        except OSError:
+            continue
+    return done
+
+
+class Prefetcher:
+    """
+    Gets the next models ready while the current ones run.
+
+    start() loads them in the background when their footprints (footprint_gb at
+    context_length) fit in the VRAM budget beside the models already loaded;
+    otherwise it reads their weight files into the page cache, if they fit in
+    available RAM. take() waits for the background loads, stops a page-cache
+    read still running and hands over the instances.
+    """
+
+    def __init__(self, load: Callable[[str], str | None], files: dict[str, list[Path]],
+                 sizes: dict[str, float], vram_gb: float = 0.0, context_length: int = 0):
+        self.load    = load
+        self.files   = files
+        self.sizes   = sizes
+        self.ctx     = context_length
+        self.budget  = vram_gb * VRAM_HEADROOM
+        self.started = []
+        self.loaded  = {}
+        self.threads = []
+        self.stop    = threading.Event()
+
+    def start(self, model_ids: list[str], loaded_ids: list[str]) -> str:
+        """Begin getting model_ids ready while loaded_ids stay loaded; returns what it did, for the log."""
+        if self.started or not model_ids:
+            return ""
+        self.started = list(model_ids)
+
+        sizes = [self.sizes.get(m, 0.0) for m in [*model_ids, *loaded_ids]]
+        need  = sum(footprint_gb(s, self.ctx) for s in sizes)
+        if self.budget and all(s > 0 for s in sizes) and need <= self.budget:
+            for m in model_ids:
+                self._spawn(self._load, m)
+            return f"loading in the background (~{need:.1f} GB resident)"
+
+        files = [f for m in model_ids for f in self.files.get(m, [])]
+        try:
+            gb = sum(f.stat().st_size for f in files) / 1024 ** 3
+        except OSError:
+            files = []
+        if not files:
+            return "weight files not found on this machine, nothing to prefetch"
+        ram = available_ram_gb()
+        if ram and gb > ram * RAM_HEADROOM:
+            return f"skipped, {gb:.1f} GB of weights but {ram:.1f} GB RAM available"
+        self._spawn(warm_page_cache, files, self.stop)
+        return f"reading {gb:.1f} GB of weights into the page cache"
+
+    def _load(self, model_id: str):
+        instance_id = self.load(model_id)
+        if instance_id:
+            self.loaded[model_id] = instance_id
+
+    def _spawn(self, fn, *args):
+        # Daemon threads: an interrupted run must not wait for a prefetch to finish
+        t = threading.Thread(target=fn, args=args, daemon=True)
+        t.start()
+        self.threads.append(t)
+
+    def take(self) -> dict[str, str]:
+        """model_id -> instance_id of the models start() loaded; resets for the next start()."""
+        self.stop.set()
+        for t in self.threads:
+            t.join()
+        loaded = self.loaded
+        self.started, self.loaded, self.threads, self.stop = [], {}, [], threading.Event()
+        return loaded
@@ -0,0 +1,117 @@
+"""
+Record/replay cassette for MCP tool-call traffic.
+
+In record mode every tools/call request the runners' MCPClient makes is
+appended to a JSON-lines file together with the JSON-RPC response body.
+In replay mode the file is loaded into an in-memory index keyed on tool
+name + canonicalized arguments and served back without touching the network,
+so validator changes can be regression-tested offline.
+
+Paths ending in .gz are gzip-compressed.
+
+Usage:
+    from _mcp_cassette import Cassette
+    cassette = Cassette("run.cassette.jsonl.gz", "record")
+    cassette = Cassette("run.cassette.jsonl.gz", "replay")
+"""
+
+import gzip
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+
+CASSETTE_VERSION = 1
+
+
+def canonical_args(arguments: dict) -> str:
+    """Stable string form of tool arguments (key order and whitespace ignored)."""
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _open(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """
+    One cassette file, either being recorded or replayed.
+
+    Repeated calls with identical arguments are replayed in recorded order;
+    once a key's responses run out the last one is repeated. Calls that were
+    never recorded get a JSON-RPC error response and are counted as misses.
+    """
+
+    def __init__(self, path: str | Path, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"cassette mode must be 'record' or 'replay', not {mode!r}")
+        self.path      = Path(path)
+        self.mode      = mode
+        self.lock      = threading.Lock()
+        self.recorded  = 0
+        self.hits      = 0
+        self.misses    = 0
+        self._file     = None
+        self._index    = defaultdict(list)   # (tool, canonical args) -> [response, ...]
+        self._cursor   = defaultdict(int)
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = _open(self.path, "w")
+            self._write({"cassette": CASSETTE_VERSION})
+        else:
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _load(self):
+        with _open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "tool" not in entry:
+                    continue  # header
+                key = (entry["tool"], canonical_args(entry.get("args")))
+                self._index[key].append(entry["response"])
+        self.recorded = sum(len(v) for v in self._index.values())
+
+    def record(self, name: str, arguments: dict, response: dict):
+        """Append one tool call and its JSON-RPC response body."""
+        # Request ids differ between runs and carry no information on replay
+        body = {k: v for k, v in response.items() if k not in ("jsonrpc", "id")}
+        with self.lock:
+            self._write({"tool": name, "args": arguments, "response": body})
+            self.recorded += 1
+
+    def replay(self, name: str, arguments: dict) -> dict:
+        """Return the recorded JSON-RPC response body for a tool call."""
+        key = (name, canonical_args(arguments))
+        with self.lock:
+            responses = self._index.get(key)
+            if not responses:
+                self.misses += 1
+                return {"error": {"code": -32000, "message": f"cassette miss: {name} {key[1]}"}}
+            i = self._cursor[key]
+            self._cursor[key] = i + 1
+            self.hits += 1
+            return responses[min(i, len(responses) - 1)]
+
+    def stats(self) -> str:
+        if self.replaying:
+            return f"{self.hits} replayed, {self.misses} missed ({self.recorded} recorded calls in {self.path})"
+        return f"{self.recorded} calls recorded to {self.path}"
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
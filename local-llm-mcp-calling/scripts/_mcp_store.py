@@ -0,0 +1,78 @@
+"""
+Content-addressed side-car store for MCP tool responses.
+
+Result files keep each tool call's response as a hash reference
+("mcp_result_ref") instead of the full text. The text itself is written once
+per distinct response, gzip-compressed, under <store>/<hash[:2]>/<hash>.gz,
+so repeated responses (errors, empty lists, re-fetched entities) cost
+nothing after the first and the result JSON stays small. ID-chaining
+validation can be reproduced offline by hydrating the references again.
+
+Usage:
+    from _mcp_store import McpStore
+    store = McpStore("results/v2_agentic/mcp_store")
+    calls = store.compact(tool_calls)     # before saving
+    calls = store.hydrate(calls)          # after loading
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+
+class McpStore:
+    """A directory of gzip blobs named by the sha256 of their text."""
+
+    def __init__(self, root: str | Path):
+        self.root    = Path(root)
+        self.lock    = threading.Lock()
+        self.written = 0   # blobs written by this process
+        self.reused  = 0   # puts that found their blob already stored
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def put(self, text: str) -> str:
+        """Store a response and return its hash. Storing the same text twice is free."""
+        data   = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path   = self._path(digest)
+        with self.lock:
+            if path.exists():
+                self.reused += 1
+                return digest
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a reader never sees a partial blob
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with gzip.open(tmp, "wb") as f:
+                f.write(data)
+            tmp.replace(path)
+            self.written += 1
+        return digest
+
+    def get(self, digest: str) -> str:
+        with gzip.open(self._path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def compact(self, tool_calls: list[dict]) -> list[dict]:
+        """Copies of tool_calls with each mcp_result replaced by an mcp_result_ref."""
+        out = []
+        for call in tool_calls:
+            call = dict(call)
+            if isinstance(call.get("mcp_result"), str):
+                call["mcp_result_ref"] = self.put(call.pop("mcp_result"))
+            out.append(call)
+        return out
+
+    def hydrate(self, tool_calls: list[dict]) -> list[dict]:
+        """Inverse of compact(): mcp_result_ref back to mcp_result, in place. Returns tool_calls."""
+        for call in tool_calls:
+            digest = call.pop("mcp_result_ref", None)
+            if digest:
+                call["mcp_result"] = self.get(digest)
+        return tool_calls
+
+    def stats(self) -> str:
+        return f"{self.written} responses stored, {self.reused} deduplicated in {self.root}"
@@ -0,0 +1,192 @@
+"""
+Model loads that report progress instead of blocking.
+
+POST /api/v1/models/load only answers once the model is loaded, so a hung
+load used to hold the sweep for the whole request timeout with nothing in the
+log. load_and_wait() sends the POST from a background thread and polls
+GET /api/v1/models, with backoff, until the model is usable:
+
+- The load is ready when the POST answers, or when a poll shows a loaded
+  instance of the model, whichever comes first.
+- Every change in the model's listing (its instances and any state or
+  progress fields LM Studio reports for them) goes to on_progress, and so
+  does a heartbeat every REPORT_EVERY_S while nothing changes.
+- A load is abandoned early when the server has not answered a poll for
+  stall_s seconds, when it reports a load progress value that has not moved
+  for stall_s seconds, or, if the caller knows how long the load should take,
+  when it is still not ready ready_by seconds after the request. LM Studio's
+  listing has no progress field today, so without ready_by a quiet load waits
+  for timeout. An abandoned load's half-loaded instance is unloaded and the
+  caller gets an error straight away.
+- The result carries ready_s, seconds from the request to a usable instance,
+  which the runners record as a benchmark metric next to the cold start.
+
+Usage:
+    from _model_loader import load_and_wait
+    out = load_and_wait("http://localhost:1234", model_id, {"model": model_id, ...})
+    if out["error"] is None:
+        instance_id = out["instance_id"]
+"""
+
+import threading
+import time
+from typing import Callable
+
+import requests
+
+POLL_START_S   = 0.5     # first poll interval; doubles up to POLL_MAX_S
+POLL_MAX_S     = 5.0
+STALL_S        = 180.0   # server silent, or reported progress frozen, this long = stalled
+REPORT_EVERY_S = 15.0    # heartbeat to on_progress while a load is quiet
+READY_STATES   = {None, "loaded", "ready", "idle"}
+
+
+def _listing(mgmt_url: str, model_id: str) -> dict | None:
+    """The model's /api/v1/models entry: {} if it isn't listed, None if the server doesn't answer."""
+    try:
+        resp = requests.get(f"{mgmt_url}/api/v1/models", timeout=10)
+        resp.raise_for_status()
+        return next((m for m in resp.json().get("models", []) if m.get("key") == model_id), {})
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def _state(entry: dict | None) -> tuple:
+    """Everything in a listing entry that moves while a model loads."""
+    if entry is None:
+        return ("unreachable",)
+    return (entry.get("state"),) + tuple(
+        (inst.get("instance_id") or inst.get("id"), inst.get("status") or inst.get("state"),
+         inst.get("progress", inst.get("load_progress")))
+        for inst in entry.get("loaded_instances", [])
+    )
+
+
+def _progress(state: tuple) -> tuple | None:
+    """The load progress values in a state, None when the server reports none."""
+    values = tuple(p for _, _, p in state[1:] if isinstance(p, (int, float)))
+    return values or None
+
+
+def _describe(state: tuple) -> str:
+    if state == ("unreachable",):
+        return "LM Studio not answering"
+    insts = state[1:]
+    if not insts:
+        return f"not loaded yet ({state[0]})" if state[0] else "not loaded yet"
+    parts = []
+    for iid, status, progress in insts:
+        pct = f" {progress:.0%}" if isinstance(progress, (int, float)) and progress <= 1 else \
+              (f" {progress}%" if progress is not None else "")
+        parts.append(f"{iid}: {status or 'listed'}{pct}")
+    return ", ".join(parts)
+
+
+def _ready_instance(entry: dict | None) -> dict | None:
+    """A loaded instance of the model, if the listing shows one."""
+    for inst in (entry or {}).get("loaded_instances", []):
+        status = inst.get("status") or inst.get("state")
+        progress = inst.get("progress", inst.get("load_progress"))
+        if status in READY_STATES and progress in (None, 1, 1.0, 100):
+            return inst
+    return None
+
+
+def _unload(mgmt_url: str, model_id: str):
+    """Best-effort unload of whatever an abandoned load left behind."""
+    for inst in (_listing(mgmt_url, model_id) or {}).get("loaded_instances", []):
+        iid = inst.get("instance_id") or inst.get("id")
+        if iid:
+            try:
+                requests.post(f"{mgmt_url}/api/v1/models/unload", json={"instance_id": iid}, timeout=15)
+            except requests.RequestException:
+                pass
+
+
+def load_and_wait(mgmt_url: str, model_id: str, body: dict, timeout: float = 600,
+                  stall_s: float = STALL_S, ready_by: float | None = None,
+                  on_progress: Callable[[float, str], None] | None = None) -> dict:
+    """
+    Load a model and wait until it is usable, stalled or timed out.
+    ready_by, if given, is how long a load that should have finished by now
+    may run before it is abandoned; None leaves only timeout.
+
+    Returns:
+        {
+            'instance_id': str or None,
+            'load_config': dict, as echoed by the POST (or the listing's instance config),
+            'load_s':      LM Studio's load_time_seconds if reported, else ready_s,
+            'ready_s':     seconds from the request to a usable instance, None on error,
+            'error':       None, or why the load failed or was abandoned,
+        }
+    """
+    t0        = time.monotonic()
+    post      = {}
+    done      = threading.Event()
+    abandoned = threading.Event()
+
+    def send():
+        try:
+            resp = requests.post(f"{mgmt_url}/api/v1/models/load", json=body, timeout=timeout)
+            post["status"], post["text"] = resp.status_code, resp.text[:200]
+            if resp.status_code == 200:
+                post["data"] = resp.json()
+                if abandoned.is_set():
+                    # Finished after we gave up on it: don't leave it holding VRAM
+                    _unload(mgmt_url, model_id)
+        except Exception as e:
+            post["error"] = str(e)
+        finally:
+            done.set()
+
+    # Daemon: an abandoned load must not keep the process alive
+    threading.Thread(target=send, daemon=True).start()
+
+    def result(instance_id=None, load_config=None, load_s=None, error=None) -> dict:
+        ready_s = None if error else round(time.monotonic() - t0, 2)
+        return {"instance_id": instance_id, "load_config": load_config or {},
+                "load_s": load_s if load_s is not None else ready_s, "ready_s": ready_s, "error": error}
+
+    interval, last_state, reported = POLL_START_S, None, t0
+    answered, progress, moved = t0, None, t0   # last answer; last progress reading and when it changed
+    while True:
+        if done.wait(interval):
+            if "data" in post:
+                data = post["data"]
+                return result(data.get("instance_id", model_id), data.get("load_config"),
+                              data.get("load_time_seconds"))
+            return result(error=post.get("error") or f"load endpoint returned {post['status']}: {post['text']}")
+        interval = min(interval * 2, POLL_MAX_S)
+
+        entry = _listing(mgmt_url, model_id)
+        inst  = _ready_instance(entry)
+        if inst:
+            return result(inst.get("instance_id") or inst.get("id"), inst.get("config"))
+
+        now, state = time.monotonic(), _state(entry)
+        if state != last_state:
+            if on_progress and last_state is not None:
+                on_progress(now - t0, _describe(state))
+            last_state, reported = state, now
+        elif on_progress and now - reported >= REPORT_EVERY_S:
+            reported = now
+            on_progress(now - t0, _describe(state))
+
+        if entry is not None:
+            answered = now
+            if _progress(state) != progress:
+                progress, moved = _progress(state), now
+
+        why = None
+        if now - answered >= stall_s:
+            why = f"LM Studio not answering for {now - answered:.0f}s"
+        elif progress is not None and now - moved >= stall_s:
+            why = f"load progress stuck for {now - moved:.0f}s"
+        elif ready_by is not None and now - t0 >= ready_by:
+            why = f"not ready after {now - t0:.0f}s, well past its usual load time"
+        elif now - t0 >= timeout:
+            why = f"not ready after {timeout:.0f}s"
+        if why:
+            abandoned.set()
+            _unload(mgmt_url, model_id)
+            return result(error=f"load abandoned, {why} ({_describe(state)})")
@@ -0,0 +1,159 @@
+"""
+Uncertainty of model rankings.
+
+A ranking comes from a single temperature-0 run over 28 tasks, so a few
+tasks decide the gap between neighbours. This module puts numbers on that:
+
+- bootstrap_ci(): percentile confidence intervals for each model's per-level
+  and overall score, resampling tasks with replacement within each level.
+  All models share the same resamples, as they answer the same tasks.
+- paired_permutation(): for pairs of models, a two-sided paired test of the
+  overall score difference, flipping the sign of per-task differences.
+- ranking_uncertainty(): both, for a ranked list of models, each compared
+  with the model ranked just below it.
+
+Scores are fractions (0-1). The overall score is the mean of the level
+means, as in the reports. Each resample is a vector of task counts
+(multinomial), so a level's 10k resamples for every model are one matrix
+product instead of a Python loop.
+
+Usage:
+    from _ranking_stats import ranking_uncertainty
+    scores = {model: {level: {task_id: score}}}
+    rows   = ranking_uncertainty(scores, ranked_models)
+"""
+
+import numpy as np
+
+N_RESAMPLES = 10_000
+CONFIDENCE  = 0.95
+SEED        = 0      # fixed, so published intervals are reproducible
+
+
+def task_matrices(scores: dict, models: list[str]) -> dict[int, np.ndarray]:
+    """
+    model -> level -> task_id -> score, as level -> (models × tasks) array.
+    NaN where a model has no result for a task.
+    """
+    levels = sorted({lv for m in models for lv in scores.get(m, {})})
+    out = {}
+    for lv in levels:
+        task_ids = sorted({t for m in models for t in scores.get(m, {}).get(lv, {})})
+        out[lv] = np.array(
+            [[scores.get(m, {}).get(lv, {}).get(t, np.nan) for t in task_ids] for m in models],
+            dtype=float,
+        ).reshape(len(models), len(task_ids))
+    return out
+
+
+def _weighted_means(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Means of each row of values (NaN = missing) under each row of task weights: (models, weight rows)."""
+    valid  = ~np.isnan(values)
+    sums   = np.where(valid, values, 0.0) @ weights.T
+    counts = valid.astype(float) @ weights.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def _mean_of_levels(level_means: np.ndarray) -> np.ndarray:
+    """Overall score: mean over the levels (axis 0) a model has results for."""
+    finite = np.isfinite(level_means)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(finite, level_means, 0.0).sum(axis=0) / finite.sum(axis=0)
+
+
+def bootstrap_ci(levels: dict[int, np.ndarray], n_resamples: int = N_RESAMPLES,
+                 confidence: float = CONFIDENCE, seed: int = SEED) -> dict:
+    """
+    Point estimates and percentile intervals from task_matrices() output.
+
+    Returns:
+        {
+            'levels':  {level: (models × 3) array of score, low, high},
+            'overall': (models × 3) array of score, low, high,
+        }
+    """
+    rng   = np.random.default_rng(seed)
+    tails = 100 * np.array([(1 - confidence) / 2, (1 + confidence) / 2])
+
+    points, samples, out = [], [], {"levels": {}}
+    for lv, values in levels.items():
+        n_tasks = values.shape[1]
+        counts  = rng.multinomial(n_tasks, np.full(n_tasks, 1 / n_tasks), size=n_resamples)
+        point   = _weighted_means(values, np.ones((1, n_tasks)))[:, 0]
+        means   = _weighted_means(values, counts)                       # models × resamples
+        points.append(point)
+        samples.append(means)
+        out["levels"][lv] = np.column_stack([point, *np.percentile(means, tails, axis=1)])
+
+    overall = _mean_of_levels(np.array(samples))
+    out["overall"] = np.column_stack([_mean_of_levels(np.array(points)),
+                                      *np.percentile(overall, tails, axis=1)])
+    return out
+
+
+def paired_permutation(levels: dict[int, np.ndarray], pairs: list[tuple[int, int]],
+                       n_permutations: int = N_RESAMPLES, seed: int = SEED) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Overall score difference (a - b) and its two-sided p-value for each (a, b) pair of rows.
+
+    Only tasks both models answered count. Under the null hypothesis either model
+    is as likely to score higher on a task, so each permutation flips the sign of
+    every per-task difference at random; the p-value is the share of
+    permutations at least as extreme as the observed difference.
+    """
+    if not pairs:
+        return np.zeros(0), np.zeros(0)
+    a, b = np.array(pairs).T
+
+    # Per-task difference and weight so that sum(weight * diff) is the mean of level means
+    diffs, weights = [], []
+    for values in levels.values():
+        d     = values[a] - values[b]                       # pairs × tasks
+        valid = ~np.isnan(d)
+        n     = valid.sum(axis=1, keepdims=True)
+        diffs.append(np.where(valid, d, 0.0))
+        weights.append(np.where(valid & (n > 0), 1.0 / np.maximum(n, 1), 0.0))
+    n_levels = sum((w.sum(axis=1) > 0) for w in weights)
+    d = np.hstack(diffs) * np.hstack(weights) / np.maximum(n_levels, 1)[:, None]
+
+    observed = d.sum(axis=1)
+    rng      = np.random.default_rng(seed)
+    signs    = rng.choice(np.array([-1.0, 1.0]), size=(n_permutations, d.shape[1]))
+    permuted = signs @ d.T                                   # permutations × pairs
+    extreme  = (np.abs(permuted) >= np.abs(observed) - 1e-12).sum(axis=0)
+    return observed, (extreme + 1) / (n_permutations + 1)
+
+
+def ranking_uncertainty(scores: dict, ranked_models: list[str], n_resamples: int = N_RESAMPLES,
+                        confidence: float = CONFIDENCE, seed: int = SEED) -> list[dict]:
+    """
+    Intervals and neighbour tests for models in rank order.
+
+    Returns one dict per model:
+        {
+            'model':   str,
+            'overall': [score, low, high],
+            'levels':  {level: [score, low, high]},
+            'vs_next': {'model': str, 'delta': float, 'p_value': float} or None for the last model,
+        }
+    """
+    levels = task_matrices(scores, ranked_models)
+    ci     = bootstrap_ci(levels, n_resamples, confidence, seed)
+    pairs  = [(i, i + 1) for i in range(len(ranked_models) - 1)]
+    delta, p_value = paired_permutation(levels, pairs, n_resamples, seed)
+
+    rows = []
+    for i, model in enumerate(ranked_models):
+        rows.append({
+            "model":   model,
+            "overall": ci["overall"][i].tolist(),
+            "levels":  {lv: arr[i].tolist() for lv, arr in ci["levels"].items()
+                        if not np.isnan(arr[i, 0])},
+            "vs_next": {
+                "model":   ranked_models[i + 1],
+                "delta":   float(delta[i]),
+                "p_value": float(p_value[i]),
+            } if i < len(pairs) else None,
+        })
+    return rows
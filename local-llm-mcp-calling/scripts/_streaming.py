@@ -0,0 +1,93 @@
+"""
+Streaming chat completions with per-turn latency and throughput metrics.
+
+stream_chat() sends the same request the runners make with
+client.chat.completions.create, but streams it. It reassembles the
+streamed deltas into a message object with the same .content / .tool_calls
+shape the runners already read, and measures the turn:
+
+    ttft_ms              first content, reasoning or tool-call delta
+    first_tool_delta_ms  first tool-call delta (None if the model called no tool)
+    total_ms             request sent → stream closed
+    prompt_tokens        from the server's usage block
+    completion_tokens    from usage; streamed delta count if the server sends none
+    decode_tps           completion tokens after the first / time from first to last delta
+    usage_reported       False when token counts are estimated from deltas
+
+Usage:
+    from _streaming import stream_chat
+    msg, metrics = stream_chat(client, model=model_id, messages=messages, tools=TOOLS)
+"""
+
+import time
+from types import SimpleNamespace
+
+
+def _ms(t0: float, t: float | None) -> float | None:
+    return round((t - t0) * 1000, 1) if t is not None else None
+
+
+def stream_chat(client, **kwargs) -> tuple[SimpleNamespace, dict]:
+    """Stream one chat completion. Returns (message, turn metrics)."""
+    t0     = time.perf_counter()
+    stream = client.chat.completions.create(stream=True, stream_options={"include_usage": True}, **kwargs)
+
+    content     = []
+    calls       = {}     # tool call index -> {"id", "name", "arguments"}
+    deltas      = 0
+    usage       = None
+    first_token = first_tool = last_token = None
+
+    for chunk in stream:
+        if getattr(chunk, "usage", None):
+            usage = chunk.usage
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        now   = time.perf_counter()
+        got   = False
+
+        if delta.content:
+            content.append(delta.content)
+            got = True
+        if getattr(delta, "reasoning_content", None):
+            got = True
+        for tc in delta.tool_calls or []:
+            slot = calls.setdefault(tc.index, {"id": None, "name": "", "arguments": ""})
+            if tc.id:
+                slot["id"] = tc.id
+            if tc.function:
+                slot["name"]      += tc.function.name or ""
+                slot["arguments"] += tc.function.arguments or ""
+            if first_tool is None:
+                first_tool = now
+            got = True
+
+        if got:
+            deltas     += 1
+            first_token = first_token or now
+            last_token  = now
+
+    end = time.perf_counter()
+
+    tool_calls = [
+        SimpleNamespace(
+            id=slot["id"] or f"call_{i}",
+            function=SimpleNamespace(name=slot["name"], arguments=slot["arguments"]),
+        )
+        for i, slot in sorted(calls.items())
+    ]
+    message = SimpleNamespace(content="".join(content) or None, tool_calls=tool_calls or None)
+
+    completion_tokens = usage.completion_tokens if usage else deltas
+    decode_s          = (last_token - first_token) if first_token is not None else 0.0
+    metrics = {
+        "ttft_ms":             _ms(t0, first_token),
+        "first_tool_delta_ms": _ms(t0, first_tool),
+        "total_ms":            _ms(t0, end),
+        "prompt_tokens":       usage.prompt_tokens if usage else None,
+        "completion_tokens":   completion_tokens,
+        "decode_tps":          round((completion_tokens - 1) / decode_s, 1) if decode_s > 0 and completion_tokens > 1 else None,
+        "usage_reported":      usage is not None,
+    }
+    return message, metrics
@@ -0,0 +1,118 @@
+"""
+Task validation rules compiled once, at task load time.
+
+Each task's "validation" block is turned into a ValidationSpec: the .get()
+lookups with their defaults are resolved, expected values are normalized,
+substring needles and keywords are lowercased, every detail-message prefix
+("Step 2 (create_workunit)") is formatted, and sequence steps are indexed by
+tool name. The runners' validate() functions read these instead of walking
+the raw dict on every call, which keeps bulk re-scoring of archived results
+cheap. Scores and details are unchanged.
+
+Usage:
+    from _validation_spec import compile_tasks, spec_for
+    tasks = compile_tasks(json.load(f)["tasks"])   # at load time
+    spec  = spec_for(task)                          # in validate(); compiles on a miss and
+                                                    # stores the spec as task["_spec"]
+"""
+
+SEQUENCE_TYPES = ("multi_tool_sequence", "reasoning_chain")
+MATCH_FIELDS   = ("project_id_must_match", "asset_id_must_match", "workunit_id_must_match")
+
+
+def normalize(val):
+    """Coerce string booleans to actual booleans for comparison."""
+    if isinstance(val, str):
+        if val.lower() == "true":
+            return True
+        if val.lower() == "false":
+            return False
+    return val
+
+
+class StepSpec:
+    """One step of a multi_tool_sequence / reasoning_chain validation."""
+
+    def __init__(self, i: int, step: dict):
+        self.tool      = step.get("tool")
+        self.label     = f"Step {i+1} ({self.tool})"
+        self.min_count = step.get("call_count_min", 1)
+        self.each_must = tuple(step.get("each_must_have", []))
+        self.must_have = tuple(step.get("must_have_params", []))
+        # (param, expected as written, expected normalized)
+        self.exact     = tuple((p, v, normalize(v)) for p, v in step.get("param_exact", {}).items())
+        # (param, expected, lowercased needle or None when expected isn't a string, expected normalized)
+        self.contains  = tuple((p, v, v.lower() if isinstance(v, str) else None, normalize(v))
+                               for p, v in step.get("param_contains", {}).items())
+        self.present   = tuple(step.get("param_present", []))
+
+        relate_to   = step.get("name_must_relate_to")
+        q_contains  = step.get("query_must_contain")
+        q_relate    = step.get("query_must_relate_to")
+        self.relate_to  = (relate_to, relate_to.lower()) if relate_to else None
+        self.q_contains = (q_contains, q_contains.lower()) if q_contains else None
+        self.q_relate   = (q_relate, [w for w in q_relate.lower().split() if len(w) > 2]) if q_relate else None
+        self.atom_type  = step.get("atom_type_must_be") or None
+        self.mentions   = tuple((k, k.lower()) for k in step.get("content_must_mention", []))
+        self.must_match = tuple(f.replace("_must_match", "") for f in MATCH_FIELDS if step.get(f))
+        self.mask_paths = tuple(step.get("update_mask_must_contain", []))
+
+
+class ValidationSpec:
+    """A task's validation block, with everything that doesn't depend on the calls precomputed."""
+
+    def __init__(self, task: dict):
+        validation    = task.get("validation", {})
+        self.type     = validation.get("type", "tool_call_match")
+
+        # tool_call_match
+        self.expected_tool = task.get("expected_tool")
+        self.required      = tuple(validation.get("required_params", []))
+        # (param, expected normalized)
+        self.exact         = tuple((p, normalize(v)) for p, v in validation.get("param_exact", {}).items())
+        # (param, expected, kind, prepared, expected normalized): kind "str" →
+        # lowercased needle, "list" → [(item, needle)], "other" → None
+        self.contains      = tuple(self._contains(p, v) for p, v in validation.get("param_contains", {}).items())
+        self.present       = tuple(validation.get("param_present", []))
+        self.mask_paths    = tuple(validation.get("update_mask_must_contain", []))
+
+        # multi_tool_call (call_count_min, when given, overrides call_count in the agentic runner)
+        self.tool       = validation.get("tool")
+        self.call_count = validation.get("call_count", 1)
+        self.min_count  = validation.get("call_count_min", self.call_count)
+        self.each_must  = tuple(validation.get("each_must_have", []))
+        self.titles     = tuple((t, t.lower()) for t in validation.get("titles_must_include", []))
+
+        # multi_tool_sequence / reasoning_chain
+        self.steps   = tuple(StepSpec(i, s) for i, s in enumerate(validation.get("steps", [])))
+        self.by_tool = {}   # tool name -> indices of the steps that expect it
+        for i, step in enumerate(self.steps):
+            self.by_tool.setdefault(step.tool, []).append(i)
+
+    @staticmethod
+    def _contains(param: str, expected) -> tuple:
+        if isinstance(expected, str):
+            return param, expected, "str", expected.lower(), normalize(expected)
+        if isinstance(expected, list):
+            items = [(item, item.lower() if isinstance(item, str) else item) for item in expected]
+            return param, expected, "list", items, expected
+        return param, expected, "other", None, normalize(expected)
+
+
+def spec_for(task: dict) -> ValidationSpec:
+    """
+    The compiled spec for a task dict, compiling it on first use. The spec is
+    kept on the task itself under "_spec", so it lives exactly as long as the
+    task; task dicts are never written out, so it doesn't leak into results.
+    """
+    spec = task.get("_spec")
+    if spec is None:
+        spec = task["_spec"] = ValidationSpec(task)
+    return spec
+
+
+def compile_tasks(tasks: list[dict]) -> list[dict]:
+    """Compile every task's validation rules up front. Returns the same list."""
+    for task in tasks:
+        spec_for(task)
+    return tasks
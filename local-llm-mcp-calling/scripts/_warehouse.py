@@ -0,0 +1,213 @@
+"""
+SQLite warehouse of benchmark results.
+
+ingest() flattens level*_*.json result files into two tables: one row per
+result file (model, level, run, methodology and its summary) and one row per
+task result (verdict, score, elapsed time and the agentic timing totals),
+indexed on run, methodology, model, level and task. aggregate_results.py,
+the graph loader and verify_stats.py query it instead of each re-reading
+and walking every JSON file.
+
+ingest() keeps a manifest of every file it has read (path, size, mtime,
+sha256) and re-reads only new or changed files, so refreshing a report after
+each save_result costs one file, not the whole run. The database is a cache:
+delete it and the next ingest() rebuilds it. Only the standard library's
+sqlite3 is needed.
+
+Usage:
+    from _warehouse import Warehouse
+    wh = Warehouse()                       # results.sqlite next to results/
+    wh.ingest([run_dir])
+    for f in wh.files([run_dir]): ...
+    rows = wh.task_results([f["id"] for f in files])
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent.parent
+DEFAULT_DB    = Path(os.environ.get("RESULTS_DB", BENCHMARK_DIR / "results.sqlite"))
+
+SCHEMA_VERSION = 4   # bump on any schema change; older databases are rebuilt
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_files (
+    id           INTEGER PRIMARY KEY,
+    path         TEXT UNIQUE NOT NULL,   -- resolved path of the JSON file
+    dir          TEXT NOT NULL,          -- resolved directory it was ingested from
+    methodology  TEXT,                   -- v1_singleshot / v2_agentic, NULL for other dirs
+    run          TEXT NOT NULL,          -- directory name, e.g. run_20260225_163816
+    model        TEXT NOT NULL,
+    level        INTEGER NOT NULL,
+    tool_trained INTEGER NOT NULL,
+    timestamp    TEXT NOT NULL,
+    size         INTEGER NOT NULL,       -- manifest: a file is re-read only when these change
+    mtime_ns     INTEGER NOT NULL,
+    sha256       TEXT NOT NULL,
+    total        INTEGER,
+    passed       INTEGER,
+    pass_rate    REAL,
+    avg_score    REAL,
+    cold_start_ms REAL,                  -- warm-up after a fresh model load, NULL when not recorded or not fresh
+    warm_ms      REAL,
+    ready_s      REAL                    -- model load request to ready, NULL when not recorded
+);
+CREATE TABLE IF NOT EXISTS task_results (
+    file_id      INTEGER NOT NULL REFERENCES result_files(id) ON DELETE CASCADE,
+    pos          INTEGER NOT NULL,       -- order within the file
+    methodology  TEXT,
+    run          TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    level        INTEGER NOT NULL,
+    task_id      TEXT NOT NULL,
+    task_name    TEXT,
+    passed       INTEGER NOT NULL,
+    score        REAL NOT NULL,
+    elapsed_s    REAL,
+    turns        INTEGER,                -- agentic only
+    timed_out    INTEGER,                -- agentic only
+    error        TEXT,
+    llm_ms       REAL,                   -- agentic timing totals, NULL when not recorded
+    mcp_ms       REAL,
+    validate_ms  REAL,
+    mcp_calls    INTEGER,
+    timing_turns INTEGER,                -- number of per-turn timing spans
+    PRIMARY KEY (file_id, pos)
+);
+CREATE INDEX IF NOT EXISTS idx_files_dir         ON result_files(dir);
+CREATE INDEX IF NOT EXISTS idx_files_run         ON result_files(run);
+CREATE INDEX IF NOT EXISTS idx_files_model_level ON result_files(model, level);
+CREATE INDEX IF NOT EXISTS idx_tasks_run         ON task_results(run);
+CREATE INDEX IF NOT EXISTS idx_tasks_methodology ON task_results(methodology);
+CREATE INDEX IF NOT EXISTS idx_tasks_model       ON task_results(model);
+CREATE INDEX IF NOT EXISTS idx_tasks_level       ON task_results(level);
+CREATE INDEX IF NOT EXISTS idx_tasks_task        ON task_results(task_id);
+"""
+
+METHODOLOGIES = ("v1_singleshot", "v2_agentic")
+
+
+def _task_row(file_id: int, pos: int, meta: tuple, r: dict) -> tuple:
+    timing = r.get("timing") or {}
+    return (
+        file_id, pos, *meta,
+        r["task_id"], r.get("task_name"), int(bool(r.get("passed"))), r.get("score", 0.0),
+        r.get("elapsed_s"), r.get("turns"),
+        None if r.get("timed_out") is None else int(r["timed_out"]),
+        r.get("error"),
+        timing.get("llm_ms"), timing.get("mcp_ms"), timing.get("validate_ms"), timing.get("mcp_calls"),
+        len(timing["turns"]) if "turns" in timing else None,
+    )
+
+
+class Warehouse:
+    """One SQLite database of result files and their task results."""
+
+    def __init__(self, path: str | Path = DEFAULT_DB):
+        self.path = Path(path)
+        self.db   = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            # A cache of results/: drop whatever an older version left and start over
+            self.db.executescript("DROP TABLE IF EXISTS task_results; DROP TABLE IF EXISTS result_files;")
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.db.executescript(SCHEMA)
+        self.read    = 0   # files parsed by ingest()
+        self.skipped = 0   # files ingest() found unchanged
+
+    def close(self):
+        self.db.close()
+
+    def ingest(self, dirs: list[Path]) -> int:
+        """
+        Bring the level*_*.json files of these directories up to date. Returns
+        the number of files (re)read.
+
+        A file whose size and mtime match the manifest is skipped without being
+        opened. If they differ but the content hash doesn't, only the manifest
+        is updated. Rows of files that have disappeared are deleted.
+        """
+        read = 0
+        with self.db:
+            for d in dirs:
+                d = Path(d).resolve()
+                known = {row["path"]: row for row in self.db.execute(
+                    "SELECT id, path, size, mtime_ns, sha256 FROM result_files WHERE dir = ?", (str(d),))}
+                for f in sorted(d.glob("level*_*.json")):
+                    path = str(f.resolve())
+                    row  = known.pop(path, None)
+                    try:
+                        st = f.stat()
+                        if row and (row["size"], row["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                            self.skipped += 1
+                            continue
+                        raw = f.read_bytes()
+                    except OSError:
+                        continue
+                    digest = hashlib.sha256(raw).hexdigest()
+                    if row and row["sha256"] == digest:
+                        self.db.execute("UPDATE result_files SET size = ?, mtime_ns = ? WHERE id = ?",
+                                        (st.st_size, st.st_mtime_ns, row["id"]))
+                        self.skipped += 1
+                        continue
+                    if row:
+                        self.db.execute("DELETE FROM result_files WHERE id = ?", (row["id"],))
+                    if self._ingest_file(d, f, raw, st, digest):
+                        read += 1
+                for row in known.values():
+                    self.db.execute("DELETE FROM result_files WHERE id = ?", (row["id"],))
+        self.read += read
+        return read
+
+    def _ingest_file(self, d: Path, f: Path, raw: bytes, st: os.stat_result, digest: str) -> bool:
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return False
+        if not data.get("model") or data.get("level") is None:
+            return False
+
+        methodology = d.parent.name if d.parent.name in METHODOLOGIES else \
+            (d.name if d.name in METHODOLOGIES else None)
+        summary = data.get("summary", {})
+        warmup  = data.get("warmup") or {}
+        cur = self.db.execute(
+            "INSERT INTO result_files (path, dir, methodology, run, model, level, tool_trained, timestamp,"
+            " size, mtime_ns, sha256, total, passed, pass_rate, avg_score, cold_start_ms, warm_ms, ready_s)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (str(f.resolve()), str(d), methodology, d.name, data["model"], data["level"],
+             int(data.get("tool_trained", True)), data.get("timestamp", ""),
+             st.st_size, st.st_mtime_ns, digest,
+             summary.get("total"), summary.get("passed"), summary.get("pass_rate"), summary.get("avg_score"),
+             warmup.get("cold_start_ms"), warmup.get("warm_ms"), data.get("ready_s")),
+        )
+        meta = (methodology, d.name, data["model"], data["level"])
+        self.db.executemany(
+            "INSERT INTO task_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [_task_row(cur.lastrowid, i, meta, r) for i, r in enumerate(data.get("results", []))],
+        )
+        return True
+
+    def files(self, dirs: list[Path]) -> list[sqlite3.Row]:
+        """Result file rows from these directories, in (dir, file name) order."""
+        dirs = [str(Path(d).resolve()) for d in dirs]
+        return self.db.execute(
+            f"SELECT * FROM result_files WHERE dir IN ({', '.join('?' * len(dirs))}) ORDER BY dir, path",
+            dirs,
+        ).fetchall()
+
+    def task_results(self, file_ids: list[int]) -> list[sqlite3.Row]:
+        """Task result rows of these files, by file id then position in the file."""
+        file_ids, rows = sorted(file_ids), []
+        for i in range(0, len(file_ids), 500):   # stay under SQLite's bound-parameter limit
+            chunk = file_ids[i:i + 500]
+            rows.extend(self.db.execute(
+                f"SELECT * FROM task_results WHERE file_id IN ({', '.join('?' * len(chunk))})"
+                " ORDER BY file_id, pos",
+                chunk,
+            ))
+        return rows
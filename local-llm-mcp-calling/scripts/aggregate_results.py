@@ -24,6 +24,9 @@ except ImportError:
     print("Missing: pip install rich")
     import sys; sys.exit(1)
 
+from _ranking_stats import CONFIDENCE, N_RESAMPLES, ranking_uncertainty
+from _warehouse import Warehouse
+
 BENCHMARK_DIR = Path(__file__).parent.parent
 RESULTS_DIR = BENCHMARK_DIR / "results"
 console = Console()
@@ -65,10 +68,15 @@ def find_result_dirs(run_id: str | None = None) -> list[Path]:
 
 
 def load_results(result_dirs: list[Path]) -> list[dict]:
-    """Load all JSON result files from given directories, deduplicate by model+level (keep latest)."""
-    files = []
-    for d in result_dirs:
-        files.extend(sorted(d.glob("level*_*.json")))
+    """Load result files from given directories via the warehouse, deduplicate by model+level (keep latest).
+
+    Each entry has the file's level, model, tool_trained, timestamp and summary,
+    plus its task result rows under "results".
+    """
+    warehouse = Warehouse()
+    warehouse.ingest(result_dirs)
+    console.print(f"[dim]Warehouse: {warehouse.read} file(s) read, {warehouse.skipped} unchanged[/dim]")
+    files = warehouse.files(result_dirs)
 
     if not files:
         dirs_str = ", ".join(str(d) for d in result_dirs) if result_dirs else "none found"
@@ -78,14 +86,28 @@ def load_results(result_dirs: list[Path]) -> list[dict]:
     # Group by (level, model), keep latest
     by_model_level = {}
     for f in files:
-        with open(f) as fh:
-            data = json.load(fh)
-        key = (data["level"], data["model"])
-        ts = data.get("timestamp", "")
-        if key not in by_model_level or ts > by_model_level[key]["timestamp"]:
-            by_model_level[key] = data
-
-    return list(by_model_level.values())
+        key = (f["level"], f["model"])
+        if key not in by_model_level or f["timestamp"] > by_model_level[key]["timestamp"]:
+            by_model_level[key] = f
+
+    results = defaultdict(list)
+    for row in warehouse.task_results([f["id"] for f in by_model_level.values()]):
+        results[row["file_id"]].append(dict(row))
+    warehouse.close()
+
+    return [
+        {
+            "level":        f["level"],
+            "model":        f["model"],
+            "tool_trained": bool(f["tool_trained"]),
+            "timestamp":    f["timestamp"],
+            "summary":      {k: f[k] for k in ("total", "passed", "pass_rate", "avg_score")},
+            "warmup":       {k: f[k] for k in ("cold_start_ms", "warm_ms")},
+            "ready_s":      f["ready_s"],
+            "results":      results[f["id"]],
+        }
+        for f in by_model_level.values()
+    ]
 
 
 def build_matrix(all_results: list[dict]) -> dict:
@@ -104,9 +126,109 @@ def build_matrix(all_results: list[dict]) -> dict:
     return {"models": models, "levels": levels, "data": matrix}
 
 
+def build_timing(all_results: list[dict]) -> dict:
+    """Roll task timing spans up to model -> level -> totals (agentic results only).
+
+    Each rollup has seconds spent in the model (llm_s), in MCP calls (mcp_s) and
+    in validation (validate_s), plus task, turn and MCP call counts, and for
+    the load that ran the level its time to ready (ready_s) and cold start
+    (cold_start_s), None if not recorded. Level None holds the per-model total
+    across levels, with the slowest load.
+    """
+    timing = defaultdict(dict)
+    for r in all_results:
+        tasks = [t for t in r.get("results", []) if t["llm_ms"] is not None]
+        if not tasks:
+            continue
+        timing[r["model"]][r["level"]] = {
+            "tasks":      len(tasks),
+            "turns":      sum(t["timing_turns"] for t in tasks),
+            "mcp_calls":  sum(t["mcp_calls"] for t in tasks),
+            "llm_s":      sum(t["llm_ms"] for t in tasks) / 1000,
+            "mcp_s":      sum(t["mcp_ms"] for t in tasks) / 1000,
+            "validate_s": sum(t["validate_ms"] for t in tasks) / 1000,
+            "ready_s":    r["ready_s"],
+            "cold_start_s": None if r["warmup"]["cold_start_ms"] is None else r["warmup"]["cold_start_ms"] / 1000,
+        }
+    for levels in timing.values():
+        per_load = ("ready_s", "cold_start_s")
+        levels[None] = {k: sum(lv[k] for lv in levels.values())
+                        for k in next(iter(levels.values())) if k not in per_load}
+        for k in per_load:
+            seen = [lv[k] for lv in levels.values() if lv.get(k) is not None]
+            levels[None][k] = max(seen) if seen else None
+    return dict(timing)
+
+
+def overall_score(matrix: dict, model: str) -> float | None:
+    """A model's Overall column: the mean of its levels' avg_score, None without results."""
+    levels = matrix["data"].get(model, {}).values()
+    return sum(s["avg_score"] for s in levels) / len(levels) if levels else None
+
+
+def rank_models(matrix: dict) -> list[str]:
+    """Models by overall score, best first, ties by name: the row order of every report table."""
+    return sorted(matrix["models"], key=lambda m: (-(overall_score(matrix, m) or 0), m))
+
+
+def build_uncertainty(matrix: dict, all_results: list[dict], n_resamples: int = N_RESAMPLES) -> list[dict]:
+    """
+    Bootstrap CIs and neighbour permutation tests for models in rank_models() order.
+    Each row's "score" is the model's Overall from the comparison table, so both
+    sections show the same figure; intervals and tests come from per-task scores.
+    """
+    scores = defaultdict(dict)
+    for r in all_results:
+        scores[r["model"]][r["level"]] = {t["task_id"]: t["score"] for t in r.get("results", [])}
+
+    rows = ranking_uncertainty(scores, rank_models(matrix), n_resamples)
+    for row in rows:
+        row["score"] = overall_score(matrix, row["model"])
+    return rows
+
+
+def _ci(v: list[float] | None) -> str:
+    return f"{v[1]:.0%}–{v[2]:.0%}" if v else "—"
+
+
+def _timing_row(t: dict) -> list[str]:
+    busy = t["llm_s"] + t["mcp_s"] + t["validate_s"]
+    return [
+        f"{t['llm_s']:.1f}s",
+        f"{t['mcp_s']:.1f}s",
+        f"{t['validate_s'] * 1000:.0f}ms",
+        str(t["mcp_calls"]),
+        f"{t['llm_s'] / t['turns']:.2f}s" if t["turns"] else "—",
+        f"{t['llm_s'] / busy:.0%}" if busy else "—",
+        f"{t['ready_s']:.1f}s" if t["ready_s"] is not None else "—",
+        f"{t['cold_start_s']:.1f}s" if t["cold_start_s"] is not None else "—",
+    ]
+
+
+TIMING_COLUMNS = ["LLM", "MCP", "Validate", "MCP calls", "LLM/turn", "LLM share", "Ready", "Cold start"]
+
+
+def print_timing_table(timing: dict):
+    table = Table(
+        title="Where the time went — agentic runs",
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Model", style="bold", no_wrap=True)
+    table.add_column("Level", justify="center")
+    for col in TIMING_COLUMNS:
+        table.add_column(col, justify="right")
+
+    for model in sorted(timing, key=lambda m: -timing[m][None]["llm_s"]):
+        levels = timing[model]
+        for lvl in sorted(l for l in levels if l is not None):
+            table.add_row(model, f"L{lvl}", *_timing_row(levels[lvl]))
+        table.add_row(model, "all", *_timing_row(levels[None]), style="bold")
+    console.print(table)
+
+
 def print_comparison_table(matrix: dict):
     levels = matrix["levels"]
-    models = matrix["models"]
     data = matrix["data"]
 
     table = Table(
@@ -122,35 +244,27 @@ def print_comparison_table(matrix: dict):
         table.add_column(f"L{lvl} Score", justify="center")
     table.add_column("Overall", justify="center", style="bold yellow")
 
-    rows = []
-    for model in models:
+    for model in rank_models(matrix):
         row = [model]
-        scores = []
         for lvl in levels:
             stats = data.get(model, {}).get(lvl)
             if stats:
                 pass_pct = f"{stats['pass_rate']:.0%}"
                 avg_score = f"{stats['avg_score']:.0%}"
-                scores.append(stats["avg_score"])
             else:
                 pass_pct = "—"
                 avg_score = "—"
             row.extend([pass_pct, avg_score])
-        overall = f"{sum(scores)/len(scores):.0%}" if scores else "—"
-        row.append(overall)
-        rows.append((sum(scores) / len(scores) if scores else 0, row))
-
-    # Sort by overall score descending
-    rows.sort(reverse=True, key=lambda x: x[0])
-    for _, row in rows:
+        overall = overall_score(matrix, model)
+        row.append(f"{overall:.0%}" if overall is not None else "—")
         table.add_row(*row)
 
     console.print(table)
 
 
-def generate_markdown(matrix: dict, all_results: list[dict]) -> str:
+def generate_markdown(matrix: dict, all_results: list[dict], timing: dict | None = None,
+                      uncertainty: list[dict] | None = None) -> str:
     levels = matrix["levels"]
-    models = matrix["models"]
     data = matrix["data"]
 
     lines = []
@@ -169,29 +283,38 @@ def generate_markdown(matrix: dict, all_results: list[dict]) -> str:
     lines.append(header)
     lines.append(separator)
 
-    rows_with_score = []
-    for model in models:
-        scores = []
+    for model in rank_models(matrix):
         row = f"| {model} |"
         for lvl in levels:
             stats = data.get(model, {}).get(lvl)
             if stats:
                 pass_pct = f"{stats['pass_rate']:.0%}"
                 avg_score = f"{stats['avg_score']:.0%}"
-                scores.append(stats["avg_score"])
             else:
                 pass_pct = "—"
                 avg_score = "—"
             row += f" {pass_pct} | {avg_score} |"
-        overall = f"{sum(scores)/len(scores):.0%}" if scores else "—"
-        row += f" **{overall}** |"
-        rows_with_score.append((sum(scores)/len(scores) if scores else 0, row))
-
-    for _, row in sorted(rows_with_score, reverse=True):
+        overall = overall_score(matrix, model)
+        row += f" **{f'{overall:.0%}' if overall is not None else '—'}** |"
         lines.append(row)
 
     lines.append("")
 
+    if uncertainty:
+        lines.append("\n### Ranking Uncertainty\n")
+        lines.append(f"*{CONFIDENCE:.0%} bootstrap confidence intervals, resampling tasks within each level. "
+                     f"p: paired permutation test of the overall score against the next model down.*\n")
+        lines.append("| # | Model | Overall | CI |" + "".join(f" L{lvl} CI |" for lvl in levels) + " Δ next | p |")
+        lines.append("|---|-------|---------|----|" + "--------|" * len(levels) + "--------|---|")
+        for rank, u in enumerate(uncertainty, 1):
+            nxt = u["vs_next"]
+            lines.append(
+                f"| {rank} | {u['model']} | {u['score']:.0%} | {_ci(u['overall'])} |"
+                + "".join(f" {_ci(u['levels'].get(lvl))} |" for lvl in levels)
+                + (f" {nxt['delta'] * 100:+.1f}pp | {nxt['p_value']:.3f} |" if nxt else " — | — |")
+            )
+        lines.append("")
+
     # Per-task breakdown by level
     for lvl in levels:
         level_results = [r for r in all_results if r["level"] == lvl]
@@ -200,17 +323,16 @@ def generate_markdown(matrix: dict, all_results: list[dict]) -> str:
 
         lines.append(f"\n### Level {lvl} — Task Breakdown\n")
 
-        # Collect all task IDs for this level
-        task_ids = []
+        # Collect all task IDs for this level, and each model's result per task
         task_names = {}
+        by_model_task = {}
         for r in level_results:
             for task_r in r.get("results", []):
                 tid = task_r["task_id"]
-                if tid not in task_ids:
-                    task_ids.append(tid)
-                    task_names[tid] = task_r["task_name"]
+                task_names.setdefault(tid, task_r["task_name"])
+                by_model_task.setdefault((r["model"], tid), task_r)
 
-        task_ids.sort()
+        task_ids = sorted(task_names)
 
         # Header
         header = "| Task |"
@@ -227,21 +349,24 @@ def generate_markdown(matrix: dict, all_results: list[dict]) -> str:
         for tid in task_ids:
             row = f"| {tid}: {task_names.get(tid, '')[:40]} |"
             for model in model_cols:
-                model_result = next((r for r in level_results if r["model"] == model), None)
-                if model_result:
-                    task_result = next(
-                        (tr for tr in model_result.get("results", []) if tr["task_id"] == tid),
-                        None
-                    )
-                    if task_result:
-                        icon = "✅" if task_result["passed"] else "❌"
-                        row += f" {icon} {task_result['score']:.0%} |"
-                    else:
-                        row += " — |"
+                task_result = by_model_task.get((model, tid))
+                if task_result:
+                    icon = "✅" if task_result["passed"] else "❌"
+                    row += f" {icon} {task_result['score']:.0%} |"
                 else:
                     row += " — |"
             lines.append(row)
 
+    if timing:
+        lines.append("\n### Time Breakdown (agentic)\n")
+        lines.append("| Model | Level | " + " | ".join(TIMING_COLUMNS) + " |")
+        lines.append("|-------|-------|" + "------|" * len(TIMING_COLUMNS))
+        for model in sorted(timing, key=lambda m: -timing[m][None]["llm_s"]):
+            levels = timing[model]
+            for lvl in sorted(l for l in levels if l is not None):
+                lines.append(f"| {model} | L{lvl} | " + " | ".join(_timing_row(levels[lvl])) + " |")
+            lines.append(f"| **{model}** | **all** | " + " | ".join(_timing_row(levels[None])) + " |")
+
     return "\n".join(lines)
 
 
@@ -256,6 +381,8 @@ def main():
         help="Legacy: flat directory containing level*_*.json files (overrides --run)",
     )
     parser.add_argument("--output", "-o", help="Write markdown report to this file")
+    parser.add_argument("--resamples", type=int, default=N_RESAMPLES,
+                        help=f"Bootstrap resamples and permutations for the ranking intervals (default: {N_RESAMPLES})")
     args = parser.parse_args()
 
     if args.results_dir:
@@ -281,6 +408,9 @@ def main():
 
     matrix = build_matrix(all_results)
     print_comparison_table(matrix)
+    timing = build_timing(all_results)
+    if timing:
+        print_timing_table(timing)
 
     # Determine where to write the report
     if args.output:
@@ -290,7 +420,8 @@ def main():
     else:
         report_path = RESULTS_DIR / "aggregated_report.md"
 
-    md = generate_markdown(matrix, all_results)
+    uncertainty = build_uncertainty(matrix, all_results, args.resamples)
+    md = generate_markdown(matrix, all_results, timing, uncertainty)
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(md)
     console.print(f"[dim]Markdown report written to {report_path}[/dim]")
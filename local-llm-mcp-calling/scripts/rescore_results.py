@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Offline Re-scorer
+Re-applies the current task validation to archived results, so a change to
+the validation rules can be measured without re-running any model. Needs no
+LM Studio and no MCP server: only the stored tool_calls are re-scored.
+
+Every level*_*.json under results/v1_singleshot and results/v2_agentic is
+scored in a process pool. The re-scored copy (new per-task verdicts, new
+summary, the previous summary and the changed verdicts) is written to a
+rescored/ directory next to the original, which stays untouched. Files are
+not rewritten with --dry-run.
+
+Usage:
+    python rescore_results.py                     # All runs, both runners
+    python rescore_results.py --run 20260225_163816
+    python rescore_results.py --dry-run           # Only print changed verdicts
+    python rescore_results.py --workers 4
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Missing: pip install rich")
+    import sys; sys.exit(1)
+
+import runner_v1_singleshot
+import runner_v2_agentic
+from _mcp_store import McpStore
+from _validation_spec import compile_tasks
+
+BENCHMARK_DIR = Path(__file__).parent.parent
+RESULTS_DIR   = BENCHMARK_DIR / "results"
+RESCORED_DIR  = "rescored"   # created inside each run directory
+
+# Results directory -> the runner whose validate() produced its scores
+RUNNERS = {
+    "v1_singleshot": runner_v1_singleshot,
+    "v2_agentic":    runner_v2_agentic,
+}
+
+console = Console()
+
+
+def find_result_files(run_id: str | None = None) -> list[tuple[str, Path]]:
+    """(runner dir name, path) for every result file, each real file once."""
+    files, seen = [], set()
+    for version_dir in RUNNERS:
+        base = RESULTS_DIR / version_dir
+        if not base.exists():
+            continue
+        roots = [base / f"run_{run_id}"] if run_id else [base]
+        for root in roots:
+            for path in sorted(root.rglob("level*_*.json")):
+                real = path.resolve()
+                if RESCORED_DIR in path.relative_to(root).parts or real in seen:
+                    continue
+                seen.add(real)
+                files.append((version_dir, path))
+    return files
+
+
+_TASKS: dict[int, dict[str, dict]] = {}   # per-process: level -> task id -> task
+
+
+def _tasks(level: int) -> dict[str, dict]:
+    if level not in _TASKS:
+        with open(runner_v2_agentic.TASK_FILES[level]) as f:
+            _TASKS[level] = {t["id"]: t for t in compile_tasks(json.load(f)["tasks"])}
+    return _TASKS[level]
+
+
+def rescore_file(version_dir: str, path: Path, write: bool = True) -> dict:
+    """Re-score one result file. Returns its old and new summaries and the changed verdicts."""
+    validate = RUNNERS[version_dir].validate
+    with open(path) as f:
+        data = json.load(f)
+    tasks = _tasks(data["level"])
+    # Results saved with --mcp-store reference their MCP responses by hash
+    store = McpStore(path.parent / data["mcp_store"]) if data.get("mcp_store") else None
+
+    changed = []
+    for r in data.get("results", []):
+        task = tasks.get(r["task_id"])
+        if task is None:
+            continue   # task since removed from the task file: keep the stored verdict
+        calls = r.get("tool_calls", [])
+        if store:
+            calls = store.hydrate([dict(tc) for tc in calls])
+        passed, score, details = validate(calls, task)
+        # run_task prepends the timeout note; it isn't part of validation
+        if r.get("timed_out") and (r.get("details") or [""])[0].startswith("Task timed out"):
+            details.insert(0, r["details"][0])
+        if passed != r["passed"] or round(score, 3) != round(r["score"], 3):
+            changed.append({
+                "task_id": r["task_id"],
+                "passed":  [r["passed"], passed],
+                "score":   [round(r["score"], 3), round(score, 3)],
+            })
+        r.update(passed=passed, score=score, details=details)
+
+    results = data.get("results", [])
+    total   = len(results)
+    passed  = sum(1 for r in results if r["passed"])
+    avg     = sum(r["score"] for r in results) / total if total else 0.0
+    old_summary     = data.get("summary", {})
+    data["summary"] = {
+        "total":     total,
+        "passed":    passed,
+        "pass_rate": round(passed / total, 3) if total else 0.0,
+        "avg_score": round(avg, 3),
+    }
+    data["rescore"] = {
+        "rescored_at":      datetime.now().isoformat(),
+        "source":           path.name,
+        "previous_summary": old_summary,
+        "changed":          changed,
+    }
+
+    if write:
+        out = path.parent / RESCORED_DIR / path.name
+        out.parent.mkdir(exist_ok=True)
+        with open(out, "w") as f:
+            json.dump(data, f, indent=2)
+
+    return {
+        "runner":  version_dir,
+        "path":    str(path),
+        "model":   data["model"],
+        "level":   data["level"],
+        "old":     old_summary,
+        "new":     data["summary"],
+        "changed": changed,
+    }
+
+
+def print_changes(outcomes: list[dict]):
+    """One row per file whose verdicts changed."""
+    rows = [o for o in outcomes if o["changed"]]
+    if not rows:
+        console.print("[green]No verdicts changed.[/green]")
+        return
+
+    table = Table(title="Changed verdicts", show_lines=False)
+    table.add_column("Runner", style="dim")
+    table.add_column("Model", style="bold")
+    table.add_column("Level", justify="center")
+    table.add_column("Passed", justify="right")
+    table.add_column("Avg score", justify="right")
+    table.add_column("Tasks changed")
+    for o in sorted(rows, key=lambda o: (o["runner"], o["model"], o["level"])):
+        old, new = o["old"], o["new"]
+        tasks = ", ".join(
+            f"{c['task_id']} {'✅' if c['passed'][1] else '❌'} {c['score'][0]:.0%}→{c['score'][1]:.0%}"
+            for c in o["changed"]
+        )
+        table.add_row(
+            o["runner"], o["model"], f"L{o['level']}",
+            f"{old.get('passed', '?')}→{new['passed']}/{new['total']}",
+            f"{old.get('avg_score', 0):.0%}→{new['avg_score']:.0%}",
+            tasks,
+        )
+    console.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score archived benchmark results offline")
+    parser.add_argument("--run", help="Only this run timestamp (e.g., 20260225_163816). Default: every run.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Processes to score with (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report changed verdicts without writing files")
+    args = parser.parse_args()
+
+    files = find_result_files(args.run)
+    if not files:
+        console.print("[red]No result files found.[/red]")
+        return
+
+    start = datetime.now()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        outcomes = list(pool.map(rescore_file, *zip(*files), [not args.dry_run] * len(files),
+                                 chunksize=max(1, len(files) // (4 * (args.workers or 1)))))
+    elapsed = (datetime.now() - start).total_seconds()
+
+    tasks   = sum(o["new"]["total"] for o in outcomes)
+    changed = sum(len(o["changed"]) for o in outcomes)
+    console.print(f"\n[dim]Re-scored {len(files)} file(s), {tasks} task result(s) in {elapsed:.1f}s "
+                  f"— {changed} verdict(s) changed[/dim]\n")
+    print_changes(outcomes)
+    if not args.dry_run:
+        console.print(f"[dim]Re-scored copies written to {RESCORED_DIR}/ next to each result file[/dim]")
+
+
+if __name__ == "__main__":
+    main()
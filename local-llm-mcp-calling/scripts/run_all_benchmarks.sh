@@ -19,6 +19,8 @@
 #   BENCH_MODEL     - Run only this model (default: all models from models.txt)
 #   BENCH_LEVEL     - Run only this level 0|1|2 (default: all levels)
 #   BENCH_PHASES    - Comma-separated phases to run: ss,ag,report (default: all)
+#                     With both ss and ag, each model is loaded once for both
+#                     (run_combined.py); set BENCH_SEPARATE=1 to run them one after the other
 #   BENCH_RESUME    - Resume a previous run by timestamp (e.g., 20260225_143000)
 #                     Reuses existing run dirs and skips completed model+level combos
 set -euo pipefail
@@ -75,6 +77,32 @@ echo " Phases: $PHASES"
 echo "============================================"
 echo ""
 
+# ── Phases 1+2 on one load per model ─────────────────────────────────────
+if [[ "$PHASES" == *"ss"* && "$PHASES" == *"ag"* && -z "${BENCH_SEPARATE:-}" ]]; then
+    echo "╔══════════════════════════════════════════╗"
+    echo "║  Phases 1+2: Single-shot + Agentic ($MODEL_COUNT models)"
+    echo "╚══════════════════════════════════════════╝"
+    echo ""
+
+    python3 scripts/run_combined.py \
+        $MODEL_FLAG \
+        $LEVEL_FLAG \
+        --token "$TOKEN" \
+        --refresh-token "$REFRESH_TOKEN" \
+        --ss-results-dir "$SS_DIR" \
+        --ag-results-dir "$AG_DIR" \
+        --local \
+        $FORCE_FLAG \
+        --no-git \
+        --yes
+
+    echo ""
+    echo "Single-shot + agentic complete at $(date)"
+    echo ""
+    PHASES="${PHASES//ss/}"
+    PHASES="${PHASES//ag/}"
+fi
+
 # ── Phase 1: Single-shot ─────────────────────────────────────────────────
 if [[ "$PHASES" == *"ss"* ]]; then
     echo "╔══════════════════════════════════════════╗"
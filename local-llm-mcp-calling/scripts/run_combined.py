@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Workunit MCP Benchmark — single-shot and agentic on one model load
+
+Running runner_v1_singleshot.py over every model and then runner_v2_agentic.py
+over every model loads and unloads each model twice. This driver loads each
+model (or co-load group) once, runs its single-shot levels, then its agentic
+levels, and only then unloads it, so a full run needs half the model loads.
+
+Both runners are imported as modules: their run_model() takes the already
+loaded instance and leaves unloading to this driver. Results land in the
+usual results/v1_singleshot and results/v2_agentic directories, so
+aggregate_results.py and the reports need no change. Load order, co-loading
+and --prefetch work as in the runners.
+
+Usage:
+    export WORKUNIT_TOKEN=your_token
+    python run_combined.py --models ../models.txt
+    python run_combined.py --model mistralai/ministral-3-3b --level 0
+    python run_combined.py --models ../models.txt \\
+        --ss-results-dir ../results/v1_singleshot/run_X --ag-results-dir ../results/v2_agentic/run_X
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+import runner_v1_singleshot as ss
+import runner_v2_agentic as ag
+from _fake_workunit import FakeWorkunitServer
+from _load_planner import LoadHistory, Prefetcher, plan_loads
+
+console = ag.console
+
+# Script that re-runs one model's failed part
+RERUN = {"load": "run_combined.py", "single-shot": "runner_v1_singleshot.py", "agentic": "runner_v2_agentic.py"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Workunit MCP Benchmark — single-shot and agentic, one load per model")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--model", "-m", help="Single model ID")
+    group.add_argument("--models", help="Path to models.txt")
+
+    parser.add_argument("--level", type=int, choices=[0, 1, 2], help="Run only this level")
+    parser.add_argument("--no-git", action="store_true", help="Skip git commits")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-run levels that already have result files (default: skip completed levels)",
+    )
+    parser.add_argument(
+        "--token",
+        help="Workunit MCP bearer token (or set WORKUNIT_TOKEN env var)",
+        default=os.environ.get("WORKUNIT_TOKEN", ""),
+    )
+    parser.add_argument(
+        "--refresh-token",
+        help="OAuth refresh token for automatic renewal (or set WORKUNIT_REFRESH_TOKEN env var)",
+        default=os.environ.get("WORKUNIT_REFRESH_TOKEN", ""),
+    )
+    parser.add_argument(
+        "--local", action="store_true",
+        help="Use local dev stack (MCP at localhost:9000, OAuth at localhost:3000)",
+    )
+    parser.add_argument(
+        "--yes", "-y", action="store_true",
+        help="Skip the destructive data warning prompt",
+    )
+    parser.add_argument(
+        "--fake-mcp", action="store_true",
+        help="Run MCP tool calls against an in-process fake Workunit server (no network, no token)",
+    )
+    parser.add_argument(
+        "--ss-results-dir",
+        help="Directory to write single-shot result files (default: results/v1_singleshot/)",
+    )
+    parser.add_argument(
+        "--ag-results-dir",
+        help="Directory to write agentic result files (default: results/v2_agentic/)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, metavar="N",
+        help="Run up to N independent agentic L0/L1 tasks at once (default: 1)",
+    )
+    parser.add_argument(
+        "--load-order", choices=["planned", "file"], default="planned",
+        help="planned: order models by recorded load cost and co-load small ones (default); "
+             "file: models.txt order, one model loaded at a time",
+    )
+    parser.add_argument(
+        "--vram-gb", type=float, default=float(os.environ.get("LMSTUDIO_VRAM_GB", "0")), metavar="GB",
+        help="VRAM budget for co-loading several small models at once (or set LMSTUDIO_VRAM_GB; "
+             "default: 0 = one model at a time)",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true",
+        help="Skip the warm-up requests after each model load (the first task then pays the cold start)",
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true",
+        help="During each model's last agentic level, load the next model in the background if both "
+             "fit in --vram-gb, else read its weights into the page cache (LM Studio on this machine)",
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+
+    # Both runners share one load history and one MCP setup
+    history = LoadHistory()
+    fake    = FakeWorkunitServer() if args.fake_mcp else None
+    for runner in (ss, ag):
+        runner.LOAD_HISTORY = history
+        runner.WARMUP       = not args.no_warmup
+        if args.local:
+            runner.MCP_URL         = "http://localhost:9000/mcp"
+            runner.OAUTH_TOKEN_URL = "http://localhost:3000/oauth/token"
+        if fake:
+            runner.MCP_FAKE_SERVER = fake
+    ss.READY_S = ag.READY_S   # models are loaded through the agentic runner's load_model()
+    if args.ss_results_dir:
+        ss.RESULTS_DIR = Path(args.ss_results_dir)
+    if args.ag_results_dir:
+        ag.RESULTS_DIR = Path(args.ag_results_dir)
+    if fake:
+        args.token = args.token or "fake"
+
+    if not args.token:
+        console.print("[red]Error: Workunit bearer token required for the agentic runs.[/red]")
+        console.print("Pass via --token or set WORKUNIT_TOKEN env var.")
+        sys.exit(1)
+
+    if not args.yes:
+        console.print("[bold yellow]WARNING: The benchmark deletes ALL projects, workunits, assets, and directories[/bold yellow]")
+        console.print("[bold yellow]in your org between each model run. Use a dedicated Workunit account.[/bold yellow]\n")
+        confirm = input("Type 'yes' to continue (or use --yes to skip): ")
+        if confirm.strip().lower() != "yes":
+            console.print("Aborted.")
+            return
+
+    levels = [args.level] if args.level is not None else [0, 1, 2]
+
+    if args.model:
+        default_models_file = ag.BENCHMARK_DIR / "models.txt"
+        tool_trained = True
+        if default_models_file.exists():
+            tool_trained = dict(ag.load_models_file(str(default_models_file))).get(args.model, True)
+        model_list = [(args.model, tool_trained)]
+    else:
+        model_list = ag.load_models_file(args.models)
+
+    def needs_run(model_id: str) -> bool:
+        return ss.needs_run(model_id, levels, args.force) or ag.needs_run(model_id, levels, args.force)
+
+    planned = args.load_order == "planned" and len(model_list) > 1
+    if planned:
+        load_plan = plan_loads(model_list, ag.model_sizes_gb(), history, ag._LMSTUDIO_HOST, args.vram_gb,
+                               ag.MODEL_CONTEXT_LENGTH)
+    else:
+        load_plan = [[item] for item in model_list]
+    prefetch = args.prefetch and len(load_plan) > 1
+
+    console.print(ag.Panel(
+        f"[bold cyan]Workunit MCP Benchmark — Single-shot + Agentic[/bold cyan]\n\n"
+        f"Models: {len(model_list)}\n"
+        f"Levels: {levels}\n"
+        f"Load order: {'planned' if planned else 'file'}"
+        + (f" ({len(load_plan)} load group(s), VRAM budget {args.vram_gb:g} GB)\n" if planned and args.vram_gb else "\n") +
+        f"Prefetch: {'yes' if prefetch else 'no'}\n"
+        f"Force re-run: {'yes' if args.force else 'no (skipping completed levels)'}\n"
+        f"Results: {ss.RESULTS_DIR}\n"
+        f"         {ag.RESULTS_DIR}\n"
+        f"LM Studio: {ag.LMSTUDIO_BASE_URL}\n"
+        f"MCP: {ag.MCP_URL}",
+        title="Starting Run"
+    ))
+
+    # Clear VRAM before starting — any leftover model could crowd out benchmark models
+    ag.unload_all_models()
+
+    start = time.time()
+    loads = 0
+    failed = []   # (model_id, "load" | "single-shot" | "agentic")
+    prefetcher = (Prefetcher(partial(ag.load_model, concurrent=True), ag.model_files(), ag.model_sizes_gb(),
+                             args.vram_gb, ag.MODEL_CONTEXT_LENGTH) if prefetch else None)
+    i = 0
+    for n, group in enumerate(load_plan):
+        instances  = prefetcher.take() if prefetcher else {}
+        prefetched = set(instances)   # loaded in the background, so not a cold start
+        pending    = [m for m, _ in group if needs_run(m)]
+        to_load    = [m for m in pending if m not in instances]
+        loads     += len(instances) + len(to_load)
+        if len(to_load) > 1:
+            instances.update(ag.load_group(to_load))
+        elif to_load:
+            console.print(f"\n[dim]Loading {to_load[0]} (ctx={ag.MODEL_CONTEXT_LENGTH})...[/dim]")
+            instance_id = ag.load_model(to_load[0])
+            if instance_id:
+                instances[to_load[0]] = instance_id
+
+        on_last_level = None
+        if prefetcher and pending:
+            upcoming = next((ids for g in load_plan[n + 1:] if (ids := [m for m, _ in g if needs_run(m)])), [])
+            if upcoming:
+                on_last_level = partial(ag.start_prefetch, prefetcher, upcoming, pending)
+        try:
+            for model_id, tool_trained in group:
+                i += 1
+                console.print(f"\n[dim]── Model {i}/{len(model_list)} ──────────────────────────────[/dim]")
+                if model_id in pending and model_id not in instances:
+                    console.print(f"  [red]{model_id} failed to load, skipping[/red]")
+                    failed.append((model_id, "load"))
+                    continue
+                instance_id = instances.get(model_id)
+                # Only the first runner to send requests to a fresh load sees a cold start.
+                # Each warms up with its own TOOLS, which differ between v1 and v2.
+                cold          = model_id not in prefetched
+                last, ss_runs = None, True
+                # Each methodology has its own guard: a single-shot crash must not skip the agentic run
+                try:
+                    # pending is empty when the whole group is already done (resumed run)
+                    last    = on_last_level if pending and model_id == pending[-1] else None
+                    ss_runs = ss.needs_run(model_id, levels, args.force)
+                    console.print("[bold]Single-shot[/bold]")
+                    ss.run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
+                                 args.force, args.no_git, instance_id,
+                                 None if ag.needs_run(model_id, levels, args.force) else last, cold)
+                except Exception as e:
+                    console.print(f"[red]Single-shot run of {model_id} crashed unexpectedly: {e}[/red]")
+                    failed.append((model_id, "single-shot"))
+                try:
+                    console.print("[bold]Agentic[/bold]")
+                    ag.run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
+                                 args.force, args.no_git, False, args.concurrency,
+                                 instance_id, last, cold and not ss_runs)
+                except Exception as e:
+                    console.print(f"[red]Agentic run of {model_id} crashed unexpectedly: {e}[/red]")
+                    console.print("[dim]Continuing to next model...[/dim]")
+                    failed.append((model_id, "agentic"))
+        finally:
+            ag.unload_group(instances)
+
+    elapsed = time.time() - start
+    console.print(f"\n[bold green]Run complete![/bold green] {loads} model load(s), {elapsed/60:.1f} minutes total")
+
+    if failed:
+        console.print(f"\n[yellow]Models that failed (can be re-run individually):[/yellow]")
+        for m, part in failed:
+            console.print(f"  [dim]{part}:[/dim] python {RERUN[part]} --model {m} --token $WORKUNIT_TOKEN --yes")
+
+    console.print("\n[dim]To generate the aggregated report:[/dim]")
+    console.print(f"  python {Path(__file__).parent / 'aggregate_results.py'}")
+
+
+if __name__ == "__main__":
+    main()
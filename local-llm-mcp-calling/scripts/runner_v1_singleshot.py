@@ -31,12 +31,16 @@ Requirements:
 """
 
 import argparse
+import atexit
 import json
 import os
 import re
 import sys
 import time
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 
@@ -46,10 +50,21 @@ try:
     from rich.table import Table
     from rich.panel import Panel
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Missing dependencies. Run: pip install openai rich requests")
     sys.exit(1)
 
+from _fake_workunit import FakeWorkunitServer
+from _fixtures import load_fixture_spec, seed_fixtures
+from _load_planner import LoadHistory, Prefetcher, group_cost, plan_loads, weight_files
+from _mcp_cassette import Cassette
+from _mcp_store import McpStore
+from _model_loader import load_and_wait
+from _streaming import stream_chat
+from _validation_spec import SEQUENCE_TYPES, compile_tasks, spec_for
+from _validation_spec import normalize as _normalize
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 _LMSTUDIO_HOST     = os.environ.get("LMSTUDIO_HOST", "localhost:1234")
@@ -57,6 +72,17 @@ LMSTUDIO_BASE_URL  = f"http://{_LMSTUDIO_HOST}/v1"
 LMSTUDIO_MGMT_URL  = f"http://{_LMSTUDIO_HOST}"
 MCP_URL            = os.environ.get("MCP_URL", "https://workunit.app/mcp")
 MCP_CALL_TIMEOUT   = int(os.environ.get("MCP_CALL_TIMEOUT", "60"))
+MCP_POOL_SIZE      = int(os.environ.get("MCP_POOL_SIZE", "10"))
+RESET_WORKERS      = int(os.environ.get("RESET_WORKERS", "8"))     # parallel deletes during org reset
+RESET_MAX_PAGES    = 1000  # safety stop when walking list pages
+MCP_CASSETTE       = None  # Cassette set by --record-mcp / --replay-mcp
+MCP_FAKE_SERVER    = None  # FakeWorkunitServer set by --fake-mcp
+STREAM_COMPLETIONS = False # --stream: stream completions and record per-turn latency metrics
+WARMUP             = True  # --no-warmup clears: send warm-up requests after each model load
+LOAD_STALL_S       = float(os.environ.get("LOAD_STALL_S", "180"))  # abandon a stuck load after this long (see load_model)
+READY_S            = {}    # model_id -> seconds from load request to ready, for its last load
+MCP_STORE          = None  # McpStore set by --mcp-store: keep MCP responses as hashed side-car blobs
+LOAD_HISTORY       = None  # LoadHistory set in main(): model load/unload latencies
 
 BENCHMARK_DIR       = Path(__file__).parent.parent
 TASKS_DIR           = BENCHMARK_DIR / "tasks"
@@ -92,14 +118,35 @@ class MCPClient:
     """
     Minimal stateful MCP client over HTTP (streamable transport).
     Handles initialize handshake, tool calls, and transparent token refresh.
+
+    All requests go through one pooled keep-alive session, so consecutive tool
+    calls reuse the same TCP/TLS connection instead of reconnecting each time —
+    connection setup no longer lands in every task's elapsed_s.
     """
 
-    def __init__(self, token: str, refresh_token: str = ""):
+    def __init__(self, token: str, refresh_token: str = "", pool_size: int = MCP_POOL_SIZE,
+                 cassette: Cassette | None = None):
         self.token           = token
+        self.cassette        = cassette or MCP_CASSETTE
+        self.server          = MCP_FAKE_SERVER
         self.refresh_token   = refresh_token
         self.session         = None
         self._refresh_failed = False
         self._req_id       = 0
+        # reset_benchmark_env fans deletes out over worker threads
+        self._id_lock      = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # pool_connections = distinct hosts kept alive (MCP + OAuth),
+        # pool_maxsize     = concurrent connections reused per host
+        self.http    = requests.Session()
+        adapter      = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def close(self):
+        """Release pooled connections."""
+        self.http.close()
 
     def _headers(self) -> dict:
         h = {
@@ -112,11 +159,17 @@ class MCPClient:
         return h
 
     def _next_id(self) -> int:
-        self._req_id += 1
-        return self._req_id
+        with self._id_lock:
+            self._req_id += 1
+            return self._req_id
 
     def initialize(self) -> bool:
         """Perform MCP handshake, store session ID. Returns True on success."""
+        if self.cassette and self.cassette.replaying:
+            return True
+        if self.server:
+            self.session = "in-process"
+            return True
         payload = {
             "jsonrpc": "2.0",
             "method": "initialize",
@@ -128,10 +181,10 @@ class MCPClient:
             },
         }
         try:
-            resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+            resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
             if resp.status_code == 401 and self.refresh_token:
                 if self._do_refresh():
-                    resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                    resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 else:
                     return False
             if resp.status_code == 429:
@@ -139,7 +192,7 @@ class MCPClient:
                 console.print(f"  [yellow]Rate limited, waiting {wait}s...[/yellow]")
                 time.sleep(wait)
                 payload["id"] = self._next_id()
-                resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
             resp.raise_for_status()
             self.session = resp.headers.get("Mcp-Session-Id")
             return True
@@ -147,12 +200,22 @@ class MCPClient:
             console.print(f"  [red]MCP init failed: {e}[/red]")
             return False
 
-    def _do_refresh(self) -> bool:
-        """Exchange refresh_token for a new access_token. Returns True on success."""
+    def _do_refresh(self, stale_token: str | None = None) -> bool:
+        """Exchange refresh_token for a new access_token. Returns True on success.
+
+        stale_token is the token the failed request was sent with; if another
+        thread already replaced it, the refresh is skipped and reported as done.
+        """
+        with self._refresh_lock:
+            if stale_token is not None and self.token != stale_token:
+                return True
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
         if self._refresh_failed:
             return False
         try:
-            resp = requests.post(
+            resp = self.http.post(
                 OAUTH_TOKEN_URL,
                 data={
                     "grant_type":    "refresh_token",
@@ -180,6 +243,18 @@ class MCPClient:
         Transparently refreshes the token on 401 and retries once.
         Returns the result as a string (JSON or plain text).
         """
+        if self.cassette and self.cassette.replaying:
+            return self._result_text(self.cassette.replay(name, arguments))
+        if self.server:
+            data = self.server.handle({
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "id": self._next_id(),
+                "params": {"name": name, "arguments": arguments},
+            })
+            if self.cassette:
+                self.cassette.record(name, arguments, data)
+            return self._result_text(data)
         for attempt in range(2):
             payload = {
                 "jsonrpc": "2.0",
@@ -188,9 +263,10 @@ class MCPClient:
                 "params": {"name": name, "arguments": arguments},
             }
             try:
-                resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                sent_token = self.token
+                resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 if resp.status_code == 401 and attempt == 0:
-                    if self._do_refresh() and self.initialize():
+                    if self._do_refresh(sent_token) and self.initialize():
                         continue
                     return json.dumps({"error": "unauthorized, refresh failed"})
                 if resp.status_code == 429:
@@ -198,19 +274,26 @@ class MCPClient:
                     console.print(f"  [yellow]Rate limited on {name}, waiting {wait}s...[/yellow]")
                     time.sleep(wait)
                     payload["id"] = self._next_id()
-                    resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                    resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 resp.raise_for_status()
                 data = resp.json()
-                if "error" in data:
-                    return json.dumps({"error": data["error"]})
-                content = data.get("result", {}).get("content", [])
-                if content:
-                    return content[0].get("text", "")
-                return "{}"
+                if self.cassette:
+                    self.cassette.record(name, arguments, data)
+                return self._result_text(data)
             except Exception as e:
                 return json.dumps({"error": str(e)})
         return json.dumps({"error": "tool call failed after token refresh"})
 
+    @staticmethod
+    def _result_text(data: dict) -> str:
+        """Unwrap a tools/call JSON-RPC response body into the tool's text result."""
+        if "error" in data:
+            return json.dumps({"error": data["error"]})
+        content = data.get("result", {}).get("content", [])
+        if content:
+            return content[0].get("text", "")
+        return "{}"
+
 
 def extract_ids_from_result(tool_name: str, mcp_result: str) -> dict:
     """Extract entity IDs from a successful MCP tool response."""
@@ -239,115 +322,151 @@ def extract_ids_from_result(tool_name: str, mcp_result: str) -> dict:
 
 def seed_l2_fixtures(mcp: MCPClient) -> dict:
     """
-    Create fixture data required by L2-06 and L2-07 tasks.
+    Create fresh fixture data required by L2-06 and L2-07 tasks, as declared
+    under "fixtures" in level2_reasoning.json.
     Returns a context dict with the created entity IDs.
     """
-    context = {}
-
-    # Create project
-    proj_raw = mcp.call_tool("create_project", {
-        "name": "Notifications Feature",
-        "status": "active",
-    })
-    proj_ids = extract_ids_from_result("create_project", proj_raw)
-    context.update(proj_ids)
-
-    # Create workunit
-    wu_raw = mcp.call_tool("create_workunit", {
-        "name": "Implement User Notifications",
-        "problem_statement": "Users need to be notified when workunits they follow are updated, but no notification system exists yet.",
-        "success_criteria": "Users receive timely notifications for workunit updates via email and in-app channels.",
-        "project_id": context.get("project_id", ""),
-        "status": "active",
-    })
-    wu_ids = extract_ids_from_result("create_workunit", wu_raw)
-    context.update(wu_ids)
-
-    wu_id = context.get("workunit_id", "")
-    if not wu_id:
+    spec    = load_fixture_spec(TASKS_DIR)
+    context = seed_fixtures(mcp, spec)
+    if not context.get("workunit_id"):
         console.print("  [yellow]L2 fixture seeding: could not create workunit[/yellow]")
         return context
 
-    # Create tasks that match L2-06 triage rules
-    fixture_tasks = [
-        {"title": "Write unit tests for notification service", "status": "todo"},
-        {"title": "Fix email delivery bug", "status": "todo"},
-        {"title": "Add integration testing for webhooks", "status": "todo"},
-        {"title": "Fix race condition in notification queue", "status": "todo"},
-    ]
-    for t in fixture_tasks:
-        task_raw = mcp.call_tool("create_task", {
-            "workunit_id": wu_id,
-            "title": t["title"],
-            "status": t["status"],
-        })
-        task_ids = extract_ids_from_result("create_task", task_raw)
-        context.update(task_ids)
-
     console.print(f"  [dim]L2 fixtures seeded: project={context.get('project_id', '?')}, "
-                  f"workunit={context.get('workunit_id', '?')}, {len(fixture_tasks)} tasks[/dim]")
+                  f"workunit={context.get('workunit_id', '?')}, {len(spec['tasks'])} tasks[/dim]")
     return context
 
 
-def reset_benchmark_env(mcp: MCPClient):
-    """Wipe all benchmark org data via MCP between model runs for a clean slate."""
-    org_id = ""
-    user_raw = mcp.call_tool("get_authenticated_user", {})
-    try:
-        user_data = json.loads(user_raw)
-        orgs = user_data.get("organizations", [])
-        org_id = orgs[0]["id"] if orgs else user_data.get("organization_id", "")
-    except (json.JSONDecodeError, KeyError, IndexError):
-        pass
+def reset_benchmark_env(mcp: MCPClient, workers: int = RESET_WORKERS) -> bool:
+    """Wipe all benchmark org data via MCP between model runs for a clean slate.
 
-    if not org_id:
-        probe_raw = mcp.call_tool("create_project", {"name": "_benchmark_cleanup_probe"})
+    Steps:
+      1. Discover org_id (from user profile, or by creating a probe project)
+      2. Walk every page of projects, assets and directories and collect IDs
+      3. Delete projects, then assets, then root directories — each phase
+         fanned out over a pool of `workers` threads
+      4. Re-list to verify the org is empty; one more pass if anything is left
+
+    Collecting IDs before deleting keeps pagination stable. Returns True when
+    the org verified empty; prints per-phase timing either way.
+    """
+    timings = {}
+
+    def _timed(phase: str, fn, *args):
+        t0 = time.time()
+        result = fn(*args)
+        timings[phase] = timings.get(phase, 0.0) + time.time() - t0
+        return result
+
+    # 1. Get org_id
+    # get_authenticated_user doesn't return org_id, so we try multiple strategies:
+    #   a) Check the user response for organizations or organization_id
+    #   b) Fall back to creating a temporary probe project and reading org_id from it
+    def _discover_org() -> str:
+        org_id = ""
+        user_raw = mcp.call_tool("get_authenticated_user", {})
         try:
-            probe_data = json.loads(probe_raw)
-            project = probe_data.get("project", probe_data)
-            org_id = project.get("organization_id", "")
-        except (json.JSONDecodeError, KeyError):
+            user_data = json.loads(user_raw)
+            orgs = user_data.get("organizations", [])
+            org_id = orgs[0]["id"] if orgs else user_data.get("organization_id", "")
+        except (json.JSONDecodeError, KeyError, IndexError):
             pass
 
+        if not org_id:
+            # Probe: create a temporary project, extract org_id, then let cleanup delete it
+            probe_raw = mcp.call_tool("create_project", {"name": "_benchmark_cleanup_probe"})
+            try:
+                probe_data = json.loads(probe_raw)
+                project = probe_data.get("project", probe_data)
+                org_id = project.get("organization_id", "")
+            except (json.JSONDecodeError, KeyError):
+                pass
+        return org_id
+
+    org_id = _timed("discover", _discover_org)
     if not org_id:
         console.print("  [yellow]Could not determine org_id, skipping cleanup[/yellow]")
-        return
+        return False
 
-    def _parse_mcp(raw: str, key: str, label: str) -> list:
+    def _parse_mcp(raw: str, key: str, label: str) -> tuple[list, dict]:
+        """Parse an MCP call_tool response, warn on errors, return (items, response)."""
         try:
             data = json.loads(raw)
         except json.JSONDecodeError:
-            return []
+            console.print(f"  [yellow]Cleanup: {label} returned invalid JSON[/yellow]")
+            return [], {}
         if "error" in data:
-            return []
-        return data.get(key, [])
-
-    projects_raw = mcp.call_tool("list_projects", {"organization_id": org_id, "page_size": 100})
-    projects = _parse_mcp(projects_raw, "projects", "list_projects")
-    for proj in projects:
-        pid = proj.get("id", "")
-        if pid:
-            mcp.call_tool("remove_project", {"id": pid, "action": "delete"})
-
-    assets_raw = mcp.call_tool("search", {"query": " ", "result_types": ["asset"], "page_size": 50})
-    assets = _parse_mcp(assets_raw, "results", "search assets")
-    for asset in assets:
-        aid = asset.get("id", "")
-        if aid:
-            mcp.call_tool("delete_asset", {"id": aid})
-
-    dirs_raw = mcp.call_tool("directory", {"action": "list", "organization_id": org_id})
-    directories = _parse_mcp(dirs_raw, "directories", "list directories")
-    for d in directories:
-        did = d.get("id", "")
-        if did:
-            mcp.call_tool("directory", {"action": "delete", "id": did, "recursive": True})
-
-    deleted = len(projects) + len(assets) + len(directories)
-    if deleted:
-        console.print(f"  [dim]Cleanup: deleted {len(projects)} projects, {len(assets)} assets, {len(directories)} directories[/dim]")
+            console.print(f"  [yellow]Cleanup: {label} failed: {data['error']}[/yellow]")
+            return [], {}
+        return data.get(key, []), data
+
+    def _walk(tool: str, args: dict, key: str, label: str, page_size: int) -> list:
+        """Collect every item across pages. Stops on a short, empty or repeated page."""
+        items, seen = [], set()
+        for page_number in range(1, RESET_MAX_PAGES + 1):
+            raw = mcp.call_tool(tool, {**args, "page_size": page_size, "page_number": page_number})
+            page, data = _parse_mcp(raw, key, label)
+            fresh = [it for it in page if it.get("id") and it["id"] not in seen]
+            seen.update(it["id"] for it in fresh)
+            items.extend(fresh)
+            if len(page) < page_size or not fresh or data.get("has_next_page") is False:
+                break
+        return items
+
+    def _list_all() -> tuple[list, list, list]:
+        projects = _walk("list_projects", {"organization_id": org_id}, "projects", "list_projects", 100)
+        assets   = _walk("search", {"query": " ", "result_types": ["asset"]}, "results", "search assets", 50)
+        dirs, _  = _parse_mcp(mcp.call_tool("directory", {"action": "list", "organization_id": org_id}),
+                              "directories", "list directories")
+        dir_ids  = {d.get("id") for d in dirs}
+        # Recursive delete removes children, so only roots need a call
+        roots    = [d for d in dirs if d.get("id") and d.get("parent_id") not in dir_ids]
+        return projects, assets, roots
+
+    def _delete_all(calls: list[tuple[str, dict]]) -> int:
+        """Run delete calls on the worker pool; return how many reported an error."""
+        if not calls:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(lambda c: mcp.call_tool(*c), calls))
+        return sum(1 for r in results if r.startswith('{"error"'))
+
+    deleted = {"projects": 0, "assets": 0, "directories": 0}
+    failed  = 0
+    for attempt in range(2):
+        phase = "list" if attempt == 0 else "verify"
+        projects, assets, directories = _timed(phase, _list_all)
+        if not (projects or assets or directories):
+            break
+        if attempt == 1:
+            console.print(f"  [dim]Cleanup: {len(projects) + len(assets) + len(directories)} "
+                          f"entities left after first pass, retrying[/dim]")
+        failed += _timed("delete projects", _delete_all,
+                         [("remove_project", {"id": p["id"], "action": "delete"}) for p in projects])
+        failed += _timed("delete assets", _delete_all,
+                         [("delete_asset", {"id": a["id"]}) for a in assets])
+        failed += _timed("delete directories", _delete_all,
+                         [("directory", {"action": "delete", "id": d["id"], "recursive": True}) for d in directories])
+        deleted["projects"]    += len(projects)
+        deleted["assets"]      += len(assets)
+        deleted["directories"] += len(directories)
     else:
-        console.print("  [dim]Cleanup: org already clean[/dim]")
+        projects, assets, directories = _timed("verify", _list_all)
+
+    remaining = len(projects) + len(assets) + len(directories)
+    phases    = ", ".join(f"{name} {secs:.1f}s" for name, secs in timings.items())
+    if any(deleted.values()):
+        console.print(f"  [dim]Cleanup: deleted {deleted['projects']} projects, {deleted['assets']} assets, "
+                      f"{deleted['directories']} directories in {sum(timings.values()):.1f}s ({phases})[/dim]")
+    else:
+        console.print(f"  [dim]Cleanup: org already clean ({phases})[/dim]")
+    if failed:
+        console.print(f"  [yellow]Cleanup: {failed} delete call(s) returned errors[/yellow]")
+    if remaining:
+        console.print(f"  [yellow]Cleanup: org not empty after reset — {len(projects)} projects, "
+                      f"{len(assets)} assets, {len(directories)} directories remain[/yellow]")
+        return False
+    return True
 
 
 # ─── LM Studio helpers ────────────────────────────────────────────────────────
@@ -373,37 +492,56 @@ def get_loaded_model() -> str | None:
 MODEL_CONTEXT_LENGTH = 8192
 
 
-def load_model(model_id: str, timeout: int = 600) -> str | None:
+def load_model(model_id: str, timeout: int = 600, concurrent: bool = False) -> str | None:
     """
     Explicitly load a model via POST /api/v1/models/load with a fixed context_length.
     Unloads any existing instances first to ensure we get the right context size.
     Returns the instance_id string on success, None on failure.
+
+    The load is watched by polling the model listing (see _model_loader): progress
+    is logged while it runs. It is abandoned before timeout if LM Studio stops
+    answering, or reports load progress that stops moving, for LOAD_STALL_S,
+    or, for a model with load history, if it is not ready after LOAD_STALL_S
+    or three times its usual load time, whichever is longer.
+    Time-to-ready goes into READY_S.
+    concurrent=True marks a load that overlaps others (co-load group, prefetch):
+    its time is not kept in LOAD_HISTORY.
     """
+    # Unload any existing instances of this model (they may be at the wrong context size)
     _unload_all_instances(model_id)
 
-    try:
-        resp = requests.post(
-            f"{LMSTUDIO_MGMT_URL}/api/v1/models/load",
-            json={
-                "model": model_id,
-                "context_length": MODEL_CONTEXT_LENGTH,
-                "flash_attention": True,
-                "echo_load_config": True,
-            },
-            timeout=timeout,
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            instance_id = data.get("instance_id", model_id)
-            ctx = data.get("load_config", {}).get("context_length", MODEL_CONTEXT_LENGTH)
-            console.print(f"  [dim]Model loaded — instance: {instance_id}, ctx={ctx}[/dim]")
-            return instance_id
-        console.print(f"  [yellow]Load endpoint returned {resp.status_code}: {resp.text[:200]}[/yellow]")
-        return None
-    except Exception as e:
-        console.print(f"  [red]Model load failed: {e}[/red]")
+    size_gb  = model_sizes_gb().get(model_id, 0.0)
+    # Only a model's own history says when a quiet load is overdue; a size-based guess doesn't
+    ready_by = None
+    if LOAD_HISTORY and LOAD_HISTORY.has_loads(_LMSTUDIO_HOST, model_id):
+        ready_by = max(LOAD_STALL_S, 3 * LOAD_HISTORY.estimate(_LMSTUDIO_HOST, model_id, size_gb)[0])
+    out = load_and_wait(
+        LMSTUDIO_MGMT_URL, model_id,
+        {
+            "model": model_id,
+            "context_length": MODEL_CONTEXT_LENGTH,
+            "flash_attention": True,
+            "echo_load_config": True,
+        },
+        timeout=timeout,
+        stall_s=LOAD_STALL_S,
+        ready_by=ready_by,
+        on_progress=lambda s, state: console.print(f"  [dim]Loading {model_id}: {s:.0f}s, {state}[/dim]"),
+    )
+    if out["error"]:
+        console.print(f"  [red]Model load failed: {out['error']}[/red]")
         return None
 
+    instance_id = out["instance_id"] or model_id
+    ctx = out["load_config"].get("context_length", MODEL_CONTEXT_LENGTH)
+    READY_S[model_id] = out["ready_s"]
+    console.print(f"  [dim]Model loaded — instance: {instance_id}, ctx={ctx}, {out['load_s']:.1f}s, "
+                  f"ready after {out['ready_s']:.1f}s[/dim]")
+    if LOAD_HISTORY:
+        LOAD_HISTORY.record_load(_LMSTUDIO_HOST, model_id, out["load_s"],
+                                 size_gb, out["load_config"], concurrent)
+    return instance_id
+
 
 def _unload_all_instances(model_id: str):
     """Unload all loaded instances of a model (best-effort)."""
@@ -452,16 +590,31 @@ def unload_all_models():
 def unload_model(instance_id: str):
     """Unload a specific model instance after we're done with it."""
     try:
+        t0 = time.monotonic()
         requests.post(
             f"{LMSTUDIO_MGMT_URL}/api/v1/models/unload",
             json={"instance_id": instance_id},
             timeout=15,
         )
         console.print(f"  [dim]Model unloaded[/dim]")
+        if LOAD_HISTORY:
+            # Instance IDs are the model key, suffixed ":N" for extra instances
+            LOAD_HISTORY.record_unload(_LMSTUDIO_HOST, instance_id.split(":")[0], time.monotonic() - t0)
     except Exception:
         pass  # Best-effort
 
 
+def model_sizes_gb() -> dict[str, float]:
+    """On-disk size of every LM Studio model in GiB, used as its VRAM footprint."""
+    try:
+        resp = requests.get(f"{LMSTUDIO_MGMT_URL}/api/v1/models", timeout=10)
+        resp.raise_for_status()
+        return {m["key"]: m.get("size_bytes", 0) / (1024 ** 3) for m in resp.json().get("models", [])}
+    except Exception as e:
+        console.print(f"[yellow]Could not read model sizes: {e}[/yellow]")
+        return {}
+
+
 # ─── MCP Tool schemas (used as `tools` in chat completions) ───────────────────
 
 TOOLS = [
@@ -783,31 +936,20 @@ TOOLS = [
 
 # ─── Validation ────────────────────────────────────────────────────────────────
 
-def _normalize(val):
-    """Coerce string booleans to actual booleans for comparison."""
-    if isinstance(val, str):
-        if val.lower() == "true":
-            return True
-        if val.lower() == "false":
-            return False
-    return val
-
-
 def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]]:
     """
     Returns (passed, score 0.0-1.0, details).
     tool_calls is a list of {"name": str, "arguments": dict}.
     """
-    validation = task.get("validation", {})
-    val_type = validation.get("type", "tool_call_match")
+    spec = spec_for(task)
     details = []
 
     if not tool_calls:
         return False, 0.0, ["No tool call emitted — model responded with text only"]
 
     # ── Single tool call ──────────────────────────────────────────────────────
-    if val_type == "tool_call_match":
-        expected_tool = task.get("expected_tool")
+    if spec.type == "tool_call_match":
+        expected_tool = spec.expected_tool
         actual_tool = tool_calls[0]["name"]
 
         if actual_tool != expected_tool:
@@ -816,47 +958,44 @@ def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]
         args = tool_calls[0].get("arguments", {})
         score = 1.0
 
-        for param in validation.get("required_params", []):
+        for param in spec.required:
             if param not in args:
                 details.append(f"Missing required param: '{param}'")
                 score -= 0.25
 
-        for param, expected_val in validation.get("param_exact", {}).items():
+        for param, expected_val in spec.exact:
             actual_val = _normalize(args.get(param))
-            expected_val = _normalize(expected_val)
             if actual_val != expected_val:
                 details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
                 score -= 0.15
 
-        for param, expected_val in validation.get("param_contains", {}).items():
+        for param, expected_val, kind, prepared, norm in spec.contains:
             actual_val = args.get(param)
-            if isinstance(expected_val, str) and isinstance(actual_val, str):
-                if expected_val.lower() not in actual_val.lower():
+            if kind == "str" and isinstance(actual_val, str):
+                if prepared not in actual_val.lower():
                     details.append(f"'{param}': expected to contain {expected_val!r}, got {actual_val!r}")
                     score -= 0.15
-            elif isinstance(expected_val, list) and isinstance(actual_val, list):
+            elif kind == "list" and isinstance(actual_val, list):
                 actual_lower = [v.lower() if isinstance(v, str) else v for v in actual_val]
-                for item in expected_val:
-                    needle = item.lower() if isinstance(item, str) else item
+                for item, needle in prepared:
                     if needle not in actual_lower:
                         details.append(f"'{param}': missing expected item {item!r}")
                         score -= 0.05
             else:
-                if _normalize(actual_val) != _normalize(expected_val):
+                if _normalize(actual_val) != norm:
                     details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
                     score -= 0.15
 
-        for param in validation.get("param_present", []):
+        for param in spec.present:
             if param not in args or args[param] is None or args[param] == "":
                 details.append(f"'{param}' should be present but is missing/empty")
                 score -= 0.10
 
         # update_mask path check
-        paths_required = validation.get("update_mask_must_contain", [])
-        if paths_required:
+        if spec.mask_paths:
             update_mask  = args.get("update_mask", {})
             actual_paths = update_mask.get("paths", []) if isinstance(update_mask, dict) else []
-            for p in paths_required:
+            for p in spec.mask_paths:
                 if p not in actual_paths:
                     details.append(f"update_mask.paths missing '{p}'")
                     score -= 0.10
@@ -868,28 +1007,27 @@ def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]
         return passed, score, details
 
     # ── Multiple calls of same tool ───────────────────────────────────────────
-    elif val_type == "multi_tool_call":
-        expected_tool = validation.get("tool")
+    elif spec.type == "multi_tool_call":
+        expected_tool = spec.tool
         matching = [tc for tc in tool_calls if tc["name"] == expected_tool]
-        min_count = validation.get("call_count", 1)
+        min_count = spec.call_count
 
         if len(matching) < min_count:
             return False, len(matching) / min_count * 0.5, [
                 f"Expected {min_count}× {expected_tool}, got {len(matching)}"
             ]
 
-        required_each = validation.get("each_must_have", [])
         score = 1.0
         for tc in matching:
-            for param in required_each:
-                if param not in tc.get("arguments", {}):
+            args = tc.get("arguments", {})
+            for param in spec.each_must:
+                if param not in args:
                     details.append(f"Call missing required param '{param}'")
                     score -= 0.1
 
-        titles_required = validation.get("titles_must_include", [])
-        found_titles = [tc.get("arguments", {}).get("title", "") for tc in matching]
-        for t in titles_required:
-            if not any(t.lower() in ft.lower() for ft in found_titles):
+        found_titles = [tc.get("arguments", {}).get("title", "").lower() for tc in matching]
+        for t, needle in spec.titles:
+            if not any(needle in ft for ft in found_titles):
                 details.append(f"Expected task title not found: '{t}'")
                 score -= 0.15
 
@@ -900,54 +1038,57 @@ def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]
         return passed, score, details
 
     # ── Ordered multi-tool sequence ───────────────────────────────────────────
-    elif val_type in ("multi_tool_sequence", "reasoning_chain"):
-        steps = validation.get("steps", [])
+    elif spec.type in SEQUENCE_TYPES:
+        steps = spec.steps
         step_scores = []
 
-        for i, step in enumerate(steps):
-            expected_tool = step.get("tool")
-            # Find the i-th call of this tool in order
-            matching = [tc for tc in tool_calls if tc["name"] == expected_tool]
+        # First call of each step's tool, from one pass over tool_calls
+        first = {}
+        for tc in tool_calls:
+            first.setdefault(tc["name"], tc)
+
+        for step in steps:
+            label = step.label
+            tc = first.get(step.tool)
 
-            if not matching:
+            if tc is None:
                 step_scores.append(0.0)
-                details.append(f"Step {i+1} ({expected_tool}): not called")
+                details.append(f"{label}: not called")
                 continue
 
-            tc = matching[0]
             args = tc.get("arguments", {})
             step_score = 1.0
 
-            for param in step.get("must_have_params", []):
+            for param in step.must_have:
                 if param not in args:
-                    details.append(f"Step {i+1} ({expected_tool}): missing '{param}'")
+                    details.append(f"{label}: missing '{param}'")
                     step_score -= 0.25
 
-            for param, val in step.get("param_exact", {}).items():
-                if _normalize(args.get(param)) != _normalize(val):
-                    details.append(f"Step {i+1} ({expected_tool}): '{param}'={args.get(param)!r} (want {val!r})")
+            for param, val, norm in step.exact:
+                if _normalize(args.get(param)) != norm:
+                    details.append(f"{label}: '{param}'={args.get(param)!r} (want {val!r})")
                     step_score -= 0.2
 
-            for param, val in step.get("param_contains", {}).items():
+            for param, val, needle, norm in step.contains:
                 actual_val = args.get(param)
-                if isinstance(val, str) and isinstance(actual_val, str):
-                    if val.lower() not in actual_val.lower():
-                        details.append(f"Step {i+1} ({expected_tool}): '{param}'={actual_val!r} (want contains {val!r})")
+                if needle is not None and isinstance(actual_val, str):
+                    if needle not in actual_val.lower():
+                        details.append(f"{label}: '{param}'={actual_val!r} (want contains {val!r})")
                         step_score -= 0.2
                 else:
-                    if _normalize(actual_val) != _normalize(val):
-                        details.append(f"Step {i+1} ({expected_tool}): '{param}'={actual_val!r} (want {val!r})")
+                    if _normalize(actual_val) != norm:
+                        details.append(f"{label}: '{param}'={actual_val!r} (want {val!r})")
                         step_score -= 0.2
 
-            for param in step.get("param_present", []):
+            for param in step.present:
                 if param not in args:
-                    details.append(f"Step {i+1} ({expected_tool}): '{param}' missing")
+                    details.append(f"{label}: '{param}' missing")
                     step_score -= 0.15
 
             step_score = max(0.0, step_score)
             step_scores.append(step_score)
             if step_score >= 0.8:
-                details.append(f"Step {i+1} ({expected_tool}): ✓")
+                details.append(f"{label}: ✓")
 
         score = sum(step_scores) / len(steps) if steps else 0.0
         passed = score >= 0.75
@@ -956,6 +1097,64 @@ def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]
     return False, 0.0, ["Unknown validation type"]
 
 
+# ─── Warm-up ───────────────────────────────────────────────────────────────────
+
+# Synthetic requests sent after a model load, never scored. Two different user
+# messages, so the second one reuses the cached system prompt + TOOLS prefix
+# the way later tasks do, without being a repeat of the first.
+WARMUP_PROMPTS = (
+    "List my projects.",
+    "Show me the workunit called Warm-up.",
+)
+WARMUP_MAX_TOKENS = 16
+
+
+def warm_up(client: OpenAI, model_id: str, cold: bool = True) -> dict:
+    """
+    Send the loaded model its first requests of this run before any task runs.
+
+    The first completion after a load pays for prompt-template compilation and
+    KV cache allocation; timing it here keeps that cost out of the first task's
+    elapsed_s. Returns {'cold_start_ms', 'warm_ms', 'error'}: the first request,
+    the second (steady state, for comparison) and any error, which is logged
+    and not fatal. cold=False means the instance was not freshly loaded by this
+    run (--skip-load, a prefetch, or requests already sent to it), so the first
+    request is reported as 'first_request_ms' instead of a cold start.
+    """
+    timings, error = [], None
+    for prompt in WARMUP_PROMPTS:
+        t0 = time.perf_counter()
+        try:
+            client.chat.completions.create(
+                model=model_id,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user",   "content": prompt},
+                ],
+                tools=TOOLS,
+                tool_choice="auto",
+                temperature=0.0,
+                max_tokens=WARMUP_MAX_TOKENS,
+            )
+        except Exception as e:
+            error = str(e)[:200]
+            break
+        timings.append(round((time.perf_counter() - t0) * 1000, 1))
+
+    first  = "cold_start_ms" if cold else "first_request_ms"
+    warmup = {
+        first:     timings[0] if timings else None,
+        "warm_ms": timings[1] if len(timings) > 1 else None,
+        "error":   error,
+    }
+    if error:
+        console.print(f"  [yellow]Warm-up failed: {error}[/yellow]")
+    else:
+        console.print(f"  [dim]Warm-up: {'cold start' if cold else 'first request'} {warmup[first]:.0f} ms, "
+                      f"warm {warmup['warm_ms']:.0f} ms[/dim]")
+    return warmup
+
+
 # ─── Single task execution ─────────────────────────────────────────────────────
 
 def run_task(client: OpenAI, model_id: str, task: dict, context: dict,
@@ -974,10 +1173,11 @@ def run_task(client: OpenAI, model_id: str, task: dict, context: dict,
     tool_calls = []
     mcp_results = []
     model_response = None  # raw text content from the model
+    turn_metrics = []  # latency/throughput of the single turn, only with --stream
     error = None
 
     try:
-        response = client.chat.completions.create(
+        request = dict(
             model=model_id,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -988,8 +1188,11 @@ def run_task(client: OpenAI, model_id: str, task: dict, context: dict,
             temperature=0.0,
             max_tokens=1024,
         )
-
-        msg = response.choices[0].message
+        if STREAM_COMPLETIONS:
+            msg, metrics = stream_chat(client, **request)
+            turn_metrics.append(metrics)
+        else:
+            msg = client.chat.completions.create(**request).choices[0].message
         model_response = msg.content
         if msg.tool_calls:
             for tc in msg.tool_calls:
@@ -1017,7 +1220,7 @@ def run_task(client: OpenAI, model_id: str, task: dict, context: dict,
             except Exception:
                 mcp_results.append("{}")
 
-    return {
+    result = {
         "task_id": task["id"],
         "task_name": task["name"],
         "prompt_sent": prompt,
@@ -1030,6 +1233,9 @@ def run_task(client: OpenAI, model_id: str, task: dict, context: dict,
         "elapsed_s": elapsed,
         "error": error,
     }
+    if STREAM_COMPLETIONS:
+        result["turn_metrics"] = turn_metrics
+    return result
 
 
 # ─── Level runner ──────────────────────────────────────────────────────────────
@@ -1047,7 +1253,7 @@ def run_level(client: OpenAI, model_id: str, level: int, context: dict,
 
     with open(task_file) as f:
         task_data = json.load(f)
-    tasks = task_data["tasks"]
+    tasks = compile_tasks(task_data["tasks"])
 
     # Seed fixture data for L2 tasks that require pre-existing workunits/tasks
     if level == 2 and mcp:
@@ -1095,12 +1301,19 @@ def run_level(client: OpenAI, model_id: str, level: int, context: dict,
 
 def run_model(model_id: str, levels: list[int], tool_trained: bool,
               token: str = "", refresh_token: str = "",
-              force: bool = False, no_git: bool = False) -> dict:
+              force: bool = False, no_git: bool = False,
+              instance_id: str | None = None,
+              on_last_level=None, cold: bool = True) -> dict:
     """Run all levels for one model. Handles model switching automatically.
 
     Skips levels that already have a result file unless force=True.
     When a token is provided, connects to MCP to execute tool calls after scoring
     and capture real entity IDs for placeholder substitution.
+    A model the caller already loaded (instance_id, e.g. a co-load group) is
+    used as is and left loaded.
+    on_last_level is called as the last pending level starts (--prefetch).
+    cold=False says instance_id was not freshly loaded for this call (prefetched,
+    or already used), so its first request is not recorded as a cold start.
     """
     # Check which levels still need running
     pending_levels = []
@@ -1139,25 +1352,39 @@ def run_model(model_id: str, levels: list[int], tool_trained: bool,
             reset_benchmark_env(mcp)
 
     # Explicitly load model with correct context length
-    console.print("  [dim]Loading model...[/dim]")
-    instance_id = load_model(model_id)
-    if not instance_id:
-        console.print(f"  [red]Model failed to load within timeout, skipping[/red]")
-        return {}
+    owned = None   # instance loaded here, so unloaded here
+    if instance_id:
+        console.print(f"  [dim]Model already loaded — instance: {instance_id}[/dim]")
+    else:
+        console.print("  [dim]Loading model...[/dim]")
+        owned = load_model(model_id)
+        if not owned:
+            console.print(f"  [red]Model failed to load within timeout, skipping[/red]")
+            return {}
 
     console.print(f"  [dim]Model ready[/dim]")
 
     context = {}  # Fresh per model; populated as tasks succeed
+    warmup = warm_up(client, model_id, cold) if WARMUP else None
+    ready_s = READY_S.get(model_id)
+
     model_results = {
         "model": model_id,
         "tool_trained": tool_trained,
         "timestamp": datetime.now().isoformat(),
         "levels": {},
+        "warmup": warmup,
     }
 
     try:
         for level in pending_levels:
+            if on_last_level and level == pending_levels[-1]:
+                on_last_level()
             level_result = run_level(client, model_id, level, context, mcp)
+            if warmup:
+                level_result["warmup"] = warmup
+            if ready_s is not None:
+                level_result["ready_s"] = ready_s
             model_results["levels"][level] = level_result
 
             s = level_result["summary"]
@@ -1171,11 +1398,55 @@ def run_model(model_id: str, levels: list[int], tool_trained: bool,
             if not no_git:
                 git_commit(model_id, level)
     finally:
-        unload_model(instance_id)
+        if owned:
+            unload_model(owned)
+        if mcp:
+            mcp.close()
 
     return model_results
 
 
+def needs_run(model_id: str, levels: list[int], force: bool = False) -> bool:
+    """True if any of these levels has no result file yet for the model."""
+    return force or any(not result_exists(model_id, level) for level in levels)
+
+
+def load_group(model_ids: list[str]) -> dict[str, str]:
+    """
+    Load a co-load group's models at the same time, so their load times overlap.
+    Returns model_id -> instance_id for the models that loaded.
+    """
+    if not model_ids:
+        return {}
+    console.print(f"\n[dim]Co-loading {len(model_ids)} models: {', '.join(model_ids)}[/dim]")
+    with ThreadPoolExecutor(max_workers=len(model_ids)) as pool:
+        instances = dict(zip(model_ids, pool.map(partial(load_model, concurrent=True), model_ids)))
+    return {m: iid for m, iid in instances.items() if iid}
+
+
+def unload_group(instances: dict[str, str]):
+    """Unload every instance of a co-load group at once."""
+    if instances:
+        with ThreadPoolExecutor(max_workers=len(instances)) as pool:
+            list(pool.map(unload_model, instances.values()))
+
+
+def model_files() -> dict[str, list[Path]]:
+    """Weight files of every LM Studio model on this machine, for --prefetch."""
+    try:
+        resp = requests.get(f"{LMSTUDIO_MGMT_URL}/api/v1/models", timeout=10)
+        resp.raise_for_status()
+        return {m["key"]: weight_files(m) for m in resp.json().get("models", [])}
+    except Exception as e:
+        console.print(f"[yellow]Could not list model files: {e}[/yellow]")
+        return {}
+
+
+def start_prefetch(prefetcher: Prefetcher, model_ids: list[str], loaded_ids: list[str]):
+    """Get the next load group ready while the current one runs its last level."""
+    console.print(f"  [dim]Prefetching {', '.join(model_ids)}: {prefetcher.start(model_ids, loaded_ids)}[/dim]")
+
+
 # ─── Persistence ──────────────────────────────────────────────────────────────
 
 def result_exists(model_id: str, level: int) -> bool:
@@ -1191,10 +1462,14 @@ def save_result(model_id: str, level: int, level_result: dict, tool_trained: boo
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     out = RESULTS_DIR / f"level{level}_{safe}_{ts}.json"
 
-    # Strip mcp_results from saved output — they're large and only needed at runtime
+    # Strip mcp_results from saved output — they're large and only needed at runtime.
+    # With --mcp-store each tool call references its response in the side-car store.
     clean_results = []
     for r in level_result.get("results", []):
         clean = {k: v for k, v in r.items() if k != "mcp_results"}
+        if MCP_STORE:
+            calls = [dict(tc, mcp_result=res) for tc, res in zip(r["tool_calls"], r.get("mcp_results", []))]
+            clean["tool_calls"] = MCP_STORE.compact(calls) + r["tool_calls"][len(calls):]
         clean_results.append(clean)
 
     output = {
@@ -1203,6 +1478,7 @@ def save_result(model_id: str, level: int, level_result: dict, tool_trained: boo
         "tool_trained": tool_trained,
         "timestamp": datetime.now().isoformat(),
         **{k: v for k, v in level_result.items() if k != "results"},
+        **({"mcp_store": os.path.relpath(MCP_STORE.root, out.parent)} if MCP_STORE else {}),
         "results": clean_results,
     }
     with open(out, "w") as f:
@@ -1289,19 +1565,80 @@ def main():
         "--yes", "-y", action="store_true",
         help="Skip the destructive data warning prompt",
     )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record-mcp", metavar="PATH",
+        help="Record every MCP tool call and response to a cassette file (.gz to compress)",
+    )
+    cassette.add_argument(
+        "--replay-mcp", metavar="PATH",
+        help="Serve MCP tool calls from a recorded cassette instead of the server (no token needed)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream completions and record time-to-first-token, tokens/sec and token counts per turn",
+    )
+    parser.add_argument(
+        "--fake-mcp", action="store_true",
+        help="Run MCP tool calls against an in-process fake Workunit server (no network, no token)",
+    )
+    parser.add_argument(
+        "--mcp-store", metavar="DIR",
+        help="Keep MCP responses in a compressed, deduplicated side-car store and reference them "
+             "by hash from each tool call (default: responses are not saved)",
+    )
     parser.add_argument(
         "--results-dir",
         help="Directory to write result files (default: results/v1_singleshot/)",
     )
+    parser.add_argument(
+        "--load-order", choices=["planned", "file"], default="planned",
+        help="planned: order models by recorded load cost and co-load small ones (default); "
+             "file: models.txt order, one model loaded at a time",
+    )
+    parser.add_argument(
+        "--vram-gb", type=float, default=float(os.environ.get("LMSTUDIO_VRAM_GB", "0")), metavar="GB",
+        help="VRAM budget for co-loading several small models at once (or set LMSTUDIO_VRAM_GB; "
+             "default: 0 = one model at a time)",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true",
+        help="Skip the warm-up requests after each model load (the first task then pays the cold start)",
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true",
+        help="During each model's last level, load the next model in the background if both fit in "
+             "--vram-gb, else read its weights into the page cache (LM Studio on this machine)",
+    )
     args = parser.parse_args()
 
     # Override globals from CLI flags
-    global RESULTS_DIR, MCP_URL, OAUTH_TOKEN_URL
+    global RESULTS_DIR, MCP_URL, OAUTH_TOKEN_URL, MCP_CASSETTE, MCP_FAKE_SERVER, STREAM_COMPLETIONS, MCP_STORE
+    global LOAD_HISTORY, WARMUP
+    LOAD_HISTORY = LoadHistory()
     if args.results_dir:
         RESULTS_DIR = Path(args.results_dir)
     if args.local:
         MCP_URL        = "http://localhost:9000/mcp"
         OAUTH_TOKEN_URL = "http://localhost:3000/oauth/token"
+    if args.record_mcp or args.replay_mcp:
+        MCP_CASSETTE = Cassette(args.record_mcp or args.replay_mcp,
+                                "record" if args.record_mcp else "replay")
+
+        def close_cassette():
+            MCP_CASSETTE.close()
+            console.print(f"[dim]MCP cassette: {MCP_CASSETTE.stats()}[/dim]")
+        atexit.register(close_cassette)
+        if args.replay_mcp:
+            args.token = args.token or "replay"
+    STREAM_COMPLETIONS = args.stream
+    WARMUP             = not args.no_warmup
+    if args.mcp_store:
+        MCP_STORE = McpStore(args.mcp_store)
+        atexit.register(lambda: console.print(f"[dim]MCP store: {MCP_STORE.stats()}[/dim]"))
+    if args.fake_mcp:
+        MCP_FAKE_SERVER = FakeWorkunitServer()
+        args.token = args.token or "fake"
 
     if args.list_models:
         models = list_models()
@@ -1333,6 +1670,16 @@ def main():
     else:
         parser.error("Provide --model, --models, or --list-models")
 
+    # Group and order the models by recorded load cost
+    planned = args.load_order == "planned" and len(model_list) > 1
+    if planned:
+        sizes     = model_sizes_gb()
+        load_plan = plan_loads(model_list, sizes, LOAD_HISTORY, _LMSTUDIO_HOST, args.vram_gb,
+                               MODEL_CONTEXT_LENGTH)
+    else:
+        load_plan = [[item] for item in model_list]
+    prefetch = args.prefetch and len(load_plan) > 1
+
     if args.dry_run:
         pending = []
         done    = []
@@ -1352,6 +1699,13 @@ def main():
             lines.extend(done)
         lines.append(f"\nTasks per level: L0=11, L1=10, L2=7")
         lines.append(f"MCP token: {'set' if args.token else 'not set (no ID capture)'}")
+        if planned:
+            lines.append(f"\n[bold]Load plan[/bold] ({LOAD_HISTORY.known(_LMSTUDIO_HOST)} model(s) with "
+                         f"load history on {_LMSTUDIO_HOST}, VRAM budget: {f'{args.vram_gb:g} GB' if args.vram_gb else 'none'}):")
+            for n, group in enumerate(load_plan, 1):
+                gb   = sum(LOAD_HISTORY.size_gb(_LMSTUDIO_HOST, m) or sizes.get(m, 0.0) for m, _ in group)
+                cost = group_cost(group, sizes, LOAD_HISTORY, _LMSTUDIO_HOST)
+                lines.append(f"  {n}. {', '.join(m for m, _ in group)}  ({gb:.1f} GB weights, ~{cost:.0f}s load+unload)")
 
         console.print(Panel("\n".join(lines), title="Dry Run Plan"))
         return
@@ -1370,6 +1724,9 @@ def main():
         f"Models: {len(model_list)}\n"
         f"Levels: {levels}\n"
         f"Force re-run: {'yes' if args.force else 'no (skipping completed levels)'}\n"
+        f"Load order: {'planned' if planned else 'file'}"
+        + (f" ({len(load_plan)} load group(s), VRAM budget {args.vram_gb:g} GB)\n" if planned and args.vram_gb else "\n") +
+        f"Prefetch: {'yes' if prefetch else 'no'}\n"
         f"MCP: {'enabled' if args.token else 'disabled (no --token)'}\n"
         f"Results: {RESULTS_DIR}\n"
         f"LM Studio: {LMSTUDIO_BASE_URL}",
@@ -1380,10 +1737,35 @@ def main():
     unload_all_models()
 
     start = time.time()
-    for i, (model_id, tool_trained) in enumerate(model_list, 1):
-        console.print(f"\n[dim]── Model {i}/{len(model_list)} ──────────────────────────────[/dim]")
-        run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
-                  args.force, args.no_git)
+    prefetcher = (Prefetcher(partial(load_model, concurrent=True), model_files(), model_sizes_gb(),
+                             args.vram_gb, MODEL_CONTEXT_LENGTH) if prefetch else None)
+    i = 0
+    for n, group in enumerate(load_plan):
+        # A group of several models is loaded together up front and unloaded together at the end;
+        # with --prefetch, some may already have been loaded while the previous group ran
+        instances  = prefetcher.take() if prefetcher else {}
+        prefetched = set(instances)   # loaded in the background, so not a cold start
+        pending    = [m for m, _ in group if needs_run(m, levels, args.force)]
+        if len(group) > 1:
+            instances.update(load_group([m for m in pending if m not in instances]))
+
+        on_last_level = None
+        if prefetcher and pending:
+            upcoming = next((ids for g in load_plan[n + 1:]
+                             if (ids := [m for m, _ in g if needs_run(m, levels, args.force)])), [])
+            if upcoming:
+                on_last_level = partial(start_prefetch, prefetcher, upcoming, pending)
+        try:
+            for model_id, tool_trained in group:
+                i += 1
+                console.print(f"\n[dim]── Model {i}/{len(model_list)} ──────────────────────────────[/dim]")
+                # pending is empty when the whole group is already done (resumed run)
+                last = on_last_level if pending and model_id == pending[-1] else None
+                run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
+                          args.force, args.no_git, instances.get(model_id),
+                          last, model_id not in prefetched)
+        finally:
+            unload_group(instances)
 
     elapsed = time.time() - start
     console.print(f"\n[bold green]Complete![/bold green] {elapsed/60:.1f} minutes total")
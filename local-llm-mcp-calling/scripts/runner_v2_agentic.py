@@ -32,12 +32,18 @@ Requirements:
 """
 
 import argparse
+import atexit
+import asyncio
+import contextlib
 import json
 import os
 import re
 import sys
 import time
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 
@@ -47,10 +53,21 @@ try:
     from rich.table import Table
     from rich.panel import Panel
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Missing dependencies. Run: pip install openai rich requests")
     sys.exit(1)
 
+from _fake_workunit import FakeWorkunitServer
+from _fixtures import load_fixture_spec, seed_fixtures
+from _load_planner import LoadHistory, Prefetcher, group_cost, plan_loads, weight_files
+from _mcp_cassette import Cassette
+from _mcp_store import McpStore
+from _model_loader import load_and_wait
+from _streaming import stream_chat
+from _validation_spec import SEQUENCE_TYPES, StepSpec, ValidationSpec, compile_tasks, spec_for
+from _validation_spec import normalize as _normalize
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 _LMSTUDIO_HOST     = os.environ.get("LMSTUDIO_HOST", "localhost:1234")
@@ -58,6 +75,17 @@ LMSTUDIO_BASE_URL  = f"http://{_LMSTUDIO_HOST}/v1"
 LMSTUDIO_MGMT_URL  = f"http://{_LMSTUDIO_HOST}"
 MCP_URL            = os.environ.get("MCP_URL", "https://workunit.app/mcp")
 MCP_CALL_TIMEOUT   = int(os.environ.get("MCP_CALL_TIMEOUT", "60"))
+MCP_POOL_SIZE      = int(os.environ.get("MCP_POOL_SIZE", "10"))
+RESET_WORKERS      = int(os.environ.get("RESET_WORKERS", "8"))     # parallel deletes during org reset
+RESET_MAX_PAGES    = 1000  # safety stop when walking list pages
+MCP_CASSETTE       = None  # Cassette set by --record-mcp / --replay-mcp
+MCP_FAKE_SERVER    = None  # FakeWorkunitServer set by --fake-mcp
+STREAM_COMPLETIONS = False # --stream: stream completions and record per-turn latency metrics
+WARMUP             = True  # --no-warmup clears: send warm-up requests after each model load
+LOAD_STALL_S       = float(os.environ.get("LOAD_STALL_S", "180"))  # abandon a stuck load after this long (see load_model)
+READY_S            = {}    # model_id -> seconds from load request to ready, for its last load
+MCP_STORE          = None  # McpStore set by --mcp-store: keep MCP responses as hashed side-car blobs
+LOAD_HISTORY       = None  # LoadHistory set in main(): per-host model load/unload latencies
 
 BENCHMARK_DIR       = Path(__file__).parent.parent
 TASKS_DIR           = BENCHMARK_DIR / "tasks"
@@ -105,14 +133,35 @@ class MCPClient:
     """
     Minimal stateful MCP client over HTTP (streamable transport).
     Handles initialize handshake, tool calls, and transparent token refresh.
+
+    All requests go through one pooled keep-alive session, so consecutive tool
+    calls reuse the same TCP/TLS connection instead of reconnecting each time —
+    connection setup no longer lands in every task's elapsed_s.
     """
 
-    def __init__(self, token: str, refresh_token: str = ""):
+    def __init__(self, token: str, refresh_token: str = "", pool_size: int = MCP_POOL_SIZE,
+                 cassette: Cassette | None = None):
         self.token           = token
+        self.cassette        = cassette or MCP_CASSETTE
+        self.server          = MCP_FAKE_SERVER
         self.refresh_token   = refresh_token
         self.session         = None
         self._refresh_failed = False
         self._req_id       = 0
+        # Tasks may share one client across worker threads (--concurrency)
+        self._id_lock      = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # pool_connections = distinct hosts kept alive (MCP + OAuth),
+        # pool_maxsize     = concurrent connections reused per host
+        self.http    = requests.Session()
+        adapter      = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def close(self):
+        """Release pooled connections."""
+        self.http.close()
 
     def _headers(self) -> dict:
         h = {
@@ -125,11 +174,17 @@ class MCPClient:
         return h
 
     def _next_id(self) -> int:
-        self._req_id += 1
-        return self._req_id
+        with self._id_lock:
+            self._req_id += 1
+            return self._req_id
 
     def initialize(self) -> bool:
         """Perform MCP handshake, store session ID. Returns True on success."""
+        if self.cassette and self.cassette.replaying:
+            return True
+        if self.server:
+            self.session = "in-process"
+            return True
         payload = {
             "jsonrpc": "2.0",
             "method": "initialize",
@@ -141,11 +196,11 @@ class MCPClient:
             },
         }
         try:
-            resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+            resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
             if resp.status_code == 401 and self.refresh_token:
                 # Token expired — get a new one and retry
                 if self._do_refresh():
-                    resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                    resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 else:
                     return False
             if resp.status_code == 429:
@@ -153,7 +208,7 @@ class MCPClient:
                 console.print(f"  [yellow]Rate limited, waiting {wait}s...[/yellow]")
                 time.sleep(wait)
                 payload["id"] = self._next_id()
-                resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
             resp.raise_for_status()
             self.session = resp.headers.get("Mcp-Session-Id")
             return True
@@ -161,12 +216,22 @@ class MCPClient:
             console.print(f"  [red]MCP init failed: {e}[/red]")
             return False
 
-    def _do_refresh(self) -> bool:
-        """Exchange refresh_token for a new access_token. Returns True on success."""
+    def _do_refresh(self, stale_token: str | None = None) -> bool:
+        """Exchange refresh_token for a new access_token. Returns True on success.
+
+        stale_token is the token the failed request was sent with; if another
+        thread already replaced it, the refresh is skipped and reported as done.
+        """
+        with self._refresh_lock:
+            if stale_token is not None and self.token != stale_token:
+                return True
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
         if self._refresh_failed:
             return False  # Don't keep hammering after a confirmed failure
         try:
-            resp = requests.post(
+            resp = self.http.post(
                 OAUTH_TOKEN_URL,
                 data={
                     "grant_type":    "refresh_token",
@@ -195,6 +260,18 @@ class MCPClient:
         Backs off on 429 rate-limit responses.
         Returns the result as a string (JSON or plain text).
         """
+        if self.cassette and self.cassette.replaying:
+            return self._result_text(self.cassette.replay(name, arguments))
+        if self.server:
+            data = self.server.handle({
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "id": self._next_id(),
+                "params": {"name": name, "arguments": arguments},
+            })
+            if self.cassette:
+                self.cassette.record(name, arguments, data)
+            return self._result_text(data)
         for attempt in range(2):
             payload = {
                 "jsonrpc": "2.0",
@@ -203,9 +280,10 @@ class MCPClient:
                 "params": {"name": name, "arguments": arguments},
             }
             try:
-                resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                sent_token = self.token
+                resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 if resp.status_code == 401 and attempt == 0:
-                    if self._do_refresh() and self.initialize():
+                    if self._do_refresh(sent_token) and self.initialize():
                         continue
                     return json.dumps({"error": "unauthorized, refresh failed"})
                 if resp.status_code == 429:
@@ -213,19 +291,26 @@ class MCPClient:
                     console.print(f"  [yellow]Rate limited on {name}, waiting {wait}s...[/yellow]")
                     time.sleep(wait)
                     payload["id"] = self._next_id()
-                    resp = requests.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
+                    resp = self.http.post(MCP_URL, json=payload, headers=self._headers(), timeout=MCP_CALL_TIMEOUT)
                 resp.raise_for_status()
                 data = resp.json()
-                if "error" in data:
-                    return json.dumps({"error": data["error"]})
-                content = data.get("result", {}).get("content", [])
-                if content:
-                    return content[0].get("text", "")
-                return "{}"
+                if self.cassette:
+                    self.cassette.record(name, arguments, data)
+                return self._result_text(data)
             except Exception as e:
                 return json.dumps({"error": str(e)})
         return json.dumps({"error": "tool call failed after token refresh"})
 
+    @staticmethod
+    def _result_text(data: dict) -> str:
+        """Unwrap a tools/call JSON-RPC response body into the tool's text result."""
+        if "error" in data:
+            return json.dumps({"error": data["error"]})
+        content = data.get("result", {}).get("content", [])
+        if content:
+            return content[0].get("text", "")
+        return "{}"
+
 
 # ─── LM Studio helpers ────────────────────────────────────────────────────────
 
@@ -242,43 +327,67 @@ def list_models() -> list[dict]:
 MODEL_CONTEXT_LENGTH = 8192
 
 
-def load_model(model_id: str, timeout: int = 600) -> str | None:
+def _mgmt_url(host: str | None) -> str:
+    """Management API base URL for an LM Studio host (default: LMSTUDIO_HOST)."""
+    return f"http://{host}" if host else LMSTUDIO_MGMT_URL
+
+
+def load_model(model_id: str, timeout: int = 600, host: str | None = None,
+               concurrent: bool = False) -> str | None:
     """
     Explicitly load a model via POST /api/v1/models/load with a fixed context_length.
     Unloads any existing instances first to ensure we get the right context size.
     Returns the instance_id string on success, None on failure.
+
+    The load is watched by polling the model listing (see _model_loader): progress
+    is logged while it runs. It is abandoned before timeout if LM Studio stops
+    answering, or reports load progress that stops moving, for LOAD_STALL_S,
+    or, for a model with load history, if it is not ready after LOAD_STALL_S
+    or three times its usual load time, whichever is longer.
+    Time-to-ready goes into READY_S.
+    concurrent=True marks a load that overlaps others (co-load group, prefetch):
+    its time is not kept in LOAD_HISTORY.
     """
     # Unload any existing instances of this model (they may be at the wrong context size)
-    _unload_all_instances(model_id)
-
-    try:
-        resp = requests.post(
-            f"{LMSTUDIO_MGMT_URL}/api/v1/models/load",
-            json={
-                "model": model_id,
-                "context_length": MODEL_CONTEXT_LENGTH,
-                "flash_attention": True,
-                "echo_load_config": True,
-            },
-            timeout=timeout,
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            instance_id = data.get("instance_id", model_id)
-            ctx = data.get("load_config", {}).get("context_length", MODEL_CONTEXT_LENGTH)
-            console.print(f"  [dim]Model loaded — instance: {instance_id}, ctx={ctx}[/dim]")
-            return instance_id
-        console.print(f"  [yellow]Load endpoint returned {resp.status_code}: {resp.text[:200]}[/yellow]")
-        return None
-    except Exception as e:
-        console.print(f"  [red]Model load failed: {e}[/red]")
+    _unload_all_instances(model_id, host)
+
+    size_gb  = model_sizes_gb(host).get(model_id, 0.0)
+    # Only a model's own history says when a quiet load is overdue; a size-based guess doesn't
+    ready_by = None
+    if LOAD_HISTORY and LOAD_HISTORY.has_loads(host or _LMSTUDIO_HOST, model_id):
+        ready_by = max(LOAD_STALL_S, 3 * LOAD_HISTORY.estimate(host or _LMSTUDIO_HOST, model_id, size_gb)[0])
+    out = load_and_wait(
+        _mgmt_url(host), model_id,
+        {
+            "model": model_id,
+            "context_length": MODEL_CONTEXT_LENGTH,
+            "flash_attention": True,
+            "echo_load_config": True,
+        },
+        timeout=timeout,
+        stall_s=LOAD_STALL_S,
+        ready_by=ready_by,
+        on_progress=lambda s, state: console.print(f"  [dim]Loading {model_id}: {s:.0f}s, {state}[/dim]"),
+    )
+    if out["error"]:
+        console.print(f"  [red]Model load failed: {out['error']}[/red]")
         return None
 
+    instance_id = out["instance_id"] or model_id
+    ctx = out["load_config"].get("context_length", MODEL_CONTEXT_LENGTH)
+    READY_S[model_id] = out["ready_s"]
+    console.print(f"  [dim]Model loaded — instance: {instance_id}, ctx={ctx}, {out['load_s']:.1f}s, "
+                  f"ready after {out['ready_s']:.1f}s[/dim]")
+    if LOAD_HISTORY:
+        LOAD_HISTORY.record_load(host or _LMSTUDIO_HOST, model_id, out["load_s"],
+                                 size_gb, out["load_config"], concurrent)
+    return instance_id
 
-def _unload_all_instances(model_id: str):
+
+def _unload_all_instances(model_id: str, host: str | None = None):
     """Unload all loaded instances of a model (best-effort)."""
     try:
-        resp = requests.get(f"{LMSTUDIO_MGMT_URL}/api/v1/models", timeout=10)
+        resp = requests.get(f"{_mgmt_url(host)}/api/v1/models", timeout=10)
         if resp.status_code != 200:
             return
         for m in resp.json().get("models", []):
@@ -288,7 +397,7 @@ def _unload_all_instances(model_id: str):
                 iid = inst.get("instance_id") or inst.get("id")
                 if iid:
                     requests.post(
-                        f"{LMSTUDIO_MGMT_URL}/api/v1/models/unload",
+                        f"{_mgmt_url(host)}/api/v1/models/unload",
                         json={"instance_id": iid},
                         timeout=15,
                     )
@@ -296,12 +405,12 @@ def _unload_all_instances(model_id: str):
         pass
 
 
-def unload_all_models():
+def unload_all_models(host: str | None = None):
     """Unload every loaded model instance in LM Studio. Called once at benchmark start
     to ensure a clean VRAM state — any model left over from a previous session would
     otherwise crowd out the benchmark models onto CPU, making timings meaningless."""
     try:
-        resp = requests.get(f"{LMSTUDIO_MGMT_URL}/api/v1/models", timeout=10)
+        resp = requests.get(f"{_mgmt_url(host)}/api/v1/models", timeout=10)
         if resp.status_code != 200:
             return
         unloaded = 0
@@ -310,7 +419,7 @@ def unload_all_models():
                 iid = inst.get("instance_id") or inst.get("id")
                 if iid:
                     requests.post(
-                        f"{LMSTUDIO_MGMT_URL}/api/v1/models/unload",
+                        f"{_mgmt_url(host)}/api/v1/models/unload",
                         json={"instance_id": iid},
                         timeout=15,
                     )
@@ -321,16 +430,21 @@ def unload_all_models():
         pass
 
 
-def unload_model(instance_id: str):
+def unload_model(instance_id: str, host: str | None = None):
     """Unload a specific model instance to free VRAM before loading the next one."""
     try:
+        t0   = time.monotonic()
         resp = requests.post(
-            f"{LMSTUDIO_MGMT_URL}/api/v1/models/unload",
+            f"{_mgmt_url(host)}/api/v1/models/unload",
             json={"instance_id": instance_id},
             timeout=30,
         )
         if resp.status_code == 200:
             console.print(f"  [dim]Model unloaded[/dim]")
+            if LOAD_HISTORY:
+                # Instance IDs are the model key, suffixed ":N" for extra instances
+                LOAD_HISTORY.record_unload(host or _LMSTUDIO_HOST, instance_id.split(":")[0],
+                                           time.monotonic() - t0)
     except Exception:
         pass  # Best-effort — don't abort the run if unload fails
 
@@ -795,305 +909,465 @@ TOOLS = [
 
 # ─── Validation ────────────────────────────────────────────────────────────────
 
-def _normalize(val):
-    """Coerce string booleans to actual booleans for comparison."""
-    if isinstance(val, str):
-        if val.lower() == "true":
-            return True
-        if val.lower() == "false":
-            return False
-    return val
-
-
 def validate(tool_calls: list[dict], task: dict) -> tuple[bool, float, list[str]]:
     """
     Returns (passed, score 0.0-1.0, details).
-    tool_calls is the full list of {"name": str, "arguments": dict} across all turns.
+    tool_calls is the full list of {"name": str, "arguments": dict} across all turns,
+    with each call's mcp_result attached for ID chaining. The scoring itself lives
+    in TaskValidator, which the agentic loop also feeds turn by turn.
     """
-    validation = task.get("validation", {})
-    val_type   = validation.get("type", "tool_call_match")
-    details    = []
-
-    if not tool_calls:
-        return False, 0.0, ["No tool call emitted — model responded with text only"]
-
-    # ── Single tool call ──────────────────────────────────────────────────────
-    if val_type == "tool_call_match":
-        expected_tool = task.get("expected_tool")
-
-        # In agentic mode, the model may self-correct across turns.
-        # Score every call of the expected tool and keep the best result.
-        matching = [tc for tc in tool_calls if tc["name"] == expected_tool]
-
-        if not matching:
-            first_tool = tool_calls[0]["name"]
-            return False, 0.0, [f"Wrong tool: called '{first_tool}', expected '{expected_tool}'"]
-
-        best_score   = -1.0
-        best_details = []
-
-        for candidate in matching:
-            args      = candidate.get("arguments", {})
-            c_score   = 1.0
-            c_details = []
-
-            for param in validation.get("required_params", []):
-                if param not in args:
-                    c_details.append(f"Missing required param: '{param}'")
-                    c_score -= 0.25
-
-            for param, expected_val in validation.get("param_exact", {}).items():
-                actual_val = _normalize(args.get(param))
-                expected_val = _normalize(expected_val)
-                if actual_val != expected_val:
-                    c_details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
-                    c_score -= 0.15
-
-            for param, expected_val in validation.get("param_contains", {}).items():
-                actual_val = args.get(param)
-                if isinstance(expected_val, str) and isinstance(actual_val, str):
-                    if expected_val.lower() not in actual_val.lower():
-                        c_details.append(f"'{param}': expected to contain {expected_val!r}, got {actual_val!r}")
-                        c_score -= 0.15
-                elif isinstance(expected_val, list) and isinstance(actual_val, list):
-                    actual_lower = [v.lower() if isinstance(v, str) else v for v in actual_val]
-                    for item in expected_val:
-                        needle = item.lower() if isinstance(item, str) else item
-                        if needle not in actual_lower:
-                            c_details.append(f"'{param}': missing expected item {item!r}")
-                            c_score -= 0.05
+    return TaskValidator(task).add(tool_calls).result()
+
+
+def _score_single(spec: ValidationSpec, args: dict) -> tuple[float, list[str]]:
+    """Score one call against a tool_call_match spec. Returns (score, details)."""
+    c_score   = 1.0
+    c_details = []
+
+    for param in spec.required:
+        if param not in args:
+            c_details.append(f"Missing required param: '{param}'")
+            c_score -= 0.25
+
+    for param, expected_val in spec.exact:
+        actual_val = _normalize(args.get(param))
+        if actual_val != expected_val:
+            c_details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
+            c_score -= 0.15
+
+    for param, expected_val, kind, prepared, norm in spec.contains:
+        actual_val = args.get(param)
+        if kind == "str" and isinstance(actual_val, str):
+            if prepared not in actual_val.lower():
+                c_details.append(f"'{param}': expected to contain {expected_val!r}, got {actual_val!r}")
+                c_score -= 0.15
+        elif kind == "list" and isinstance(actual_val, list):
+            actual_lower = [v.lower() if isinstance(v, str) else v for v in actual_val]
+            for item, needle in prepared:
+                if needle not in actual_lower:
+                    c_details.append(f"'{param}': missing expected item {item!r}")
+                    c_score -= 0.05
+        else:
+            if _normalize(actual_val) != norm:
+                c_details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
+                c_score -= 0.15
+
+    for param in spec.present:
+        if param not in args or args[param] is None or args[param] == "":
+            c_details.append(f"'{param}' should be present but is missing/empty")
+            c_score -= 0.10
+
+    if spec.mask_paths:
+        update_mask  = args.get("update_mask")
+        actual_paths = update_mask.get("paths", []) if isinstance(update_mask, dict) else []
+        for p in spec.mask_paths:
+            if p not in actual_paths:
+                c_details.append(f"update_mask.paths missing '{p}'")
+                c_score -= 0.10
+
+    return max(0.0, min(1.0, c_score)), c_details
+
+
+def _call_key(value):
+    """Hashable key that equal JSON values share (1 == 1.0 == True, key order ignored)."""
+    if isinstance(value, dict):
+        return ("d", tuple(sorted((k, _call_key(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return ("l", tuple(_call_key(v) for v in value))
+    if isinstance(value, (int, float)):
+        return ("n", hash(value))
+    if isinstance(value, str) or value is None:
+        return value
+    return ("o", repr(value))
+
+
+def _result_ids(mcp_result) -> set[str]:
+    """Every ID in an MCP result: string values under "id"/"*_id" keys and items of "*_ids" lists."""
+    try:
+        data = json.loads(mcp_result) if isinstance(mcp_result, str) else mcp_result
+    except json.JSONDecodeError:
+        return set()
+    ids, stack = set(), [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, val in node.items():
+                if isinstance(val, str) and (key == "id" or key.endswith("_id")):
+                    ids.add(val)
+                elif isinstance(val, list) and key.endswith("_ids"):
+                    ids.update(v for v in val if isinstance(v, str))
                 else:
-                    if _normalize(actual_val) != _normalize(expected_val):
-                        c_details.append(f"'{param}': expected {expected_val!r}, got {actual_val!r}")
-                        c_score -= 0.15
-
-            for param in validation.get("param_present", []):
-                if param not in args or args[param] is None or args[param] == "":
-                    c_details.append(f"'{param}' should be present but is missing/empty")
-                    c_score -= 0.10
-
-            paths_required = validation.get("update_mask_must_contain", [])
-            if paths_required:
-                update_mask  = args.get("update_mask")
-                actual_paths = update_mask.get("paths", []) if isinstance(update_mask, dict) else []
-                for p in paths_required:
-                    if p not in actual_paths:
-                        c_details.append(f"update_mask.paths missing '{p}'")
-                        c_score -= 0.10
-
-            c_score = max(0.0, min(1.0, c_score))
-            if c_score > best_score:
-                best_score   = c_score
-                best_details = c_details
-
-        passed = best_score >= 0.6 and not any("required" in d for d in best_details)
-        if not best_details:
-            best_details = ["All checks passed"]
-        return passed, best_score, best_details
-
-    # ── Multiple calls of same tool ───────────────────────────────────────────
-    elif val_type == "multi_tool_call":
-        expected_tool = validation.get("tool")
-        matching      = [tc for tc in tool_calls if tc["name"] == expected_tool]
-        min_count     = validation.get("call_count_min", validation.get("call_count", 1))
-
-        if len(matching) < min_count:
-            return False, len(matching) / min_count * 0.5, [
-                f"Expected {min_count}× {expected_tool}, got {len(matching)}"
-            ]
-
-        score = 1.0
-        for tc in matching:
-            for param in validation.get("each_must_have", []):
-                if param not in tc.get("arguments", {}):
-                    details.append(f"Call missing required param '{param}'")
-                    score -= 0.1
-
-        titles_required = validation.get("titles_must_include", [])
-        found_titles    = [tc.get("arguments", {}).get("title", "") for tc in matching]
-        for t in titles_required:
-            if not any(t.lower() in ft.lower() for ft in found_titles):
-                details.append(f"Expected task title not found: '{t}'")
-                score -= 0.15
-
-        score  = max(0.0, min(1.0, score))
-        passed = score >= 0.7
-        if not details:
-            details = [f"{len(matching)}/{min_count} calls made correctly"]
-        return passed, score, details
-
-    # ── Ordered multi-tool sequence ───────────────────────────────────────────
-    elif val_type in ("multi_tool_sequence", "reasoning_chain"):
-        steps       = validation.get("steps", [])
-        step_scores = []
-
-        for i, step in enumerate(steps):
-            expected_tool = step.get("tool")
-            matching      = [tc for tc in tool_calls if tc["name"] == expected_tool]
-
-            if not matching:
-                step_scores.append(0.0)
-                details.append(f"Step {i+1} ({expected_tool}): not called")
-                continue
+                    stack.append(val)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return ids
+
+
+class IdIndex:
+    """
+    Where each entity ID was first seen in a task's MCP results, by call position.
+
+    add() is called once per call as its result arrives; source() then answers
+    "was this ID returned before call N, and by which call" with a dict lookup
+    instead of rescanning every earlier result.
+    """
+
+    def __init__(self):
+        self.first = {}   # id -> position of the first call whose result contains it
+        self.size  = 0    # calls indexed so far
+
+    def add(self, mcp_result):
+        for entity_id in _result_ids(mcp_result):
+            self.first.setdefault(entity_id, self.size)
+        self.size += 1
+
+    def source(self, entity_id: str, before: int) -> int | None:
+        """Position of the earliest call before `before` whose result returned entity_id."""
+        pos = self.first.get(entity_id)
+        return pos if pos is not None and pos < before else None
+
 
-            # ── Call count check (for steps expecting multiple calls) ─────
-            min_count = step.get("call_count_min", 1)
-            if len(matching) < min_count:
-                step_scores.append(len(matching) / min_count * 0.5)
-                details.append(f"Step {i+1} ({expected_tool}): expected ≥{min_count} calls, got {len(matching)}")
+_SET_EXACT = "param_exact"        # placeholders for the step checks that look at every
+_SET_ATOM  = "atom_type_must_be"  # matching call, not just the candidate (call_count_min > 1)
+
+
+class TaskValidator:
+    """
+    Scores a task's tool calls; validate() is TaskValidator(task).add(calls).result().
+
+    The agentic loop calls add() with only the calls made since the previous
+    turn, so each call is scored once; result() scores everything added so
+    far without rescanning earlier calls. Penalties that depend on all
+    matching calls (call counts, titles, each_must_have, multi-call
+    param_exact and atom_type_must_be) are kept as running state and applied
+    when result() is called. A step keeps the best-scoring candidate, the
+    first of equal scores, so only the first candidate with a given penalty
+    sequence is stored.
+
+    If scoring a call raises (malformed arguments), result() raises the same
+    error, so a caller of add() sees it when it asks for the verdict.
+    """
+
+    def __init__(self, task: dict):
+        self.spec       = spec_for(task)
+        self.val_type   = self.spec.type
+        self.calls      = []
+        self._error     = None   # exception from scoring a malformed call, raised by result()
+        self._seen      = {}   # _call_key(call) -> calls with that key, to spot repeats
+        self.ids        = IdIndex()   # IDs returned by earlier calls, for ID chaining
+        self.id_sources = []   # (call, param, id, source call or None) per chained ID checked
+
+        if self.val_type == "tool_call_match":
+            self._best_score   = -1.0
+            self._best_details = []
+        elif self.val_type == "multi_tool_call":
+            self._count        = 0
+            self._score        = 1.0
+            self._details      = []
+            self._titles_found = set()
+        elif self.val_type in SEQUENCE_TYPES:
+            self._steps = [{"count": 0, "each_details": [], "exact_hit": set(),
+                            "atom_bad": None, "candidates": {}} for _ in self.spec.steps]
+
+    def add(self, new_calls: list[dict]) -> "TaskValidator":
+        """Score calls made since the last add(). Each needs its mcp_result attached."""
+        for call in new_calls:
+            self.calls.append(call)
+            if self._error:
                 continue
+            try:
+                self._add_call(call)
+            except Exception as e:
+                self._error = e
+        return self
+
+    def _add_call(self, call: dict):
+        key = _call_key(call)
+        same = self._seen.setdefault(key, [])
+        repeat = any(c == call for c in same)
+        if not repeat:
+            same.append(call)
+        pos = len(self.calls) - 1
+
+        if self.val_type == "tool_call_match":
+            if call["name"] == self.spec.expected_tool:
+                self._add_single(call.get("arguments", {}))
+        elif self.val_type == "multi_tool_call":
+            if call["name"] == self.spec.tool:
+                self._add_multi(call.get("arguments", {}))
+        elif self.val_type in SEQUENCE_TYPES:
+            for i in self.spec.by_tool.get(call["name"], ()):
+                self._add_step(i, call.get("arguments", {}), repeat, pos)
+        # Indexed after scoring: a call's own result doesn't count as a prior one
+        self.ids.add(call.get("mcp_result", ""))
+
+    # ── Per-type scoring of one call ──────────────────────────────────────────
+
+    def _add_single(self, args: dict):
+        c_score, c_details = _score_single(self.spec, args)
+        if c_score > self._best_score:
+            self._best_score   = c_score
+            self._best_details = c_details
+
+    def _add_multi(self, args: dict):
+        self._count += 1
+        for param in self.spec.each_must:
+            if param not in args:
+                self._details.append(f"Call missing required param '{param}'")
+                self._score -= 0.1
+        titles = self.spec.titles
+        if len(self._titles_found) < len(titles):
+            title = args.get("title", "").lower()
+            for j, (_, needle) in enumerate(titles):
+                if j not in self._titles_found and needle in title:
+                    self._titles_found.add(j)
+
+    def _add_step(self, i: int, args: dict, repeat: bool, pos: int):
+        step  = self.spec.steps[i]
+        state = self._steps[i]
+        state["count"] += 1
+
+        for param in step.each_must:
+            if param not in args:
+                state["each_details"].append(f"{step.label}: call {state['count']} missing '{param}'")
+
+        if step.min_count > 1:
+            for param, _, norm in step.exact:
+                if param not in state["exact_hit"] and _normalize(args.get(param)) == norm:
+                    state["exact_hit"].add(param)
+            if step.atom_type and state["atom_bad"] is None:
+                actual_atom = args.get("atom_type", "")
+                if actual_atom != step.atom_type:
+                    state["atom_bad"] = (actual_atom,)
+
+        # A call equal to an earlier one scores exactly like it (its ID-chaining
+        # prefix resolves to the earlier position), so skip it.
+        if state["each_details"] or repeat:
+            return
+        checks = self._step_checks(step, args, pos)
+        state["candidates"].setdefault(
+            tuple(c if isinstance(c, str) else c[0] for c in checks), checks)
+
+    def _step_checks(self, step: StepSpec, args: dict, pos: int) -> list:
+        """
+        One candidate's failed checks, in scoring order, as (penalty, detail)
+        pairs. Multi-call param_exact / atom_type checks are left as placeholders.
+        """
+        label  = step.label
+        checks = []
 
-            # ── each_must_have: validate across ALL matching calls ─────
-            each_must = step.get("each_must_have", [])
-            if each_must:
-                missing_any = False
-                for tc_i, tc_m in enumerate(matching):
-                    m_args = tc_m.get("arguments", {})
-                    for param in each_must:
-                        if param not in m_args:
-                            details.append(f"Step {i+1} ({expected_tool}): call {tc_i+1} missing '{param}'")
-                            missing_any = True
-                if missing_any:
+        for param in step.must_have:
+            if param not in args:
+                checks.append((0.25, f"{label}: missing '{param}'"))
+
+        if step.min_count > 1:
+            checks.append(_SET_EXACT)
+        else:
+            for param, val, norm in step.exact:
+                if _normalize(args.get(param)) != norm:
+                    checks.append((0.2, f"{label}: '{param}'={args.get(param)!r} (want {val!r})"))
+
+        for param, val, needle, norm in step.contains:
+            actual_val = args.get(param)
+            if needle is not None and isinstance(actual_val, str):
+                if needle not in actual_val.lower():
+                    checks.append((0.2, f"{label}: '{param}'={actual_val!r} (want contains {val!r})"))
+            else:
+                if _normalize(actual_val) != norm:
+                    checks.append((0.2, f"{label}: '{param}'={actual_val!r} (want {val!r})"))
+
+        for param in step.present:
+            if param not in args:
+                checks.append((0.15, f"{label}: '{param}' missing"))
+
+        if step.relate_to:
+            relate_to, needle = step.relate_to
+            name_val = args.get("name", "")
+            if needle not in name_val.lower():
+                checks.append((0.15, f"{label}: name={name_val!r} doesn't relate to {relate_to!r}"))
+
+        if step.q_contains:
+            q_contains, needle = step.q_contains
+            query_val = args.get("query", "")
+            if needle not in query_val.lower():
+                checks.append((0.15, f"{label}: query={query_val!r} doesn't contain {q_contains!r}"))
+
+        if step.q_relate:
+            q_relate, keywords = step.q_relate
+            query_val = args.get("query", "").lower()
+            if not any(kw in query_val for kw in keywords):
+                checks.append((0.15, f"{label}: query={query_val!r} doesn't relate to {q_relate!r}"))
+
+        if step.atom_type:
+            if step.min_count > 1:
+                checks.append(_SET_ATOM)
+            else:
+                actual_atom = args.get("atom_type", "")
+                if actual_atom != step.atom_type:
+                    checks.append((0.2, f"{label}: atom_type={actual_atom!r} (want {step.atom_type!r})"))
+
+        if step.mentions:
+            combined = args.get("content", "").lower() + " " + args.get("title", "").lower()
+            for keyword, needle in step.mentions:
+                if needle not in combined:
+                    checks.append((0.15, f"{label}: content doesn't mention {keyword!r}"))
+
+        for param_name in step.must_match:
+            actual_id = args.get(param_name, "")
+            if not actual_id:
+                checks.append((0.2, f"{label}: '{param_name}' is empty (expected chained ID)"))
+                continue
+            source = self.ids.source(actual_id, pos)
+            self.id_sources.append((pos, param_name, actual_id, source))
+            if source is None and not actual_id.replace("-", "").isalnum():
+                checks.append((0.15, f"{label}: '{param_name}'={actual_id!r} doesn't look like a valid ID"))
+
+        if step.mask_paths:
+            um = args.get("update_mask")
+            actual_paths = um.get("paths", []) if isinstance(um, dict) else []
+            for p in step.mask_paths:
+                if p not in actual_paths:
+                    checks.append((0.10, f"{label}: update_mask.paths missing '{p}'"))
+
+        return checks
+
+    # ── Result ────────────────────────────────────────────────────────────────
+
+    def result(self) -> tuple[bool, float, list[str]]:
+        """(passed, score 0.0-1.0, details) for every call added so far."""
+        if self._error:
+            raise self._error
+        if not self.calls:
+            return False, 0.0, ["No tool call emitted — model responded with text only"]
+
+        spec = self.spec
+        if self.val_type == "tool_call_match":
+            if self._best_score < 0:
+                return False, 0.0, [f"Wrong tool: called '{self.calls[0]['name']}', "
+                                    f"expected '{spec.expected_tool}'"]
+            details = list(self._best_details)
+            passed  = self._best_score >= 0.6 and not any("required" in d for d in details)
+            return passed, self._best_score, details or ["All checks passed"]
+
+        if self.val_type == "multi_tool_call":
+            min_count = spec.min_count
+            if self._count < min_count:
+                return False, self._count / min_count * 0.5, [
+                    f"Expected {min_count}× {spec.tool}, got {self._count}"
+                ]
+            score, details = self._score, list(self._details)
+            for j, (t, _) in enumerate(spec.titles):
+                if j not in self._titles_found:
+                    details.append(f"Expected task title not found: '{t}'")
+                    score -= 0.15
+            score = max(0.0, min(1.0, score))
+            return score >= 0.7, score, details or [f"{self._count}/{min_count} calls made correctly"]
+
+        if self.val_type in SEQUENCE_TYPES:
+            steps       = spec.steps
+            step_scores = []
+            details     = []
+            for step, state in zip(steps, self._steps):
+                label, min_count = step.label, step.min_count
+                if not state["count"]:
+                    step_scores.append(0.0)
+                    details.append(f"{label}: not called")
+                    continue
+                if state["count"] < min_count:
+                    step_scores.append(state["count"] / min_count * 0.5)
+                    details.append(f"{label}: expected ≥{min_count} calls, got {state['count']}")
+                    continue
+                if state["each_details"]:
+                    details.extend(state["each_details"])
                     step_scores.append(0.5)
                     continue
 
-            # In agentic mode, models may retry a step across turns.
-            # Score every matching call and keep the best result for this step.
-            best_step_score   = -1.0
-            best_step_details = []
-            best_tc           = matching[0]
-
-            for candidate in matching:
-                args       = candidate.get("arguments", {})
-                step_score = 1.0
-                c_details  = []
-
-                for param in step.get("must_have_params", []):
-                    if param not in args:
-                        c_details.append(f"Step {i+1} ({expected_tool}): missing '{param}'")
-                        step_score -= 0.25
-
-                for param, val in step.get("param_exact", {}).items():
-                    # For multi-call steps, check if ANY call has the exact value
-                    if min_count > 1:
-                        if not any(_normalize(m.get("arguments", {}).get(param)) == _normalize(val) for m in matching):
-                            c_details.append(f"Step {i+1} ({expected_tool}): no call has '{param}'={val!r}")
-                            step_score -= 0.2
-                    elif _normalize(args.get(param)) != _normalize(val):
-                        c_details.append(f"Step {i+1} ({expected_tool}): '{param}'={args.get(param)!r} (want {val!r})")
-                        step_score -= 0.2
-
-                for param, val in step.get("param_contains", {}).items():
-                    actual_val = args.get(param)
-                    if isinstance(val, str) and isinstance(actual_val, str):
-                        if val.lower() not in actual_val.lower():
-                            c_details.append(f"Step {i+1} ({expected_tool}): '{param}'={actual_val!r} (want contains {val!r})")
-                            step_score -= 0.2
-                    else:
-                        if _normalize(actual_val) != _normalize(val):
-                            c_details.append(f"Step {i+1} ({expected_tool}): '{param}'={actual_val!r} (want {val!r})")
-                            step_score -= 0.2
-
-                for param in step.get("param_present", []):
-                    if param not in args:
-                        c_details.append(f"Step {i+1} ({expected_tool}): '{param}' missing")
-                        step_score -= 0.15
-
-                # ── Semantic validators ───────────────────────────────────
-
-                # name_must_relate_to: check if name param contains the keyword
-                relate_to = step.get("name_must_relate_to")
-                if relate_to:
-                    name_val = args.get("name", "")
-                    if relate_to.lower() not in name_val.lower():
-                        c_details.append(f"Step {i+1} ({expected_tool}): name={name_val!r} doesn't relate to {relate_to!r}")
-                        step_score -= 0.15
-
-                # query_must_contain: check if query param contains the keyword
-                q_contains = step.get("query_must_contain")
-                if q_contains:
-                    query_val = args.get("query", "")
-                    if q_contains.lower() not in query_val.lower():
-                        c_details.append(f"Step {i+1} ({expected_tool}): query={query_val!r} doesn't contain {q_contains!r}")
-                        step_score -= 0.15
-
-                # query_must_relate_to: looser check — any word overlap
-                q_relate = step.get("query_must_relate_to")
-                if q_relate:
-                    query_val = args.get("query", "").lower()
-                    keywords = [w for w in q_relate.lower().split() if len(w) > 2]
-                    if not any(kw in query_val for kw in keywords):
-                        c_details.append(f"Step {i+1} ({expected_tool}): query={query_val!r} doesn't relate to {q_relate!r}")
-                        step_score -= 0.15
-
-                # atom_type_must_be: check atom_type param
-                atom_type_req = step.get("atom_type_must_be")
-                if atom_type_req:
-                    calls_to_check = matching if min_count > 1 else [candidate]
-                    for tc_c in calls_to_check:
-                        actual_atom = tc_c.get("arguments", {}).get("atom_type", "")
-                        if actual_atom != atom_type_req:
-                            c_details.append(f"Step {i+1} ({expected_tool}): atom_type={actual_atom!r} (want {atom_type_req!r})")
-                            step_score -= 0.2
-                            break  # only penalize once
-
-                # content_must_mention: check content param for required keywords
-                content_mentions = step.get("content_must_mention", [])
-                if content_mentions:
-                    content_val = args.get("content", "").lower()
-                    title_val = args.get("title", "").lower()
-                    combined = content_val + " " + title_val
-                    for keyword in content_mentions:
-                        if keyword.lower() not in combined:
-                            c_details.append(f"Step {i+1} ({expected_tool}): content doesn't mention {keyword!r}")
-                            step_score -= 0.15
-
-                # *_must_match: ID chaining validation
-                for match_field in ("project_id_must_match", "asset_id_must_match", "workunit_id_must_match"):
-                    match_rule = step.get(match_field)
-                    if not match_rule:
-                        continue
-                    param_name = match_field.replace("_must_match", "")
-                    actual_id  = args.get(param_name, "")
-                    if not actual_id:
-                        c_details.append(f"Step {i+1} ({expected_tool}): '{param_name}' is empty (expected chained ID)")
-                        step_score -= 0.2
-                        continue
-                    prev_tools = tool_calls[:tool_calls.index(candidate)]
-                    id_found_in_prev = any(
-                        actual_id in json.dumps(ptc.get("mcp_result", ""))
-                        for ptc in prev_tools
-                    ) if prev_tools else False
-                    if not id_found_in_prev and not actual_id.replace("-", "").isalnum():
-                        c_details.append(f"Step {i+1} ({expected_tool}): '{param_name}'={actual_id!r} doesn't look like a valid ID")
-                        step_score -= 0.15
-
-                # update_mask_must_contain: check update_mask.paths
-                paths_req = step.get("update_mask_must_contain", [])
-                if paths_req:
-                    um = args.get("update_mask")
-                    actual_paths = um.get("paths", []) if isinstance(um, dict) else []
-                    for p in paths_req:
-                        if p not in actual_paths:
-                            c_details.append(f"Step {i+1} ({expected_tool}): update_mask.paths missing '{p}'")
-                            step_score -= 0.10
-
-                step_score = max(0.0, step_score)
-                if step_score > best_step_score:
-                    best_step_score   = step_score
-                    best_step_details = c_details
-                    best_tc           = candidate
-
-            details.extend(best_step_details)
-            step_scores.append(best_step_score)
-            if best_step_score >= 0.8:
-                details.append(f"Step {i+1} ({expected_tool}): ✓")
-
-        score  = sum(step_scores) / len(steps) if steps else 0.0
-        passed = score >= 0.75
-        return passed, score, details
-
-    return False, 0.0, ["Unknown validation type"]
+                shared = {_SET_EXACT: [], _SET_ATOM: []}
+                for param, val, _ in step.exact:
+                    if param not in state["exact_hit"]:
+                        shared[_SET_EXACT].append((0.2, f"{label}: no call has '{param}'={val!r}"))
+                if state["atom_bad"] is not None:
+                    shared[_SET_ATOM].append((0.2, f"{label}: atom_type={state['atom_bad'][0]!r} "
+                                                   f"(want {step.atom_type!r})"))
+
+                best_step_score, best_step_details = -1.0, []
+                for checks in state["candidates"].values():
+                    step_score, c_details = 1.0, []
+                    for check in checks:
+                        for penalty, detail in shared[check] if isinstance(check, str) else (check,):
+                            c_details.append(detail)
+                            step_score -= penalty
+                    step_score = max(0.0, step_score)
+                    if step_score > best_step_score:
+                        best_step_score, best_step_details = step_score, c_details
+
+                details.extend(best_step_details)
+                step_scores.append(best_step_score)
+                if best_step_score >= 0.8:
+                    details.append(f"{label}: ✓")
+
+            score = sum(step_scores) / len(steps) if steps else 0.0
+            return score >= 0.75, score, details
+
+        return False, 0.0, ["Unknown validation type"]
+
+
+# ─── Warm-up ───────────────────────────────────────────────────────────────────
+
+# Synthetic requests sent after a model load, never scored. Two different user
+# messages, so the second one reuses the cached system prompt + TOOLS prefix
+# the way later tasks do, without being a repeat of the first.
+WARMUP_PROMPTS = (
+    "List my projects.",
+    "Show me the workunit called Warm-up.",
+)
+WARMUP_MAX_TOKENS = 16
+
+
+def warm_up(client: OpenAI, model_id: str, cold: bool = True) -> dict:
+    """
+    Send the loaded model its first requests of this run before any task runs.
+
+    The first completion after a load pays for prompt-template compilation and
+    KV cache allocation; timing it here keeps that cost out of the first task's
+    elapsed_s. Returns {'cold_start_ms', 'warm_ms', 'error'}: the first request,
+    the second (steady state, for comparison) and any error, which is logged
+    and not fatal. cold=False means the instance was not freshly loaded by this
+    run (--skip-load, a prefetch, or requests already sent to it), so the first
+    request is reported as 'first_request_ms' instead of a cold start.
+    """
+    timings, error = [], None
+    for prompt in WARMUP_PROMPTS:
+        t0 = time.perf_counter()
+        try:
+            client.chat.completions.create(
+                model=model_id,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user",   "content": prompt},
+                ],
+                tools=TOOLS,
+                tool_choice="auto",
+                temperature=0.0,
+                max_tokens=WARMUP_MAX_TOKENS,
+            )
+        except Exception as e:
+            error = str(e)[:200]
+            break
+        timings.append(_ms_since(t0))
+
+    first  = "cold_start_ms" if cold else "first_request_ms"
+    warmup = {
+        first:     timings[0] if timings else None,
+        "warm_ms": timings[1] if len(timings) > 1 else None,
+        "error":   error,
+    }
+    if error:
+        console.print(f"  [yellow]Warm-up failed: {error}[/yellow]")
+    else:
+        console.print(f"  [dim]Warm-up: {'cold start' if cold else 'first request'} {warmup[first]:.0f} ms, "
+                      f"warm {warmup['warm_ms']:.0f} ms[/dim]")
+    return warmup
 
 
 # ─── Agentic task execution ────────────────────────────────────────────────────
@@ -1127,57 +1401,25 @@ def extract_ids_from_result(tool_name: str, mcp_result: str) -> dict:
 
 def seed_l2_fixtures(mcp: MCPClient) -> dict:
     """
-    Create fixture data required by L2-06 and L2-07 tasks.
+    Create fresh fixture data required by L2-06 and L2-07 tasks, as declared
+    under "fixtures" in level2_reasoning.json.
     Returns a context dict with the created entity IDs.
     """
-    context = {}
-
-    # Create project
-    proj_raw = mcp.call_tool("create_project", {
-        "name": "Notifications Feature",
-        "status": "active",
-    })
-    proj_ids = extract_ids_from_result("create_project", proj_raw)
-    context.update(proj_ids)
-
-    # Create workunit
-    wu_raw = mcp.call_tool("create_workunit", {
-        "name": "Implement User Notifications",
-        "problem_statement": "Users need to be notified when workunits they follow are updated, but no notification system exists yet.",
-        "success_criteria": "Users receive timely notifications for workunit updates via email and in-app channels.",
-        "project_id": context.get("project_id", ""),
-        "status": "active",
-    })
-    wu_ids = extract_ids_from_result("create_workunit", wu_raw)
-    context.update(wu_ids)
-
-    wu_id = context.get("workunit_id", "")
-    if not wu_id:
+    spec    = load_fixture_spec(TASKS_DIR)
+    context = seed_fixtures(mcp, spec)
+    if not context.get("workunit_id"):
         console.print("  [yellow]L2 fixture seeding: could not create workunit[/yellow]")
         return context
 
-    # Create tasks that match L2-06 triage rules
-    fixture_tasks = [
-        {"title": "Write unit tests for notification service", "status": "todo"},
-        {"title": "Fix email delivery bug", "status": "todo"},
-        {"title": "Add integration testing for webhooks", "status": "todo"},
-        {"title": "Fix race condition in notification queue", "status": "todo"},
-    ]
-    for t in fixture_tasks:
-        task_raw = mcp.call_tool("create_task", {
-            "workunit_id": wu_id,
-            "title": t["title"],
-            "status": t["status"],
-        })
-        task_ids = extract_ids_from_result("create_task", task_raw)
-        # Keep updating task_id so context has the last one (for L0/L1 compatibility)
-        context.update(task_ids)
-
     console.print(f"  [dim]L2 fixtures seeded: project={context.get('project_id', '?')}, "
-                  f"workunit={context.get('workunit_id', '?')}, {len(fixture_tasks)} tasks[/dim]")
+                  f"workunit={context.get('workunit_id', '?')}, {len(spec['tasks'])} tasks[/dim]")
     return context
 
 
+def _ms_since(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000, 1)
+
+
 def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
              context: dict | None = None) -> dict:
     """
@@ -1185,6 +1427,7 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
     - Model calls tool → we execute it against MCP → feed result back → repeat
     - Stops when model sends a message with no tool calls, or TASK_TIMEOUT_S elapses
     - Result contains every tool call made across all turns for validation
+    - timing splits elapsed_s into model time, MCP time and validation time
     """
     prompt = task["prompt"]
 
@@ -1195,11 +1438,14 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
 
     start       = time.time()
     all_calls   = []   # every tool call across all turns, for validation
+    checker     = TaskValidator(task)   # scores all_calls incrementally, turn by turn
     mcp_results = []   # MCP response strings, parallel to all_calls
     turns       = 0
     timed_out   = False
     error       = None
     model_responses = []  # text content from each assistant turn
+    turn_metrics    = []  # per-turn latency/throughput, only with --stream
+    spans           = []  # per-turn wall-clock split: llm_ms, mcp_ms per call, validate_ms
 
     messages = [
         {"role": "system", "content": SYSTEM_PROMPT},
@@ -1215,7 +1461,7 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
                 timed_out = True
                 break
 
-            response = client.chat.completions.create(
+            request = dict(
                 model=model_id,
                 messages=messages,
                 tools=TOOLS,
@@ -1224,8 +1470,15 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
                 max_tokens=4096,
                 timeout=TASK_TIMEOUT_S,
             )
-
-            msg   = response.choices[0].message
+            span = {"llm_ms": 0.0, "mcp_ms": [], "validate_ms": 0.0}
+            spans.append(span)
+            t0 = time.perf_counter()
+            if STREAM_COMPLETIONS:
+                msg, metrics = stream_chat(client, **request)
+                turn_metrics.append(metrics)
+            else:
+                msg = client.chat.completions.create(**request).choices[0].message
+            span["llm_ms"] = _ms_since(t0)
             turns += 1
             if msg.content:
                 model_responses.append(msg.content)
@@ -1265,7 +1518,9 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
             # Execute each tool call against MCP and append results
             call_offset = len(all_calls) - len(turn_calls)
             for j, tc in enumerate(turn_calls):
+                t0     = time.perf_counter()
                 result = mcp.call_tool(tc["name"], tc["arguments"])
+                span["mcp_ms"].append(_ms_since(t0))
                 mcp_results.append(result)
                 # Store MCP result alongside the tool call for ID chaining validation
                 all_calls[call_offset + j]["mcp_result"] = result
@@ -1277,7 +1532,9 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
 
             # Early exit: stop looping as soon as the task is already passing.
             # No need to wait for the model to stop on its own or hit the timeout.
-            early_passed, _, _ = validate(all_calls, task)
+            t0 = time.perf_counter()
+            early_passed, _, _ = checker.add(all_calls[len(checker.calls):]).result()
+            span["validate_ms"] = _ms_since(t0)
             if early_passed:
                 break
 
@@ -1287,13 +1544,15 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
             error = f"Context overflow: model's n_ctx is too small for the full TOOLS list. Increase context length in LM Studio to ≥8192. ({error})"
 
     elapsed = round(time.time() - start, 2)
-    passed, score, details = validate(all_calls, task)
+    t0 = time.perf_counter()
+    passed, score, details = checker.add(all_calls[len(checker.calls):]).result()
+    final_validate_ms = _ms_since(t0)
 
     if timed_out:
         reason = f"max {MAX_TURNS} turns" if turns >= MAX_TURNS else f"{TASK_TIMEOUT_S}s wall-clock"
         details.insert(0, f"Task timed out ({reason}, {turns} turns, {elapsed}s elapsed)")
 
-    return {
+    result = {
         "task_id":         task["id"],
         "task_name":       task["name"],
         "prompt_sent":     prompt,
@@ -1307,58 +1566,218 @@ def run_task(client: OpenAI, mcp: MCPClient, model_id: str, task: dict,
         "elapsed_s":       elapsed,
         "timed_out":       timed_out,
         "error":           error,
+        # which earlier call returned each chained ID (None: not returned by any)
+        "id_sources":      [{"call": c, "param": p, "id": i, "source_call": s}
+                            for c, p, i, s in checker.id_sources],
+        "timing": {
+            "llm_ms":      round(sum(sp["llm_ms"] for sp in spans), 1),
+            "mcp_ms":      round(sum(sum(sp["mcp_ms"]) for sp in spans), 1),
+            "validate_ms": round(sum(sp["validate_ms"] for sp in spans) + final_validate_ms, 1),
+            "mcp_calls":   sum(len(sp["mcp_ms"]) for sp in spans),
+            "turns":       spans,
+        },
     }
+    if STREAM_COMPLETIONS:
+        result["turn_metrics"] = turn_metrics
+    return result
 
 
 # ─── Level runner ──────────────────────────────────────────────────────────────
 
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Levels whose tasks may overlap under --concurrency. L2 tasks share the seeded
+# fixture workunit and find it by name, so they always run in file order.
+CONCURRENT_LEVELS = {0, 1}
+
+
+def _update_context(context: dict, result: dict):
+    """Extract entity IDs from a task's MCP responses for subsequent tasks."""
+    for call, mcp_result in zip(result["tool_calls"], result.get("mcp_results", [])):
+        ids = extract_ids_from_result(call["name"], mcp_result)
+        context.update(ids)
+
+
+def _print_task_result(task: dict, result: dict):
+    icon      = "✅" if result["passed"] else "❌"
+    score_pct = f"{result['score']:.0%}"
+    turns_str = f"{result['turns']}t" if result['turns'] > 1 else ""
+    timeout_str = " ⏱" if result.get("timed_out") else ""
+    console.print(
+        f"    {icon} {task['id']} [{score_pct}] {task['name']} "
+        f"({result['elapsed_s']}s{' ' + turns_str if turns_str else ''}{timeout_str})"
+    )
+    if not result["passed"] or result["error"]:
+        for d in result["details"]:
+            console.print(f"       [dim]{d}[/dim]")
+
+
+# Entity ID each create tool yields (mirrors extract_ids_from_result)
+PRODUCED_IDS = {
+    "create_project":  "project_id",
+    "create_workunit": "workunit_id",
+    "create_task":     "task_id",
+}
+
+# Mutating a parent entity must wait for earlier work on its children
+# (e.g. completing a workunit after its tasks have been updated).
+CHILD_IDS = {
+    "project_id":  ("workunit_id", "task_id"),
+    "workunit_id": ("task_id",),
+}
+
+
+def load_tasks(level: int) -> list[dict]:
+    """Load the task list for a level from its JSON file."""
+    with open(TASK_FILES[level]) as f:
+        return compile_tasks(json.load(f)["tasks"])
+
+
+def _task_tools(task: dict) -> list[str]:
+    """Tool names a task is expected to call, from its expectations and validation."""
+    tools      = []
+    validation = task.get("validation", {})
+    candidates = [task.get("expected_tool"), validation.get("tool")]
+    candidates += [s.get("tool") for s in validation.get("steps", [])]
+    candidates += [t.split()[0] for t in task.get("expected_tool_sequence", []) if t]
+    for name in candidates:
+        if name and name not in tools:
+            tools.append(name)
+    return tools
+
+
+def build_task_graph(tasks: list[dict]) -> dict[str, list[str]]:
+    """
+    Derive task dependencies within a level. Returns {task_id: [dependency task_ids]}.
+
+    - A task consuming {{key}} depends on the latest earlier task producing key
+      (or on none, when the ID comes from an earlier level's context).
+    - A task producing key waits for earlier consumers of key, so they still
+      see the previous ID before the context entry is replaced.
+    - A task calling update_* mutates the entities it references: it waits for
+      earlier tasks touching them (or their children), and later consumers wait for it.
+    - "depends_on" in the task JSON adds explicit edges for dependencies that
+      are not placeholders (e.g. searching by a name an earlier task created).
+    """
+    graph        = {}
+    last_writer  = {}   # key -> task_id that last produced or mutated it
+    readers      = {}   # key -> task_ids using it since last_writer
+
+    for task in tasks:
+        tid      = task["id"]
+        tools    = _task_tools(task)
+        consumes = list(dict.fromkeys(PLACEHOLDER_RE.findall(task["prompt"])))
+        produces = [PRODUCED_IDS[t] for t in tools if t in PRODUCED_IDS]
+        mutates  = any(t.startswith("update_") for t in tools)
+        deps     = list(task.get("depends_on", []))
+
+        for key in consumes:
+            if key in last_writer:
+                deps.append(last_writer[key])
+        for key in produces:
+            deps.extend(readers.get(key, []))
+            if key in last_writer:
+                deps.append(last_writer[key])
+        if mutates:
+            for key in consumes:
+                for k in (key, *CHILD_IDS.get(key, ())):
+                    deps.extend(readers.get(k, []))
+                    if k in last_writer:
+                        deps.append(last_writer[k])
+
+        graph[tid] = [d for d in dict.fromkeys(deps) if d != tid]
+
+        for key in consumes:
+            if mutates:
+                last_writer[key] = tid
+                readers[key]     = []
+            else:
+                readers.setdefault(key, []).append(tid)
+        for key in produces:
+            last_writer[key] = tid
+            readers[key]     = []
+
+    return graph
+
+
+def task_waves(tasks: list[dict], graph: dict[str, list[str]]) -> list[list[int]]:
+    """Topologically group task indices into waves; each wave only depends on earlier waves."""
+    index = {t["id"]: i for i, t in enumerate(tasks)}
+    depth = {}
+    for task in tasks:  # file order is already a valid topological order
+        deps = [d for d in graph.get(task["id"], []) if d in index]
+        depth[task["id"]] = 1 + max((depth[d] for d in deps), default=-1)
+    waves = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for task in tasks:
+        waves[depth[task["id"]]].append(index[task["id"]])
+    return waves
+
+
+async def _run_tasks_async(client: OpenAI, mcp: MCPClient, model_id: str,
+                           tasks: list[dict], context: dict, concurrency: int) -> list[dict]:
+    """Run a level's tasks on an asyncio scheduler, at most `concurrency` at once.
+
+    Tasks are scheduled in topological waves of the level's task graph. Each
+    task's agentic loop is the blocking run_task, executed in a worker thread;
+    LM Studio serves overlapping requests from its parallel slots. Context
+    updates are applied in file order after each wave, so ID substitution
+    matches a serial run.
+    """
+    sem     = asyncio.Semaphore(concurrency)
+    results = [None] * len(tasks)
+
+    async def run_one(i: int):
+        async with sem:
+            results[i] = await asyncio.to_thread(
+                run_task, client, mcp, model_id, tasks[i], dict(context)
+            )
+        _print_task_result(tasks[i], results[i])
+
+    for wave in task_waves(tasks, build_task_graph(tasks)):
+        await asyncio.gather(*(run_one(i) for i in wave))
+        for i in wave:
+            _update_context(context, results[i])
+    return results
+
+
 def run_level(client: OpenAI, mcp: MCPClient, model_id: str, level: int,
-              context: dict | None = None) -> dict:
+              context: dict | None = None, concurrency: int = 1,
+              show_status: bool = True) -> dict:
     """Run all tasks for a level. Returns summary + per-task results.
 
     context is a mutable dict of entity IDs (project_id, workunit_id, task_id)
     carried across tasks so {{placeholder}} substitution works.
+    concurrency > 1 runs independent L0/L1 tasks in parallel (see build_task_graph).
+    show_status=False drops the live spinner, which rich allows only one of
+    at a time (fleet mode runs several levels at once).
     """
     if context is None:
         context = {}
 
-    task_file   = TASK_FILES[level]
     level_names = {0: "Explicit", 1: "Natural Language", 2: "Reasoning"}
-
-    with open(task_file) as f:
-        task_data = json.load(f)
-    tasks = task_data["tasks"]
+    tasks       = load_tasks(level)
 
     # Seed fixture data for L2 tasks that require pre-existing workunits/tasks
-    if level == 2:
+    if level == 2 and mcp:
         fixture_ctx = seed_l2_fixtures(mcp)
         context.update(fixture_ctx)
 
-    console.print(f"\n  [bold]Level {level} — {level_names[level]}[/bold] ({len(tasks)} tasks)")
-
-    results = []
-    for task in tasks:
-        with console.status(f"    [dim]{task['id']}: {task['name']}[/dim]"):
-            result = run_task(client, mcp, model_id, task, context)
-
-        # Extract entity IDs from MCP responses for subsequent tasks
-        for call, mcp_result in zip(result["tool_calls"], result.get("mcp_results", [])):
-            ids = extract_ids_from_result(call["name"], mcp_result)
-            context.update(ids)
-
-        icon      = "✅" if result["passed"] else "❌"
-        score_pct = f"{result['score']:.0%}"
-        turns_str = f"{result['turns']}t" if result['turns'] > 1 else ""
-        timeout_str = " ⏱" if result.get("timed_out") else ""
-        console.print(
-            f"    {icon} {task['id']} [{score_pct}] {task['name']} "
-            f"({result['elapsed_s']}s{' ' + turns_str if turns_str else ''}{timeout_str})"
-        )
-        if not result["passed"] or result["error"]:
-            for d in result["details"]:
-                console.print(f"       [dim]{d}[/dim]")
-
-        results.append(result)
+    if concurrency > 1 and level in CONCURRENT_LEVELS:
+        console.print(f"\n  [bold]Level {level} — {level_names[level]}[/bold] "
+                      f"({len(tasks)} tasks, concurrency={concurrency})")
+        results = asyncio.run(_run_tasks_async(client, mcp, model_id, tasks, context, concurrency))
+    else:
+        console.print(f"\n  [bold]Level {level} — {level_names[level]}[/bold] ({len(tasks)} tasks)")
+        results = []
+        for task in tasks:
+            status = (console.status(f"    [dim]{task['id']}: {task['name']}[/dim]")
+                      if show_status else contextlib.nullcontext())
+            with status:
+                result = run_task(client, mcp, model_id, task, context)
+
+            _update_context(context, result)
+            _print_task_result(task, result)
+            results.append(result)
 
     total    = len(results)
     passed   = sum(1 for r in results if r["passed"])
@@ -1378,97 +1797,153 @@ def run_level(client: OpenAI, mcp: MCPClient, model_id: str, level: int,
 
 # ─── Model runner ──────────────────────────────────────────────────────────────
 
-def reset_benchmark_env(mcp: "MCPClient"):
+def reset_benchmark_env(mcp: "MCPClient", workers: int = RESET_WORKERS) -> bool:
     """Wipe all benchmark org data via MCP between model runs for a clean slate.
 
     Steps:
       1. Discover org_id (from user profile, or by creating a probe project)
-      2. list_projects → remove_project(action=delete) for each
-      3. search for orphaned assets → delete_asset for each
-      4. list directories → delete(recursive=True) for each
+      2. Walk every page of projects, assets and directories and collect IDs
+      3. Delete projects, then assets, then root directories — each phase
+         fanned out over a pool of `workers` threads
+      4. Re-list to verify the org is empty; one more pass if anything is left
+
+    Collecting IDs before deleting keeps pagination stable. Returns True when
+    the org verified empty; prints per-phase timing either way.
     """
+    timings = {}
+
+    def _timed(phase: str, fn, *args):
+        t0 = time.time()
+        result = fn(*args)
+        timings[phase] = timings.get(phase, 0.0) + time.time() - t0
+        return result
+
     # 1. Get org_id
     # get_authenticated_user doesn't return org_id, so we try multiple strategies:
     #   a) Check the user response for organizations or organization_id
     #   b) Fall back to creating a temporary probe project and reading org_id from it
-    org_id = ""
-    user_raw = mcp.call_tool("get_authenticated_user", {})
-    try:
-        user_data = json.loads(user_raw)
-        orgs = user_data.get("organizations", [])
-        org_id = orgs[0]["id"] if orgs else user_data.get("organization_id", "")
-    except (json.JSONDecodeError, KeyError, IndexError):
-        pass
-
-    if not org_id:
-        # Probe: create a temporary project, extract org_id, then let cleanup delete it
-        probe_raw = mcp.call_tool("create_project", {"name": "_benchmark_cleanup_probe"})
+    def _discover_org() -> str:
+        org_id = ""
+        user_raw = mcp.call_tool("get_authenticated_user", {})
         try:
-            probe_data = json.loads(probe_raw)
-            project = probe_data.get("project", probe_data)
-            org_id = project.get("organization_id", "")
-        except (json.JSONDecodeError, KeyError):
+            user_data = json.loads(user_raw)
+            orgs = user_data.get("organizations", [])
+            org_id = orgs[0]["id"] if orgs else user_data.get("organization_id", "")
+        except (json.JSONDecodeError, KeyError, IndexError):
             pass
 
+        if not org_id:
+            # Probe: create a temporary project, extract org_id, then let cleanup delete it
+            probe_raw = mcp.call_tool("create_project", {"name": "_benchmark_cleanup_probe"})
+            try:
+                probe_data = json.loads(probe_raw)
+                project = probe_data.get("project", probe_data)
+                org_id = project.get("organization_id", "")
+            except (json.JSONDecodeError, KeyError):
+                pass
+        return org_id
+
+    org_id = _timed("discover", _discover_org)
     if not org_id:
         console.print("  [yellow]Could not determine org_id, skipping cleanup[/yellow]")
-        return
+        return False
 
-    def _parse_mcp(raw: str, key: str, label: str) -> list:
-        """Parse an MCP call_tool response, warn on errors, return list."""
+    def _parse_mcp(raw: str, key: str, label: str) -> tuple[list, dict]:
+        """Parse an MCP call_tool response, warn on errors, return (items, response)."""
         try:
             data = json.loads(raw)
         except json.JSONDecodeError:
             console.print(f"  [yellow]Cleanup: {label} returned invalid JSON[/yellow]")
-            return []
+            return [], {}
         if "error" in data:
             console.print(f"  [yellow]Cleanup: {label} failed: {data['error']}[/yellow]")
-            return []
-        return data.get(key, [])
-
-    # 2. Delete all projects (cascades to workunits/tasks)
-    projects_raw = mcp.call_tool("list_projects", {"organization_id": org_id, "page_size": 100})
-    projects = _parse_mcp(projects_raw, "projects", "list_projects")
-
-    for proj in projects:
-        pid = proj.get("id", "")
-        if pid:
-            mcp.call_tool("remove_project", {"id": pid, "action": "delete"})
-
-    # 3. Delete orphaned assets
-    assets_raw = mcp.call_tool("search", {"query": " ", "result_types": ["asset"], "page_size": 50})
-    assets = _parse_mcp(assets_raw, "results", "search assets")
-
-    for asset in assets:
-        aid = asset.get("id", "")
-        if aid:
-            mcp.call_tool("delete_asset", {"id": aid})
-
-    # 4. Delete directories
-    dirs_raw = mcp.call_tool("directory", {"action": "list", "organization_id": org_id})
-    directories = _parse_mcp(dirs_raw, "directories", "list directories")
-
-    for d in directories:
-        did = d.get("id", "")
-        if did:
-            mcp.call_tool("directory", {"action": "delete", "id": did, "recursive": True})
-
-    deleted = len(projects) + len(assets) + len(directories)
-    if deleted:
-        console.print(f"  [dim]Cleanup: deleted {len(projects)} projects, {len(assets)} assets, {len(directories)} directories[/dim]")
+            return [], {}
+        return data.get(key, []), data
+
+    def _walk(tool: str, args: dict, key: str, label: str, page_size: int) -> list:
+        """Collect every item across pages. Stops on a short, empty or repeated page."""
+        items, seen = [], set()
+        for page_number in range(1, RESET_MAX_PAGES + 1):
+            raw = mcp.call_tool(tool, {**args, "page_size": page_size, "page_number": page_number})
+            page, data = _parse_mcp(raw, key, label)
+            fresh = [it for it in page if it.get("id") and it["id"] not in seen]
+            seen.update(it["id"] for it in fresh)
+            items.extend(fresh)
+            if len(page) < page_size or not fresh or data.get("has_next_page") is False:
+                break
+        return items
+
+    def _list_all() -> tuple[list, list, list]:
+        projects = _walk("list_projects", {"organization_id": org_id}, "projects", "list_projects", 100)
+        assets   = _walk("search", {"query": " ", "result_types": ["asset"]}, "results", "search assets", 50)
+        dirs, _  = _parse_mcp(mcp.call_tool("directory", {"action": "list", "organization_id": org_id}),
+                              "directories", "list directories")
+        dir_ids  = {d.get("id") for d in dirs}
+        # Recursive delete removes children, so only roots need a call
+        roots    = [d for d in dirs if d.get("id") and d.get("parent_id") not in dir_ids]
+        return projects, assets, roots
+
+    def _delete_all(calls: list[tuple[str, dict]]) -> int:
+        """Run delete calls on the worker pool; return how many reported an error."""
+        if not calls:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(lambda c: mcp.call_tool(*c), calls))
+        return sum(1 for r in results if r.startswith('{"error"'))
+
+    deleted = {"projects": 0, "assets": 0, "directories": 0}
+    failed  = 0
+    for attempt in range(2):
+        phase = "list" if attempt == 0 else "verify"
+        projects, assets, directories = _timed(phase, _list_all)
+        if not (projects or assets or directories):
+            break
+        if attempt == 1:
+            console.print(f"  [dim]Cleanup: {len(projects) + len(assets) + len(directories)} "
+                          f"entities left after first pass, retrying[/dim]")
+        failed += _timed("delete projects", _delete_all,
+                         [("remove_project", {"id": p["id"], "action": "delete"}) for p in projects])
+        failed += _timed("delete assets", _delete_all,
+                         [("delete_asset", {"id": a["id"]}) for a in assets])
+        failed += _timed("delete directories", _delete_all,
+                         [("directory", {"action": "delete", "id": d["id"], "recursive": True}) for d in directories])
+        deleted["projects"]    += len(projects)
+        deleted["assets"]      += len(assets)
+        deleted["directories"] += len(directories)
+    else:
+        projects, assets, directories = _timed("verify", _list_all)
+
+    remaining = len(projects) + len(assets) + len(directories)
+    phases    = ", ".join(f"{name} {secs:.1f}s" for name, secs in timings.items())
+    if any(deleted.values()):
+        console.print(f"  [dim]Cleanup: deleted {deleted['projects']} projects, {deleted['assets']} assets, "
+                      f"{deleted['directories']} directories in {sum(timings.values()):.1f}s ({phases})[/dim]")
     else:
-        console.print("  [dim]Cleanup: org already clean[/dim]")
+        console.print(f"  [dim]Cleanup: org already clean ({phases})[/dim]")
+    if failed:
+        console.print(f"  [yellow]Cleanup: {failed} delete call(s) returned errors[/yellow]")
+    if remaining:
+        console.print(f"  [yellow]Cleanup: org not empty after reset — {len(projects)} projects, "
+                      f"{len(assets)} assets, {len(directories)} directories remain[/yellow]")
+        return False
+    return True
 
 
 def run_model(model_id: str, levels: list[int], tool_trained: bool, token: str,
               refresh_token: str = "", force: bool = False, no_git: bool = False,
-              skip_load: bool = False) -> dict:
+              skip_load: bool = False, concurrency: int = 1,
+              instance_id: str | None = None,
+              on_last_level=None, cold: bool = True) -> dict:
     """
     Run all levels for one model.
 
     Skips levels that already have a result file unless force=True.
     Each level is wrapped in its own try/except so a crash in one level
-    doesn't abort the remaining levels or models.
+    doesn't abort the remaining levels or models. A model the caller already
+    loaded (instance_id, e.g. a co-load group) is used as is and left loaded.
+    on_last_level is called as the last pending level starts (--prefetch).
+    cold=False says instance_id was not freshly loaded for this call (prefetched,
+    or already used), so its first request is not recorded as a cold start.
     """
     # Check which levels still need running
     pending_levels = []
@@ -1505,29 +1980,41 @@ def run_model(model_id: str, levels: list[int], tool_trained: bool, token: str,
     reset_benchmark_env(mcp)
 
     # Load model with explicit context length so the full TOOLS list fits
-    instance_id = None
-    if skip_load:
+    owned = None   # instance loaded here, so unloaded here
+    if instance_id:
+        console.print(f"  [dim]Model already loaded — instance: {instance_id}[/dim]")
+    elif skip_load:
         console.print(f"  [dim]Skipping model load (--skip-load)[/dim]")
     else:
         console.print(f"  [dim]Loading model (ctx={MODEL_CONTEXT_LENGTH})...[/dim]")
-        instance_id = load_model(model_id)
-        if not instance_id:
+        owned = load_model(model_id)
+        if not owned:
             console.print(f"  [red]Model failed to load, skipping[/red]")
             return {}
 
+    warmup = warm_up(client, model_id, cold and not skip_load) if WARMUP else None
+    ready_s = None if skip_load else READY_S.get(model_id)
+
     model_results = {
         "model":        model_id,
         "tool_trained": tool_trained,
         "timestamp":    datetime.now().isoformat(),
         "levels":       {},
+        "warmup":       warmup,
     }
 
     context = {}  # Entity IDs carried across levels for placeholder substitution
 
     try:
         for level in pending_levels:
+            if on_last_level and level == pending_levels[-1]:
+                on_last_level()
             try:
-                level_result = run_level(client, mcp, model_id, level, context)
+                level_result = run_level(client, mcp, model_id, level, context, concurrency)
+                if warmup:
+                    level_result["warmup"] = warmup
+                if ready_s is not None:
+                    level_result["ready_s"] = ready_s
                 model_results["levels"][level] = level_result
 
                 s = level_result["summary"]
@@ -1544,12 +2031,262 @@ def run_model(model_id: str, levels: list[int], tool_trained: bool, token: str,
                 console.print(f"  [red]Level {level} crashed: {e}[/red]")
                 console.print(f"  [dim]Continuing to next level...[/dim]")
     finally:
-        if instance_id:
-            unload_model(instance_id)
+        if owned:
+            unload_model(owned)
+        mcp.close()
 
     return model_results
 
 
+def needs_run(model_id: str, levels: list[int], force: bool = False) -> bool:
+    """True if any of these levels has no result file yet for the model."""
+    return force or any(not result_exists(model_id, level) for level in levels)
+
+
+def load_group(model_ids: list[str]) -> dict[str, str]:
+    """
+    Load a co-load group's models at the same time, so their load times overlap.
+    Returns model_id -> instance_id for the models that loaded.
+    """
+    if not model_ids:
+        return {}
+    console.print(f"\n[dim]Co-loading {len(model_ids)} models: {', '.join(model_ids)}[/dim]")
+    with ThreadPoolExecutor(max_workers=len(model_ids)) as pool:
+        instances = dict(zip(model_ids, pool.map(partial(load_model, concurrent=True), model_ids)))
+    return {m: iid for m, iid in instances.items() if iid}
+
+
+def unload_group(instances: dict[str, str]):
+    """Unload every instance of a co-load group at once."""
+    if instances:
+        with ThreadPoolExecutor(max_workers=len(instances)) as pool:
+            list(pool.map(unload_model, instances.values()))
+
+
+def model_files() -> dict[str, list[Path]]:
+    """Weight files of every LM Studio model on this machine, for --prefetch."""
+    try:
+        resp = requests.get(f"{LMSTUDIO_MGMT_URL}/api/v1/models", timeout=10)
+        resp.raise_for_status()
+        return {m["key"]: weight_files(m) for m in resp.json().get("models", [])}
+    except Exception as e:
+        console.print(f"[yellow]Could not list model files: {e}[/yellow]")
+        return {}
+
+
+def start_prefetch(prefetcher: Prefetcher, model_ids: list[str], loaded_ids: list[str]):
+    """Get the next load group ready while the current one runs its last level."""
+    console.print(f"  [dim]Prefetching {', '.join(model_ids)}: {prefetcher.start(model_ids, loaded_ids)}[/dim]")
+
+
+# ─── Fleet mode ────────────────────────────────────────────────────────────────
+#
+# Several LM Studio hosts share one sweep: (model, level) work items go to
+# whichever host is free. All of a model's levels run on the host that took
+# its first one, in level order, so each model is loaded once.
+#
+# Tasks find entities by name (L0-09, L1-05, L2-06/07) and every model creates
+# the same names, so two models must never run in one Workunit org at once,
+# and a model's later levels build on what its earlier ones created (L2-03
+# looks for L1's workunits). Every host therefore needs its own org: at most
+# one host may use the run's --token, the others name an env var holding a
+# token for theirs ("@TOKEN_ENV"). Each host's org is reset before each model,
+# exactly as run_model() does.
+
+def parse_hosts(spec: str) -> list[tuple[str, float, str]]:
+    """
+    Parse "host:port[=vram_gb][@TOKEN_ENV],..." into [(host, vram_gb, token_env)].
+    A missing budget (0) means any model may be scheduled on that host.
+    TOKEN_ENV names an env var holding a Workunit token for that host's own
+    org; without one ("") the host uses the run's --token.
+    """
+    hosts = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        part, _, token_env = part.partition("@")
+        host, _, vram = part.partition("=")
+        hosts.append((host.strip(), float(vram) if vram else 0.0, token_env.strip()))
+    return hosts
+
+
+def model_sizes_gb(host: str | None = None) -> dict[str, float]:
+    """On-disk size of every LM Studio model in GiB, used as its VRAM footprint."""
+    try:
+        resp = requests.get(f"{_mgmt_url(host)}/api/v1/models", timeout=10)
+        resp.raise_for_status()
+        return {m["key"]: m.get("size_bytes", 0) / (1024 ** 3) for m in resp.json().get("models", [])}
+    except Exception as e:
+        console.print(f"[yellow]Could not read model sizes from {host}: {e}[/yellow]")
+        return {}
+
+
+class FleetScheduler:
+    """Hands out (model_id, level, tool_trained) work items to free hosts."""
+
+    def __init__(self, items: list[tuple[str, int, bool]], hosts: list[tuple[str, float, str]],
+                 sizes: dict[str, float]):
+        self.sizes   = sizes
+        self.budgets = {host: vram for host, vram, _ in hosts}
+        # Biggest models first, so the longest jobs don't straggle at the end
+        self.pending = sorted(items, key=lambda it: -sizes.get(it[0], 0.0))
+        self.active  = {}      # host -> model_id it is currently running
+        self.owner   = {}      # model_id -> host that runs all of its levels
+        self.failed  = set()   # models that failed to load
+        self.lock    = threading.Lock()
+        # Models larger than every budget still run (LM Studio offloads to RAM),
+        # but only on the host with the biggest budget.
+        self.largest = max(hosts, key=lambda h: h[1] or float("inf"))[0]
+
+    def fits(self, model_id: str, host: str) -> bool:
+        budget = self.budgets[host]
+        size   = self.sizes.get(model_id, 0.0)
+        if not budget or size <= budget:
+            return True
+        if any(not b or size <= b for b in self.budgets.values()):
+            return False
+        return host == self.largest
+
+    def next_item(self, host: str, loaded: str | None) -> tuple[str, int, bool] | None:
+        """Pick the next work item for a free host, or None when the queue is drained."""
+        with self.lock:
+            self.pending = [it for it in self.pending if it[0] not in self.failed]
+            for prefer in (
+                lambda it: it[0] == loaded,                                         # already loaded here
+                lambda it: self.owner.get(it[0]) == host,                           # started here earlier
+                lambda it: it[0] not in self.owner and self.fits(it[0], host),      # a model nobody runs
+            ):
+                # pending keeps each model's levels in order, so the first match is its next level
+                for it in self.pending:
+                    if prefer(it) and self.owner.get(it[0], host) == host:
+                        self.pending.remove(it)
+                        self.active[host] = it[0]
+                        self.owner[it[0]] = host
+                        return it
+            self.active.pop(host, None)
+            return None
+
+    def mark_failed(self, model_id: str):
+        with self.lock:
+            self.failed.add(model_id)
+
+
+def _fleet_worker(host: str, scheduler: FleetScheduler, token: str, refresh_token: str,
+                  no_git: bool, concurrency: int, git_lock: threading.Lock, summary: list):
+    """Drain work items on one LM Studio host, in its own Workunit org, until the scheduler runs dry."""
+    client = OpenAI(base_url=f"http://{host}/v1", api_key="lm-studio")
+    mcp    = MCPClient(token=token, refresh_token=refresh_token)
+    if MCP_FAKE_SERVER:
+        mcp.server = FakeWorkunitServer()   # a fake org of its own, like a real per-host token
+    if not mcp.initialize():
+        console.print(f"[red][{host}] Could not connect to MCP server, host idle[/red]")
+        return
+
+    unload_all_models(host)
+    loaded      = None
+    instance_id = None
+    org_model   = None   # model whose entities the host's org holds
+    context     = {}     # its entity IDs, carried across its levels as in run_model()
+    try:
+        while (item := scheduler.next_item(host, loaded)) is not None:
+            model_id, level, tool_trained = item
+            if loaded != model_id:
+                if instance_id:
+                    unload_model(instance_id, host)
+                    instance_id = None
+                console.print(f"[cyan][{host}][/cyan] loading {model_id}")
+                instance_id = load_model(model_id, host=host)
+                loaded      = model_id if instance_id else None
+                if not instance_id:
+                    console.print(f"[red][{host}] {model_id} failed to load, dropping its levels[/red]")
+                    scheduler.mark_failed(model_id)
+                    continue
+                warmup = warm_up(client, model_id) if WARMUP else None
+
+            try:
+                if org_model != model_id:
+                    reset_benchmark_env(mcp)
+                    org_model, context = model_id, {}
+                console.print(f"[cyan][{host}][/cyan] {model_id} L{level}")
+                level_result = run_level(client, mcp, model_id, level, context, concurrency,
+                                         show_status=False)
+            except Exception as e:
+                console.print(f"[red][{host}] {model_id} L{level} crashed: {e}[/red]")
+                continue
+            if warmup:
+                level_result["warmup"] = warmup
+            if READY_S.get(model_id) is not None:
+                level_result["ready_s"] = READY_S[model_id]
+            s = level_result["summary"]
+            console.print(f"[cyan][{host}][/cyan] → {model_id} L{level}: {s['passed']}/{s['total']} passed")
+            save_result(model_id, level, level_result, tool_trained)
+            summary.append((host, model_id, level))
+            if not no_git:
+                with git_lock:
+                    git_commit(model_id, level)
+    finally:
+        if instance_id:
+            unload_model(instance_id, host)
+        mcp.close()
+
+
+def run_fleet(model_list: list[tuple[str, bool]], levels: list[int],
+              hosts: list[tuple[str, float, str]], token: str, refresh_token: str = "",
+              force: bool = False, no_git: bool = False, concurrency: int = 1) -> list:
+    """
+    Run the sweep across several LM Studio hosts, one worker thread per host.
+
+    Every host runs in its own Workunit org (see the note above parse_hosts());
+    a host list that would put two hosts in one org is refused. Each L2 item
+    seeds its own fixtures. Results go to RESULTS_DIR exactly as in a
+    single-host run. Returns [(host, model_id, level)] for every completed item.
+    """
+    items = [
+        (model_id, level, tool_trained)
+        for model_id, tool_trained in model_list
+        for level in levels
+        if force or not result_exists(model_id, level)
+    ]
+    if not items:
+        console.print("[dim]All model+level combos already complete — nothing to run[/dim]")
+        return []
+
+    # (token, refresh token) per host; only the run's own token can be refreshed
+    creds = {}
+    for host, _, token_env in hosts:
+        if token_env and not os.environ.get(token_env):
+            console.print(f"[red]{host}: {token_env} is not set[/red]")
+            return []
+        creds[host] = (os.environ[token_env], "") if token_env else (token, refresh_token)
+    # --fake-mcp gives every host a fake org of its own, whatever the token
+    shared = [host for host, _, _ in hosts
+              if [t for t, _ in creds.values()].count(creds[host][0]) > 1]
+    if shared and not MCP_FAKE_SERVER:
+        console.print(f"[red]{', '.join(shared)} would share one Workunit org. Give every host but one "
+                      f"its own token, e.g. --hosts gpu1:1234,gpu2:1234@WU_TOKEN_GPU2[/red]")
+        return []
+
+    scheduler = FleetScheduler(items, hosts, model_sizes_gb(hosts[0][0]))
+    git_lock  = threading.Lock()
+    summary   = []
+    workers   = [
+        threading.Thread(
+            target=_fleet_worker, name=f"fleet-{host}",
+            args=(host, scheduler, *creds[host], no_git, concurrency, git_lock, summary),
+        )
+        for host, _, _ in hosts
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    if scheduler.failed:
+        console.print(f"[yellow]Models that failed to load: {', '.join(sorted(scheduler.failed))}[/yellow]")
+    return summary
+
+
 # ─── Persistence ──────────────────────────────────────────────────────────────
 
 def result_exists(model_id: str, level: int) -> bool:
@@ -1565,10 +2302,13 @@ def save_result(model_id: str, level: int, level_result: dict, tool_trained: boo
     ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
     out  = RESULTS_DIR / f"level{level}_{safe}_{ts}.json"
 
-    # Strip mcp_results from saved output — they're large and only needed at runtime
+    # Strip mcp_results from saved output — they're large and only needed at runtime.
+    # With --mcp-store the copies inside tool_calls become references into the side-car store.
     clean_results = []
     for r in level_result.get("results", []):
         clean = {k: v for k, v in r.items() if k != "mcp_results"}
+        if MCP_STORE:
+            clean["tool_calls"] = MCP_STORE.compact(r["tool_calls"])
         clean_results.append(clean)
 
     output = {
@@ -1577,6 +2317,7 @@ def save_result(model_id: str, level: int, level_result: dict, tool_trained: boo
         "tool_trained": tool_trained,
         "timestamp":   datetime.now().isoformat(),
         **{k: v for k, v in level_result.items() if k != "results"},
+        **({"mcp_store": os.path.relpath(MCP_STORE.root, out.parent)} if MCP_STORE else {}),
         "results":     clean_results,
     }
     with open(out, "w") as f:
@@ -1662,6 +2403,28 @@ def main():
         "--yes", "-y", action="store_true",
         help="Skip the destructive data warning prompt",
     )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record-mcp", metavar="PATH",
+        help="Record every MCP tool call and response to a cassette file (.gz to compress)",
+    )
+    cassette.add_argument(
+        "--replay-mcp", metavar="PATH",
+        help="Serve MCP tool calls from a recorded cassette instead of the server (no token needed)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream completions and record time-to-first-token, tokens/sec and token counts per turn",
+    )
+    parser.add_argument(
+        "--fake-mcp", action="store_true",
+        help="Run MCP tool calls against an in-process fake Workunit server (no network, no token)",
+    )
+    parser.add_argument(
+        "--mcp-store", metavar="DIR",
+        help="Keep MCP responses in a compressed, deduplicated side-car store and reference them "
+             "by hash from each tool call (default: responses are kept inline in tool_calls)",
+    )
     parser.add_argument(
         "--results-dir",
         help="Directory to write result files (default: results/v2_agentic/)",
@@ -1670,15 +2433,67 @@ def main():
         "--skip-load", action="store_true",
         help="Skip model load/unload (use when model is already loaded with custom settings)",
     )
+    parser.add_argument(
+        "--hosts",
+        default=os.environ.get("LMSTUDIO_HOSTS", ""),
+        help="Fleet mode: comma-separated LM Studio hosts with optional VRAM budget in GB and "
+             "an env var holding a token for the host's own Workunit org (required for all "
+             "hosts but one), e.g. gpu1:1234=24,gpu2:1234=16@WU_TOKEN_GPU2 (or set LMSTUDIO_HOSTS env var)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, metavar="N",
+        help="Run up to N independent L0/L1 tasks at once (match LM Studio's parallel slots; default: 1)",
+    )
+    parser.add_argument(
+        "--load-order", choices=["planned", "file"], default="planned",
+        help="planned: order models by recorded load cost and co-load small ones (default); "
+             "file: models.txt order, one model loaded at a time",
+    )
+    parser.add_argument(
+        "--vram-gb", type=float, default=float(os.environ.get("LMSTUDIO_VRAM_GB", "0")), metavar="GB",
+        help="VRAM budget for co-loading several small models at once (or set LMSTUDIO_VRAM_GB; "
+             "default: 0 = one model at a time)",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true",
+        help="Skip the warm-up requests after each model load (the first task then pays the cold start)",
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true",
+        help="During each model's last level, load the next model in the background if both fit in "
+             "--vram-gb, else read its weights into the page cache (LM Studio on this machine)",
+    )
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
 
     # Override globals from CLI flags
-    global RESULTS_DIR, MCP_URL, OAUTH_TOKEN_URL
+    global RESULTS_DIR, MCP_URL, OAUTH_TOKEN_URL, MCP_CASSETTE, MCP_FAKE_SERVER, STREAM_COMPLETIONS, MCP_STORE
+    global LOAD_HISTORY, WARMUP
+    LOAD_HISTORY = LoadHistory()
     if args.results_dir:
         RESULTS_DIR = Path(args.results_dir)
     if args.local:
         MCP_URL        = "http://localhost:9000/mcp"
         OAUTH_TOKEN_URL = "http://localhost:3000/oauth/token"
+    if args.record_mcp or args.replay_mcp:
+        MCP_CASSETTE = Cassette(args.record_mcp or args.replay_mcp,
+                                "record" if args.record_mcp else "replay")
+
+        def close_cassette():
+            MCP_CASSETTE.close()
+            console.print(f"[dim]MCP cassette: {MCP_CASSETTE.stats()}[/dim]")
+        atexit.register(close_cassette)
+        if args.replay_mcp:
+            args.token = args.token or "replay"
+    STREAM_COMPLETIONS = args.stream
+    WARMUP             = not args.no_warmup
+    if args.mcp_store:
+        MCP_STORE = McpStore(args.mcp_store)
+        atexit.register(lambda: console.print(f"[dim]MCP store: {MCP_STORE.stats()}[/dim]"))
+    if args.fake_mcp:
+        MCP_FAKE_SERVER = FakeWorkunitServer()
+        args.token = args.token or "fake"
 
     if args.list_models:
         models = list_models()
@@ -1715,6 +2530,7 @@ def main():
             console.print("[red]Could not connect to MCP server[/red]")
             sys.exit(1)
         reset_benchmark_env(mcp)
+        mcp.close()
         console.print("[green]Cleanup complete.[/green]")
         return
 
@@ -1743,6 +2559,16 @@ def main():
     else:
         parser.error("Provide --model, --models, or --list-models")
 
+    # Group and order the models by recorded load cost (fleet mode schedules its own loads)
+    planned = args.load_order == "planned" and not (args.hosts or args.skip_load) and len(model_list) > 1
+    if planned:
+        sizes     = model_sizes_gb()
+        load_plan = plan_loads(model_list, sizes, LOAD_HISTORY, _LMSTUDIO_HOST, args.vram_gb,
+                               MODEL_CONTEXT_LENGTH)
+    else:
+        load_plan = [[item] for item in model_list]
+    prefetch = args.prefetch and not (args.hosts or args.skip_load) and len(load_plan) > 1
+
     if args.dry_run:
         # Show which model+level combos would actually run vs skip
         pending = []
@@ -1763,6 +2589,33 @@ def main():
             lines.extend(done)
         lines.append(f"\nTask timeout: {TASK_TIMEOUT_S}s per task")
         lines.append(f"Tasks per level: L0=11, L1=10, L2=7")
+        if args.hosts:
+            fleet = ", ".join(f"{h}" + (f" ({v:g} GB)" if v else "") + (f" @{t}" if t else "")
+                              for h, v, t in parse_hosts(args.hosts))
+            lines.append(f"Fleet hosts: {fleet}")
+
+        if planned:
+            lines.append(f"\n[bold]Load plan[/bold] ({LOAD_HISTORY.known(_LMSTUDIO_HOST)} model(s) with "
+                         f"load history on {_LMSTUDIO_HOST}, VRAM budget: {f'{args.vram_gb:g} GB' if args.vram_gb else 'none'}):")
+            for n, group in enumerate(load_plan, 1):
+                gb   = sum(LOAD_HISTORY.size_gb(_LMSTUDIO_HOST, m) or sizes.get(m, 0.0) for m, _ in group)
+                cost = group_cost(group, sizes, LOAD_HISTORY, _LMSTUDIO_HOST)
+                lines.append(f"  {n}. {', '.join(m for m, _ in group)}  ({gb:.1f} GB weights, ~{cost:.0f}s load+unload)")
+
+        lines.append(f"\n[bold]Task graph[/bold] (concurrency={args.concurrency}):")
+        for lvl in levels:
+            tasks = load_tasks(lvl)
+            if lvl not in CONCURRENT_LEVELS:
+                lines.append(f"  L{lvl}: serial, file order (tasks share L2 fixtures)")
+                continue
+            graph = build_task_graph(tasks)
+            for w, wave in enumerate(task_waves(tasks, graph), 1):
+                entries = []
+                for i in wave:
+                    tid  = tasks[i]["id"]
+                    deps = graph[tid]
+                    entries.append(f"{tid} ← {', '.join(deps)}" if deps else tid)
+                lines.append(f"  L{lvl} wave {w}: " + " | ".join(entries))
 
         console.print(Panel("\n".join(lines), title="Dry Run Plan"))
         return
@@ -1772,13 +2625,30 @@ def main():
         f"Models: {len(model_list)}\n"
         f"Levels: {levels}\n"
         f"Task timeout: {TASK_TIMEOUT_S}s\n"
+        f"Concurrency: {args.concurrency}\n"
+        f"Load order: {'planned' if planned else 'file'}"
+        + (f" ({len(load_plan)} load group(s), VRAM budget {args.vram_gb:g} GB)\n" if planned and args.vram_gb else "\n") +
+        f"Prefetch: {'yes' if prefetch else 'no'}\n"
         f"Force re-run: {'yes' if args.force else 'no (skipping completed levels)'}\n"
         f"Results: {RESULTS_DIR}\n"
-        f"LM Studio: {LMSTUDIO_BASE_URL}\n"
+        f"LM Studio: {args.hosts or LMSTUDIO_BASE_URL}\n"
         f"MCP: {MCP_URL}",
         title="Starting Run"
     ))
 
+    if args.hosts:
+        hosts = parse_hosts(args.hosts)
+        start = time.time()
+        done  = run_fleet(model_list, levels, hosts, args.token, args.refresh_token,
+                          args.force, args.no_git, args.concurrency)
+        elapsed = time.time() - start
+        console.print(f"\n[bold green]Fleet run complete![/bold green] {len(done)} level(s) "
+                      f"on {len(hosts)} host(s) in {elapsed/60:.1f} minutes")
+        for host in dict.fromkeys(h for h, _, _ in hosts):
+            n = sum(1 for h, _, _ in done if h == host)
+            console.print(f"  [dim]{host}: {n} level(s)[/dim]")
+        return
+
     if not args.skip_load:
         unload_all_models()
     else:
@@ -1786,15 +2656,40 @@ def main():
 
     start = time.time()
     failed_models = []
-    for i, (model_id, tool_trained) in enumerate(model_list, 1):
-        console.print(f"\n[dim]── Model {i}/{len(model_list)} ──────────────────────────────[/dim]")
+    prefetcher = (Prefetcher(partial(load_model, concurrent=True), model_files(), model_sizes_gb(),
+                             args.vram_gb, MODEL_CONTEXT_LENGTH) if prefetch else None)
+    i = 0
+    for n, group in enumerate(load_plan):
+        # A group of several models is loaded together up front and unloaded together at the end;
+        # with --prefetch, some may already have been loaded while the previous group ran
+        instances  = prefetcher.take() if prefetcher else {}
+        prefetched = set(instances)   # loaded in the background, so not a cold start
+        pending    = [m for m, _ in group if needs_run(m, levels, args.force)]
+        if len(group) > 1:
+            instances.update(load_group([m for m in pending if m not in instances]))
+
+        on_last_level = None
+        if prefetcher and pending:
+            upcoming = next((ids for g in load_plan[n + 1:]
+                             if (ids := [m for m, _ in g if needs_run(m, levels, args.force)])), [])
+            if upcoming:
+                on_last_level = partial(start_prefetch, prefetcher, upcoming, pending)
         try:
-            run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
-                      args.force, args.no_git, args.skip_load)
-        except Exception as e:
-            console.print(f"[red]Model {model_id} crashed unexpectedly: {e}[/red]")
-            console.print("[dim]Continuing to next model...[/dim]")
-            failed_models.append(model_id)
+            for model_id, tool_trained in group:
+                i += 1
+                console.print(f"\n[dim]── Model {i}/{len(model_list)} ──────────────────────────────[/dim]")
+                # pending is empty when the whole group is already done (resumed run)
+                last = on_last_level if pending and model_id == pending[-1] else None
+                try:
+                    run_model(model_id, levels, tool_trained, args.token, args.refresh_token,
+                              args.force, args.no_git, args.skip_load, args.concurrency,
+                              instances.get(model_id), last, model_id not in prefetched)
+                except Exception as e:
+                    console.print(f"[red]Model {model_id} crashed unexpectedly: {e}[/red]")
+                    console.print("[dim]Continuing to next model...[/dim]")
+                    failed_models.append(model_id)
+        finally:
+            unload_group(instances)
 
     elapsed = time.time() - start
     console.print(f"\n[bold green]Run complete![/bold green] {elapsed/60:.1f} minutes total")